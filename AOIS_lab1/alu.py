@@ -0,0 +1,60 @@
+"""Арифметическое устройство над словами дополнительного кода произвольной ширины.
+
+Операнды хранятся как целые числа, обрезанные маской слова. Сумма,
+перенос из старшего разряда и переполнение вычисляются несколькими
+операциями над длинными целыми, без поразрядного цикла: перенос в
+каждый разряд равен ``a ^ b ^ (a + b)``, как в схеме с ускоренным
+переносом.
+"""
+from typing import NamedTuple
+
+from codec import word_mask, sign_bit, complement_value, word_to_str
+
+
+class AluResult(NamedTuple):
+    word: int
+    carry: int
+    overflow: bool
+
+
+class ALU:
+    """АЛУ для слов шириной от 1 до MAX_BITS разрядов"""
+
+    MAX_BITS = 4096
+
+    def __init__(self, bits=8):
+        if not 1 <= bits <= self.MAX_BITS:
+            raise ValueError(f"Number of bits must be in 1..{self.MAX_BITS}")
+        self.bits = bits
+        self.mask = word_mask(bits)
+        self.sign = sign_bit(bits)
+
+    def load(self, n):
+        """Слово дополнительного кода для целого числа"""
+        return n & self.mask
+
+    def value(self, word):
+        """Целое число по слову дополнительного кода"""
+        return complement_value(word, self.bits)
+
+    def to_str(self, word):
+        return word_to_str(word, self.bits)
+
+    def add(self, a, b, carry_in=0):
+        """Сложение слов a и b с входным переносом"""
+        total = a + b + carry_in
+        word = total & self.mask
+        # Переполнение: знаки слагаемых совпадают, а знак суммы отличается
+        overflow = bool(~(a ^ b) & (a ^ word) & self.sign)
+        return AluResult(word, total >> self.bits, overflow)
+
+    def sub(self, a, b):
+        """Вычитание как сложение с инверсией b и входным переносом 1"""
+        return self.add(a, ~b & self.mask, 1)
+
+    def negate(self, a):
+        return self.sub(0, a)
+
+    def carries(self, a, b, carry_in=0):
+        """Слово переносов: разряд i равен переносу в разряд i"""
+        return (a ^ b ^ (a + b + carry_in)) & self.mask
\ No newline at end of file
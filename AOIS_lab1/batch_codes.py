@@ -0,0 +1,99 @@
+"""Пакетное преобразование массивов чисел в прямой, обратный и дополнительный коды.
+
+Все функции принимают массив NumPy (или ``array('q')``) и ширину слова
+до 64 бит и работают над всем массивом сразу, без цикла по элементам.
+Слова кодов возвращаются массивом ``uint64``; побитовое представление
+строится функцией ``words_to_bits``.
+"""
+import numpy as np
+
+MAX_BATCH_BITS = 64
+
+
+def _check_bits(bits):
+    if not 1 <= bits <= MAX_BATCH_BITS:
+        raise ValueError(f"Number of bits must be in 1..{MAX_BATCH_BITS}")
+
+
+def _masks(bits):
+    mask = np.uint64((1 << bits) - 1)
+    return mask, np.uint64(1 << (bits - 1)), mask >> np.uint64(1)
+
+
+def _as_values(values):
+    return np.asarray(values, dtype=np.int64)
+
+
+def _as_words(words):
+    return np.asarray(words).astype(np.uint64, copy=False)
+
+
+def _sign_extend(words, bits):
+    # Арифметический сдвиг размножает знаковый разряд слова шириной bits
+    shift = np.uint64(MAX_BATCH_BITS - bits)
+    return (words << shift).view(np.int64) >> np.int64(MAX_BATCH_BITS - bits)
+
+
+def direct_code_batch(values, bits=8):
+    """Прямые коды массива чисел"""
+    _check_bits(bits)
+    values = _as_values(values)
+    _, sign, magnitude_mask = _masks(bits)
+    magnitude = np.abs(values).astype(np.uint64) & magnitude_mask
+    return np.where(values < 0, magnitude | sign, magnitude)
+
+
+def inverse_code_batch(values, bits=8):
+    """Обратные коды массива чисел"""
+    _check_bits(bits)
+    values = _as_values(values)
+    mask, _, magnitude_mask = _masks(bits)
+    magnitude = np.abs(values).astype(np.uint64) & magnitude_mask
+    return np.where(values < 0, mask ^ magnitude, magnitude)
+
+
+def complement_code_batch(values, bits=8):
+    """Дополнительные коды массива чисел"""
+    _check_bits(bits)
+    mask, _, _ = _masks(bits)
+    return _as_values(values).astype(np.uint64) & mask
+
+
+def binary_to_decimal_batch(words, bits=8):
+    """Декодирование массива слов прямого кода"""
+    _check_bits(bits)
+    words = _as_words(words)
+    _, sign, magnitude_mask = _masks(bits)
+    magnitude = (words & magnitude_mask).astype(np.int64)
+    return np.where(words & sign, -magnitude, magnitude)
+
+
+def inverse_to_decimal_batch(words, bits=8):
+    """Декодирование массива слов обратного кода"""
+    _check_bits(bits)
+    values = _sign_extend(_as_words(words), bits)
+    return np.where(values < 0, values + 1, values)
+
+
+def complement_to_decimal_batch(words, bits=8):
+    """Декодирование массива слов дополнительного кода"""
+    _check_bits(bits)
+    return _sign_extend(_as_words(words), bits)
+
+
+def words_to_bits(words, bits, packed=False):
+    """Матрица разрядов (старший разряд первым); packed=True упаковывает её по 8 бит в байт"""
+    _check_bits(bits)
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint64)
+    matrix = ((_as_words(words)[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    return np.packbits(matrix, axis=1) if packed else matrix
+
+
+def bits_to_words(matrix, bits, packed=False):
+    """Слова по матрице разрядов, обратное к words_to_bits"""
+    _check_bits(bits)
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    if packed:
+        matrix = np.unpackbits(matrix, axis=1, count=bits)
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint64)
+    return np.bitwise_or.reduce(matrix.astype(np.uint64) << shifts, axis=1)
\ No newline at end of file
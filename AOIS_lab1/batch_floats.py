@@ -0,0 +1,395 @@
+"""Пакетное кодирование, декодирование и арифметика чисел IEEE-754.
+
+Массив float32 переинтерпретируется как uint32 через ``view``, поля
+выделяются векторными сдвигами и масками. encode_batch и decode_batch
+работают с любым форматом до 64 бит (FloatFormat из ieee754), форматы до
+16 бит декодируются по заранее построенной таблице всех слов.
+Арифметические функции работают со словами binary32.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from batch_codes import MAX_BATCH_BITS, words_to_bits, bits_to_words
+from float_arithmetic import (
+    ROUND_NEAREST_EVEN, ROUND_TOWARD_POSITIVE, ROUND_TOWARD_NEGATIVE,
+    FLAG_INVALID, FLAG_DIVIDE_BY_ZERO, FLAG_OVERFLOW, FLAG_UNDERFLOW, FLAG_INEXACT,
+    DEFAULT_NAN, GRS_BITS,
+    _check_rounding
+)
+from ieee754 import (
+    BINARY32, BINARY64, BIAS, EXPONENT_MASK, MANTISSA_BITS, MANTISSA_MASK, SIGN_SHIFT, INF_BITS, QUIET_BIT
+)
+
+ONE = np.uint64(1)
+# Форматы не шире LOOKUP_BITS декодируются по таблице всех слов
+LOOKUP_BITS = 16
+
+
+def floats_to_bits_batch(values):
+    """Слова binary32 для массива чисел"""
+    with np.errstate(over='ignore'):
+        return np.ascontiguousarray(values, dtype=np.float32).view(np.uint32)
+
+
+def bits_to_floats_batch(words):
+    """Массив float32 по массиву слов"""
+    return np.ascontiguousarray(words, dtype=np.uint32).view(np.float32)
+
+
+def decompose_batch(words):
+    """Знаки, смещённые порядки и мантиссы массива слов"""
+    words = np.asarray(words, dtype=np.uint32)
+    return (words >> SIGN_SHIFT,
+            (words >> MANTISSA_BITS) & EXPONENT_MASK,
+            words & MANTISSA_MASK)
+
+
+def float_to_binary_batch(values, packed=False):
+    """Матрица разрядов binary32 (32 столбца, знак первым)"""
+    return words_to_bits(floats_to_bits_batch(values), 32, packed)
+
+
+def binary_to_float_batch(matrix, packed=False):
+    """Числа float32 по матрице разрядов"""
+    return bits_to_floats_batch(bits_to_words(matrix, 32, packed))
+
+
+def _bit_length(values):
+    """Длина в битах для массива uint64 (через float64, точно для 32-битных половин)"""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1]).astype(np.int64)
+
+
+def _shift(values, amount):
+    return values >> np.clip(amount, 0, 63).astype(np.uint64)
+
+
+def _word_dtype(fmt):
+    """Наименьший беззнаковый тип NumPy, вмещающий слово формата"""
+    if fmt.bits > MAX_BATCH_BITS:
+        raise ValueError(f"Batch formats are limited to {MAX_BATCH_BITS} bits")
+    return next(dtype for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+                if np.dtype(dtype).itemsize * 8 >= fmt.bits)
+
+
+def round_pack_batch(sign, sig, exp, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Векторный аналог round_pack: sig < 2**62, младший разряд может быть липким"""
+    dtype = _word_dtype(fmt)
+    mantissa_bits = fmt.mantissa_bits
+    sign = sign.astype(np.uint64)
+    lead = exp + _bit_length(sig) - 1
+    lsb = np.maximum(lead - mantissa_bits, fmt.min_lsb_exponent)
+    shift = lsb - exp
+    q = np.where(shift > 0, _shift(sig, shift), sig << np.clip(-shift, 0, 63).astype(np.uint64))
+    guard = (shift > 0) & ((_shift(sig, shift - 1) & ONE) != 0)
+    sticky = (shift > 1) & ((sig & ((ONE << np.clip(shift - 1, 0, 63).astype(np.uint64)) - ONE)) != 0)
+    inexact = guard | sticky
+
+    if rounding == ROUND_NEAREST_EVEN:
+        up = guard & (sticky | ((q & ONE) != 0))
+        to_inf = np.ones_like(inexact)
+    elif rounding == ROUND_TOWARD_POSITIVE:
+        up = inexact & (sign == 0)
+        to_inf = sign == 0
+    elif rounding == ROUND_TOWARD_NEGATIVE:
+        up = inexact & (sign == 1)
+        to_inf = sign == 1
+    else:
+        up = to_inf = np.zeros_like(inexact)
+    q = q + up.astype(np.uint64)
+    carry = (q >> np.uint64(mantissa_bits + 1)) != 0
+    q = np.where(carry, q >> ONE, q)
+    lsb = lsb + carry
+    exponent = np.where((q >> np.uint64(mantissa_bits)) != 0, lsb - fmt.min_lsb_exponent + 1, 0)
+    overflow = (exponent >= fmt.exponent_mask) & (sig != 0)
+
+    signed = sign << np.uint64(fmt.sign_shift)
+    bits = signed | (np.clip(exponent, 0, fmt.exponent_mask).astype(np.uint64) << np.uint64(mantissa_bits)) \
+        | (q & np.uint64(fmt.mantissa_mask))
+    bits = np.where(overflow, signed | np.where(to_inf, np.uint64(fmt.inf_bits), np.uint64(fmt.max_finite)), bits)
+    bits = np.where(sig == 0, signed, bits)
+    flags = (np.where(inexact | overflow, FLAG_INEXACT, 0)
+             | np.where(inexact & (lead < fmt.min_exponent), FLAG_UNDERFLOW, 0)
+             | np.where(overflow, FLAG_OVERFLOW, 0))
+    return bits.astype(dtype), np.where(sig == 0, 0, flags).astype(np.uint8)
+
+
+def encode_batch(values, fmt=BINARY32, rounding=ROUND_NEAREST_EVEN):
+    """Слова формата fmt для массива чисел с однократным округлением: (слова, флаги)"""
+    _check_rounding(rounding)
+    words = np.ascontiguousarray(values, dtype=np.float64).view(np.uint64)
+    sign, exponent, mantissa = _fields(words, BINARY64)
+    sig = mantissa | ((exponent != 0).astype(np.uint64) << np.uint64(BINARY64.mantissa_bits))
+    exp = np.maximum(exponent, 1).astype(np.int64) + BINARY64.min_lsb_exponent - 1
+    bits, flags = round_pack_batch(sign, sig, exp, rounding, fmt)
+
+    # Бесконечности и NaN (с сохранением старших разрядов нагрузки)
+    special = exponent == BINARY64.exponent_mask
+    shift = BINARY64.mantissa_bits - fmt.mantissa_bits
+    payload = mantissa >> np.uint64(shift) if shift >= 0 else mantissa << np.uint64(-shift)
+    nan = special & (mantissa != 0)
+    nan_bits = np.uint64(fmt.inf_bits | fmt.quiet_bit) | (payload & np.uint64(fmt.mantissa_mask))
+    special_bits = (sign << np.uint64(fmt.sign_shift)) | np.where(nan, nan_bits, np.uint64(fmt.inf_bits))
+    bits = np.where(special, special_bits.astype(bits.dtype), bits)
+    signaling = nan & ((mantissa & np.uint64(BINARY64.quiet_bit)) == 0)
+    flags = np.where(special, np.where(signaling, FLAG_INVALID, 0), flags).astype(np.uint8)
+    return bits, flags
+
+
+def _fields(words, fmt):
+    words = words.astype(np.uint64)
+    return (words >> np.uint64(fmt.sign_shift),
+            (words >> np.uint64(fmt.mantissa_bits)) & np.uint64(fmt.exponent_mask),
+            words & np.uint64(fmt.mantissa_mask))
+
+
+def _decode_fields(words, fmt):
+    sign, exponent, mantissa = _fields(words, fmt)
+    sig = mantissa | ((exponent != 0).astype(np.uint64) << np.uint64(fmt.mantissa_bits))
+    exp = np.maximum(exponent, 1).astype(np.int64) + fmt.min_lsb_exponent - 1
+    with np.errstate(over='ignore'):
+        values = np.ldexp(sig.astype(np.float64), exp)
+    special = exponent == fmt.exponent_mask
+    values = np.where(special, np.where(mantissa != 0, np.nan, np.inf), values)
+    return np.where(sign != 0, -values, values)
+
+
+@lru_cache(maxsize=8)
+def decode_table(fmt):
+    """Значения всех слов формата до LOOKUP_BITS бит; строится один раз на формат"""
+    if fmt.bits > LOOKUP_BITS:
+        raise ValueError(f"Lookup tables are limited to {LOOKUP_BITS}-bit formats")
+    table = _decode_fields(np.arange(1 << fmt.bits, dtype=np.uint64), fmt)
+    table.flags.writeable = False
+    return table
+
+
+def decode_batch(words, fmt=BINARY32):
+    """Массив float64 по словам формата fmt; короткие форматы декодируются по таблице"""
+    words = np.asarray(words)
+    if fmt.bits <= LOOKUP_BITS:
+        return decode_table(fmt)[words.astype(np.intp)]
+    return _decode_fields(words.astype(_word_dtype(fmt)), fmt)
+
+
+def _unpack_batch(words):
+    sign, exponent, mantissa = decompose_batch(words)
+    sig = mantissa.astype(np.uint64) | ((exponent != 0).astype(np.uint64) << np.uint64(MANTISSA_BITS))
+    return sign.astype(np.uint64), sig, np.maximum(exponent, 1).astype(np.int64) - BIAS - MANTISSA_BITS
+
+
+def _nan_mask(words):
+    return (words & np.uint32(~(1 << SIGN_SHIFT) & 0xFFFFFFFF)) > INF_BITS
+
+
+def _inf_mask(words):
+    return (words & np.uint32(~(1 << SIGN_SHIFT) & 0xFFFFFFFF)) == INF_BITS
+
+
+def _nan_result(bits, flags, *operands):
+    """Подстановка тихих NaN для элементов с NaN-операндами"""
+    any_nan = np.zeros(bits.shape, dtype=bool)
+    signaling = np.zeros(bits.shape, dtype=bool)
+    for words in reversed(operands):
+        nan = _nan_mask(words)
+        bits = np.where(nan, words | np.uint32(QUIET_BIT), bits)
+        any_nan |= nan
+        signaling |= nan & ((words & np.uint32(QUIET_BIT)) == 0)
+    flags = np.where(any_nan, 0, flags) | np.where(signaling, FLAG_INVALID, 0)
+    return bits, flags.astype(np.uint8)
+
+
+def add_bits_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементная сумма массивов слов binary32: (слова, флаги)"""
+    _check_rounding(rounding)
+    a = np.asarray(a, dtype=np.uint32)
+    b = np.asarray(b, dtype=np.uint32)
+    magnitude = np.uint32(~(1 << SIGN_SHIFT) & 0xFFFFFFFF)
+    swap = (a & magnitude) < (b & magnitude)
+    x, y = np.where(swap, b, a), np.where(swap, a, b)
+    sign_x, sig_x, exp_x = _unpack_batch(x)
+    sign_y, sig_y, exp_y = _unpack_batch(y)
+
+    shift = exp_x - exp_y
+    sig_y = sig_y << np.uint64(GRS_BITS)
+    sticky = (sig_y & ((ONE << np.clip(shift, 0, 63).astype(np.uint64)) - ONE)) != 0
+    sig_y = _shift(sig_y, shift) | sticky.astype(np.uint64)
+    sig_x = sig_x << np.uint64(GRS_BITS)
+    same = sign_x == sign_y
+    total = np.where(same, sig_x + sig_y, sig_x - sig_y)
+    zero_sign = np.where(same, sign_x & sign_y, np.uint64(rounding == ROUND_TOWARD_NEGATIVE))
+    bits, flags = round_pack_batch(np.where(total == 0, zero_sign, sign_x), total, exp_x - GRS_BITS, rounding)
+
+    inf_a, inf_b = _inf_mask(a), _inf_mask(b)
+    bits = np.where(inf_b, b, bits)
+    bits = np.where(inf_a, a, bits)
+    invalid = inf_a & inf_b & (a != b)
+    bits = np.where(invalid, np.uint32(DEFAULT_NAN), bits)
+    flags = np.where(inf_a | inf_b, 0, flags).astype(np.uint8) | np.where(invalid, FLAG_INVALID, 0).astype(np.uint8)
+    return _nan_result(bits, flags, a, b)
+
+
+def sub_bits_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементная разность массивов слов binary32"""
+    return add_bits_batch(a, np.asarray(b, dtype=np.uint32) ^ np.uint32(1 << SIGN_SHIFT), rounding)
+
+
+def _normalize_batch(sig, exp):
+    """Сдвиг мантисс субнормальных чисел до скрытой единицы"""
+    shift = np.clip(MANTISSA_BITS + 1 - _bit_length(sig), 0, MANTISSA_BITS + 1)
+    return sig << shift.astype(np.uint64), exp - shift
+
+
+def _special(bits, flags, mask, value, flag=0):
+    """Замена результата и флагов там, где mask истинна"""
+    return (np.where(mask, np.asarray(value).astype(np.uint32), bits),
+            np.where(mask, flag, flags).astype(np.uint8))
+
+
+def mul_bits_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное произведение массивов слов binary32"""
+    _check_rounding(rounding)
+    a = np.asarray(a, dtype=np.uint32)
+    b = np.asarray(b, dtype=np.uint32)
+    sign = ((a ^ b) >> np.uint32(SIGN_SHIFT)).astype(np.uint64)
+    _, sig_a, exp_a = _unpack_batch(a)
+    _, sig_b, exp_b = _unpack_batch(b)
+    bits, flags = round_pack_batch(sign, sig_a * sig_b, exp_a + exp_b, rounding)
+
+    inf = _inf_mask(a) | _inf_mask(b)
+    zero = (sig_a == 0) | (sig_b == 0)
+    bits, flags = _special(bits, flags, inf, (sign << np.uint64(SIGN_SHIFT)) | np.uint64(INF_BITS))
+    bits, flags = _special(bits, flags, inf & zero, DEFAULT_NAN, FLAG_INVALID)
+    return _nan_result(bits, flags, a, b)
+
+
+def div_bits_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное частное массивов слов binary32"""
+    _check_rounding(rounding)
+    a = np.asarray(a, dtype=np.uint32)
+    b = np.asarray(b, dtype=np.uint32)
+    sign = ((a ^ b) >> np.uint32(SIGN_SHIFT)).astype(np.uint64)
+    _, sig_a, exp_a = _unpack_batch(a)
+    _, sig_b, exp_b = _unpack_batch(b)
+    zero_a, zero_b = sig_a == 0, sig_b == 0
+    sig_a, exp_a = _normalize_batch(sig_a, exp_a)
+    sig_b, exp_b = _normalize_batch(np.where(zero_b, ONE, sig_b), exp_b)
+    # Нормализованные мантиссы дают частное из 26-27 разрядов
+    shift = MANTISSA_BITS + 3
+    q, r = np.divmod(sig_a << np.uint64(shift), sig_b)
+    bits, flags = round_pack_batch(sign, (q << ONE) | (r != 0), exp_a - exp_b - shift - 1, rounding)
+
+    signed_zero = sign << np.uint64(SIGN_SHIFT)
+    signed_inf = signed_zero | np.uint64(INF_BITS)
+    inf_a, inf_b = _inf_mask(a), _inf_mask(b)
+    bits, flags = _special(bits, flags, zero_a, signed_zero)
+    bits, flags = _special(bits, flags, zero_b, signed_inf, FLAG_DIVIDE_BY_ZERO)
+    bits, flags = _special(bits, flags, zero_a & zero_b, DEFAULT_NAN, FLAG_INVALID)
+    bits, flags = _special(bits, flags, inf_b, signed_zero)
+    bits, flags = _special(bits, flags, inf_a, signed_inf)
+    bits, flags = _special(bits, flags, inf_a & inf_b, DEFAULT_NAN, FLAG_INVALID)
+    return _nan_result(bits, flags, a, b)
+
+
+def sqrt_bits_batch(a, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементный квадратный корень массива слов binary32"""
+    _check_rounding(rounding)
+    a = np.asarray(a, dtype=np.uint32)
+    _, sig, exp = _unpack_batch(a)
+    zero = sig == 0
+    sig, exp = _normalize_batch(sig, exp)
+    odd = (exp & 1) != 0
+    sig = np.where(odd, sig << ONE, sig)
+    exp = exp - odd
+    # Подкоренное значение из 52-53 разрядов точно представимо в float64
+    shift = (MANTISSA_BITS + 5) // 2
+    radicand = sig << np.uint64(2 * shift)
+    root = np.floor(np.sqrt(radicand.astype(np.float64))).astype(np.uint64)
+    root = np.where(root * root > radicand, root - ONE, root)
+    root = np.where((root + ONE) * (root + ONE) <= radicand, root + ONE, root)
+    sticky = (root * root != radicand).astype(np.uint64)
+    bits, flags = round_pack_batch(np.zeros_like(sticky), (root << ONE) | sticky, (exp - 2 * shift) // 2 - 1, rounding)
+
+    negative = (a >> np.uint32(SIGN_SHIFT)) != 0
+    bits, flags = _special(bits, flags, negative, DEFAULT_NAN, FLAG_INVALID)
+    bits, flags = _special(bits, flags, zero | _inf_mask(a) & ~negative, a)
+    return _nan_result(bits, flags, a)
+
+
+def fma_bits_batch(a, b, c, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное a * b + c с одним округлением
+
+    Произведение двух float32 точно в float64, ошибка сложения находится
+    алгоритмом TwoSum. Сумма округляется к нечётному в float64 (53 > 2 * 24 + 1
+    разрядов), поэтому последующее округление до binary32 однократное.
+    """
+    _check_rounding(rounding)
+    a = np.asarray(a, dtype=np.uint32)
+    b = np.asarray(b, dtype=np.uint32)
+    c = np.asarray(c, dtype=np.uint32)
+    with np.errstate(all='ignore'):
+        product = a.view(np.float32).astype(np.float64) * b.view(np.float32).astype(np.float64)
+        addend = c.view(np.float32).astype(np.float64)
+        total = product + addend
+        virtual = total - product
+        error = (product - (total - virtual)) + (addend - virtual)
+    total_bits = total.view(np.uint64)
+    odd = (error != 0) & ((total_bits & ONE) == 0)
+    toward = (error > 0) == (total > 0)
+    total_bits = np.where(odd, np.where(toward, total_bits + ONE, total_bits - ONE), total_bits)
+
+    sign = total_bits >> np.uint64(63)
+    exponent = ((total_bits >> np.uint64(52)) & np.uint64(0x7FF)).astype(np.int64)
+    sig = (total_bits & np.uint64((1 << 52) - 1)) | ((exponent != 0).astype(np.uint64) << np.uint64(52))
+    product_sign = ((a ^ b) >> np.uint32(SIGN_SHIFT)).astype(np.uint64)
+    sign_c = (c >> np.uint32(SIGN_SHIFT)).astype(np.uint64)
+    zero_sign = np.where(product_sign == sign_c, sign_c, np.uint64(rounding == ROUND_TOWARD_NEGATIVE))
+    sign = np.where(sig == 0, zero_sign, sign)
+    bits, flags = round_pack_batch(sign, sig, np.maximum(exponent, 1) - 1023 - 52, rounding)
+
+    inf_c = _inf_mask(c)
+    product_inf = _inf_mask(a) | _inf_mask(b)
+    signed_inf = (product_sign << np.uint64(SIGN_SHIFT)) | np.uint64(INF_BITS)
+    bits, flags = _special(bits, flags, inf_c, c)
+    bits, flags = _special(bits, flags, product_inf, signed_inf)
+    bits, flags = _special(bits, flags, product_inf & inf_c & (product_sign != sign_c), DEFAULT_NAN, FLAG_INVALID)
+    bits, flags = _nan_result(bits, flags, a, b, c)
+    zero_factor = ((a & np.uint32(0x7FFFFFFF)) == 0) | ((b & np.uint32(0x7FFFFFFF)) == 0)
+    return _special(bits, flags, product_inf & zero_factor, DEFAULT_NAN, FLAG_INVALID)
+
+
+def _apply(operation, values, rounding):
+    bits, flags = operation(*(floats_to_bits_batch(v) for v in values), rounding=rounding)
+    return bits_to_floats_batch(bits), flags
+
+
+def add_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементная сумма массивов чисел: (массив float32, флаги)"""
+    return _apply(add_bits_batch, (a, b), rounding)
+
+
+def sub_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементная разность массивов чисел"""
+    return _apply(sub_bits_batch, (a, b), rounding)
+
+
+def mul_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное произведение массивов чисел"""
+    return _apply(mul_bits_batch, (a, b), rounding)
+
+
+def div_batch(a, b, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное частное массивов чисел"""
+    return _apply(div_bits_batch, (a, b), rounding)
+
+
+def fma_batch(a, b, c, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементное a * b + c с одним округлением"""
+    return _apply(fma_bits_batch, (a, b, c), rounding)
+
+
+def sqrt_batch(a, rounding=ROUND_NEAREST_EVEN):
+    """Поэлементный квадратный корень массива чисел"""
+    return _apply(sqrt_bits_batch, (a,), rounding)
\ No newline at end of file
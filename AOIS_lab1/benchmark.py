@@ -0,0 +1,314 @@
+"""Замеры производительности лабораторной работы 1.
+
+Запуск: python benchmark.py [--size N]
+"""
+import argparse
+import ast
+import inspect
+import os
+import random
+import textwrap
+import time
+
+import numpy as np
+
+import codec
+from batch_codes import complement_code_batch, complement_to_decimal_batch
+from batch_floats import (
+    float_to_binary_batch, add_batch,
+    sub_bits_batch, mul_bits_batch, div_bits_batch, fma_bits_batch, sqrt_bits_batch,
+    encode_batch, decode_batch, _decode_fields
+)
+from binary_operations import add_complement
+from complement_code import complement_code, complement_to_decimal
+from direct_code import decimal_to_binary, binary_to_decimal
+from division import DIVIDE_METHODS
+from float_arithmetic import sub_bits, mul_bits, div_bits, fma_bits, sqrt_bits, encode_float
+from float_operations import float_to_binary, add_float
+from ieee754 import FORMATS, bits_to_float
+from multiplication import MULTIPLY_METHODS
+from parallel_runner import BULK_OPERATIONS, run_bulk
+from step_trace import Trace
+
+
+def measure(func, *args, repeat=3):
+    """Лучшее время выполнения func(*args) из repeat запусков"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_codes(size, bits=32):
+    """Пакетное кодирование и декодирование против цикла скалярных вызовов"""
+    rng = np.random.default_rng(0)
+    values = rng.integers(-(2 ** (bits - 1)), 2 ** (bits - 1), size=size, dtype=np.int64)
+    scalar_values = values.tolist()
+
+    def scalar_loop():
+        for v in scalar_values:
+            complement_to_decimal(complement_code(v, bits))
+
+    def batch():
+        complement_to_decimal_batch(complement_code_batch(values, bits), bits)
+
+    scalar_time = measure(scalar_loop, repeat=1)
+    batch_time = measure(batch)
+    return [
+        ('codes/scalar', size, scalar_time),
+        ('codes/batch', size, batch_time),
+    ]
+
+
+def bench_code_tables(size, widths=(8, 16)):
+    """Скалярные коды с таблицами и без них (TABLE_MAX_BITS = 0)"""
+    rng = random.Random(0)
+    rows = []
+    for bits in widths:
+        values = [rng.randint(-(2 ** (bits - 1)) + 1, 2 ** (bits - 1) - 1) for _ in range(size)]
+
+        def round_trip():
+            for v in values:
+                complement_to_decimal(complement_code(v, bits))
+                binary_to_decimal(decimal_to_binary(v, bits))
+
+        codec.clear_tables()
+        rows.append((f'code_tables/build_{bits}', 1, measure(lambda: codec.word_strings(bits), repeat=1)))
+        rows.append((f'code_tables/table_{bits}', 2 * size, measure(round_trip)))
+        table_max_bits, codec.TABLE_MAX_BITS = codec.TABLE_MAX_BITS, 0
+        try:
+            rows.append((f'code_tables/format_{bits}', 2 * size, measure(round_trip)))
+        finally:
+            codec.TABLE_MAX_BITS = table_max_bits
+
+    # Чередование всех кодов и ширин: кэш таблиц не должен вытесняться на каждом вызове
+    decoders = (codec.direct_value, codec.inverse_value, codec.complement_value)
+    words = [(rng.getrandbits(bits), bits, decode) for _ in range(size // 6 or 1)
+             for bits in widths for decode in decoders]
+
+    def mixed():
+        for word, bits, decode in words:
+            codec.str_to_value(codec.word_to_str(word, bits), decode)
+
+    codec.clear_tables()
+    rows.append(('code_tables/mixed', len(words), measure(mixed)))
+    return rows
+
+
+def bench_multiply(widths=(8, 64, 256, 1024, 4096, 16384), count=10):
+    """Алгоритмы умножения на словах разной ширины"""
+    rng = random.Random(0)
+    rows = []
+    for width in widths:
+        pairs = [(rng.getrandbits(width), rng.getrandbits(width)) for _ in range(count)]
+        timings = {}
+        for method, multiply in MULTIPLY_METHODS.items():
+            def run():
+                for a, b in pairs:
+                    multiply(a, b, width)
+            timings[method] = measure(run)
+            rows.append((f'multiply/{method}/{width}', count, timings[method]))
+        print(f"width {width}: fastest is {min(timings, key=timings.get)}")
+    return rows
+
+
+def bench_float_encoding(size):
+    """Кодирование binary32: поштучно через struct и пакетно через view"""
+    values = np.random.default_rng(0).standard_normal(size)
+    scalar_values = values.tolist()
+
+    def scalar_loop():
+        for v in scalar_values:
+            float_to_binary(v)
+
+    return [
+        ('float_encode/scalar', size, measure(scalar_loop, repeat=1)),
+        ('float_encode/batch', size, measure(float_to_binary_batch, values)),
+    ]
+
+
+def bench_float_add(size):
+    """Сложение binary32: поштучно и пакетно"""
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal(size).astype(np.float32)
+    b = rng.standard_normal(size).astype(np.float32)
+    pairs = list(zip(a.tolist(), b.tolist()))
+
+    def scalar_loop():
+        for x, y in pairs:
+            add_float(x, y)
+
+    return [
+        ('float_add/scalar', size, measure(scalar_loop, repeat=1)),
+        ('float_add/batch', size, measure(add_batch, a, b)),
+    ]
+
+
+def bench_float_ops(size):
+    """Операции целочисленного ядра binary32 над словами: скалярно и пакетно"""
+    rng = np.random.default_rng(0)
+    words = [rng.standard_normal(size).astype(np.float32).view(np.uint32) for _ in range(3)]
+    scalar_words = [w.tolist() for w in words]
+    operations = [
+        ('sub', sub_bits, sub_bits_batch, 2),
+        ('mul', mul_bits, mul_bits_batch, 2),
+        ('div', div_bits, div_bits_batch, 2),
+        ('fma', fma_bits, fma_bits_batch, 3),
+        ('sqrt', sqrt_bits, sqrt_bits_batch, 1),
+    ]
+    rows = []
+    for name, scalar, batch, arity in operations:
+        def scalar_loop():
+            for args in zip(*scalar_words[:arity]):
+                scalar(*args)
+
+        rows.append((f'float_{name}/scalar', size, measure(scalar_loop, repeat=1)))
+        rows.append((f'float_{name}/batch', size, measure(batch, *words[:arity])))
+    return rows
+
+
+def bench_float_formats(size):
+    """Кодирование и декодирование в форматах binary16, bfloat16, binary32 и binary64"""
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(size)
+    scalar_values = values[:size // 10].tolist()
+    rows = []
+    for name, fmt in FORMATS.items():
+        words, _ = encode_batch(values, fmt)
+        scalar_words = words[:size // 10].tolist()
+        rows.append((f'{name}/encode_scalar', len(scalar_values),
+                     measure(lambda: [encode_float(v, fmt=fmt) for v in scalar_values], repeat=1)))
+        rows.append((f'{name}/decode_scalar', len(scalar_words),
+                     measure(lambda: [bits_to_float(w, fmt) for w in scalar_words], repeat=1)))
+        rows.append((f'{name}/encode_batch', size, measure(encode_batch, values, fmt)))
+        rows.append((f'{name}/decode_batch', size, measure(decode_batch, words, fmt)))
+        if fmt.bits <= 16:
+            # Декодирование полями, без таблицы, для сравнения
+            rows.append((f'{name}/decode_fields', size, measure(_decode_fields, words, fmt)))
+    return rows
+
+
+def bench_parallel(size, max_workers=None):
+    """Масштабирование run_bulk от 1 до max_workers процессов против последовательного цикла"""
+    rng = random.Random(0)
+    a = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+    b = [rng.randint(1, 10 ** 6) for _ in range(size)]
+    floats = ([x / 7 for x in a], [y / 3 for y in b])
+    rows = []
+    for operation, (func, typecode) in BULK_OPERATIONS.items():
+        x, y = floats if typecode == 'd' else (a, b)
+
+        def sequential():
+            for pair in zip(x, y):
+                func(*pair)
+
+        rows.append((f'{operation}/sequential', size, measure(sequential, repeat=1)))
+        for workers in range(1, (max_workers or os.cpu_count()) + 1):
+            rows.append((f'{operation}/workers={workers}', size,
+                         measure(lambda: run_bulk(operation, x, y, workers=workers), repeat=1)))
+    return rows
+
+
+# Допустимая цена trace=None относительно той же функции без журнала
+TRACE_OVERHEAD_LIMIT = 0.02
+
+
+class _StripTrace(ast.NodeTransformer):
+    # Убирает параметр trace и ветки if trace is not None
+    def visit_FunctionDef(self, node):
+        args = node.args
+        names = [arg.arg for arg in args.args]
+        if 'trace' in names:
+            index = names.index('trace')
+            first_default = len(args.args) - len(args.defaults)
+            if index >= first_default:
+                del args.defaults[index - first_default]
+            del args.args[index]
+        return self.generic_visit(node)
+
+    def visit_If(self, node):
+        test = node.test
+        if (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name) and test.left.id == 'trace'
+                and isinstance(test.ops[0], ast.IsNot)):
+            return node.orelse or None
+        return self.generic_visit(node)
+
+
+def without_trace(func):
+    """Копия func из её исходного текста без параметра trace и проверок журнала
+
+    Эталон для trace=None строится из текущего кода, поэтому не расходится
+    с ним, как расходились бы отдельные копии алгоритмов.
+    """
+    tree = _StripTrace().visit(ast.parse(textwrap.dedent(inspect.getsource(func))))
+    namespace = dict(func.__globals__)
+    exec(compile(ast.fix_missing_locations(tree), f'<{func.__name__} without trace>', 'exec'), namespace)
+    return namespace[func.__name__]
+
+
+def bench_trace(size, bits=32):
+    """Журнал шагов: функция без проверок trace, с trace=None и с записью в Trace
+
+    Строка off показывает цену trace=None относительно копии без журнала и
+    отмечается, если она больше TRACE_OVERHEAD_LIMIT; строка on - цену
+    записи относительно off.
+    """
+    rng = random.Random(0)
+    limit = 2 ** (bits - 2)
+    pairs = [(rng.randint(-limit, limit), rng.randint(1, limit)) for _ in range(size // 10)]
+    # Операнды как у add_complement, multiply_direct и divide_direct (precision=5)
+    sums = [(a, b, bits) for a, b in pairs]
+    products = [(abs(a), b, bits - 1) for a, b in pairs]
+    quotients = [(abs(a) << 5, b) for a, b in pairs]
+    operations = [('add_complement', add_complement, sums)]
+    operations += [(f'multiply_{method}', MULTIPLY_METHODS[method], products) for method in ('shift', 'booth')]
+    operations += [(f'divide_{method}', func, quotients) for method, func in sorted(DIVIDE_METHODS.items())]
+    rows = []
+    for name, func, operands in operations:
+        bare = without_trace(func)
+        bare_time = measure(lambda: [bare(*row) for row in operands], repeat=7)
+        disabled_time = measure(lambda: [func(*row) for row in operands], repeat=7)
+        trace = Trace()
+        enabled_time = measure(lambda: [func(*row, trace=trace) for row in operands], repeat=1)
+        disabled = disabled_time / bare_time - 1
+        enabled = enabled_time / disabled_time - 1
+        mark = f' > {TRACE_OVERHEAD_LIMIT:.0%}' if disabled > TRACE_OVERHEAD_LIMIT else ''
+        rows.append((f'trace/{name}/bare', len(operands), bare_time))
+        rows.append((f'trace/{name}/off {disabled:+.1%}{mark}', len(operands), disabled_time))
+        rows.append((f'trace/{name}/on {enabled:+.0%}', len(operands), enabled_time))
+    return rows
+
+
+def report(rows):
+    for name, size, seconds in rows:
+        rate = size / seconds if seconds else float('inf')
+        print(f"{name:<36} {size:>10} {seconds:>10.4f} s {rate:>14,.0f} ops/s")
+
+
+SECTIONS = {
+    'codes': bench_codes,
+    'code_tables': bench_code_tables,
+    'multiply': lambda size: bench_multiply(),
+    'float_encode': bench_float_encoding,
+    'float_add': bench_float_add,
+    'float_ops': bench_float_ops,
+    'float_formats': bench_float_formats,
+    'parallel': bench_parallel,
+    'trace': bench_trace,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--section', choices=sorted(SECTIONS), action='append',
+                        help="Раздел замеров (по умолчанию все)")
+    args = parser.parse_args()
+    for section in args.section or sorted(SECTIONS):
+        report(SECTIONS[section](args.size))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Целочисленный движок прямого, обратного и дополнительного кодов.
+
+Код хранится как машинное слово фиксированной ширины (int), все
+преобразования выполняются масками и сдвигами; строка формируется
+только на границе, в ``word_to_str``. Для ширины до TABLE_MAX_BITS строки
+слов берутся из таблиц, которые строятся при первом обращении и
+вытесняются из LRU-кэша, если ширина давно не используется. Строка
+декодируется без таблиц: int(s, 2) и маски дешевле, чем словарь строк на
+каждую пару (код, ширина).
+"""
+from functools import lru_cache
+
+# Наибольшая ширина слова, для которой строятся таблицы (2 ** 16 элементов)
+TABLE_MAX_BITS = 16
+# Число таблиц строк (по одной на ширину), одновременно хранящихся в кэше
+TABLE_CACHE_SIZE = 4
+
+
+def word_mask(bits):
+    """Маска из bits единиц"""
+    if bits < 1:
+        raise ValueError("Number of bits must be positive")
+    return (1 << bits) - 1
+
+
+def sign_bit(bits):
+    """Вес знакового разряда слова шириной bits"""
+    return 1 << (bits - 1)
+
+
+def direct_word(n, bits):
+    """Прямой код: знак в старшем разряде, модуль в остальных"""
+    magnitude = abs(n) & (sign_bit(bits) - 1)
+    return sign_bit(bits) | magnitude if n < 0 else magnitude
+
+
+def inverse_word(n, bits):
+    """Обратный код: для отрицательных чисел инвертируется модуль"""
+    mask = word_mask(bits)
+    # Модуль усекается, как в прямом коде, а знак сохраняется
+    magnitude = abs(n) & (mask >> 1)
+    return mask ^ magnitude if n < 0 else magnitude
+
+
+def complement_word(n, bits):
+    """Дополнительный код: число по модулю 2**bits"""
+    return n & word_mask(bits)
+
+
+def direct_value(word, bits):
+    """Декодирование прямого кода"""
+    magnitude = word & (sign_bit(bits) - 1)
+    return -magnitude if word & sign_bit(bits) else magnitude
+
+
+def inverse_value(word, bits):
+    """Декодирование обратного кода"""
+    if word & sign_bit(bits):
+        return -((~word) & word_mask(bits))
+    return word
+
+
+def complement_value(word, bits):
+    """Декодирование дополнительного кода"""
+    if word & sign_bit(bits):
+        return word - (1 << bits)
+    return word
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def word_strings(bits):
+    """Строки всех слов шириной bits, индекс - слово"""
+    return tuple(format(word, f'0{bits}b') for word in range(1 << bits))
+
+
+def clear_tables():
+    word_strings.cache_clear()
+
+
+def word_to_str(word, bits):
+    """Строковое представление слова шириной bits"""
+    if 1 <= bits <= TABLE_MAX_BITS:
+        return word_strings(bits)[word & ((1 << bits) - 1)]
+    return format(word & word_mask(bits), f'0{bits}b')
+
+
+def str_to_word(binary_str):
+    """Слово и его ширина по строке из нулей и единиц"""
+    return int(binary_str, 2), len(binary_str)
+
+
+def str_to_value(binary_str, decode):
+    """Значение кода по строке: decode(word, bits)"""
+    word, bits = str_to_word(binary_str)
+    return decode(word, bits)
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""Дифференциальная проверка и замеры функций лабораторной работы 1.
+
+Для каждой разрядности генерируются случайные операнды, результаты кодов
+и целочисленной арифметики сравниваются с целыми числами Python, а
+операции с плавающей точкой - с numpy.float16, numpy.float32 и
+numpy.float64 того же формата, а fma - с точной суммой Fraction, округлённой
+один раз. Время каждой функции замеряется отдельно
+от проверки и записывается в отчёт JSON, по которому можно отслеживать
+снижение производительности.
+
+Запуск: python differential.py [--count N] [--bits 8 16 32] [--output report.json]
+                               [--baseline old.json] [--tolerance 0.1]
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import struct
+import sys
+import time
+from fractions import Fraction
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+import binary_operations
+import complement_code
+import direct_code
+import float_operations
+import inverse_code
+from ieee754 import BINARY16, BINARY32, BINARY64
+
+DEFAULT_COUNT = 1_000_000
+DEFAULT_BITS = (8, 16, 32)
+CHUNK_SIZE = 100_000
+MAX_EXAMPLES = 5
+DEFAULT_TOLERANCE = 0.10
+# Форматы с плавающей точкой и соответствующие типы numpy по ширине слова
+FLOAT_FORMATS = {16: (BINARY16, np.float16), 32: (BINARY32, np.float32), 64: (BINARY64, np.float64)}
+STRUCT_WORDS = {16: 'H', 32: 'I', 64: 'Q'}
+
+
+class Check(NamedTuple):
+    """Проверяемая функция, генератор её операндов и эталон"""
+    name: str
+    kind: str  # 'int' - любая разрядность, 'float' - только ширины FLOAT_FORMATS
+    operands: Callable  # (rng, bits, count) -> список кортежей операндов
+    run: Callable  # (bits) -> функция операндов
+    expected: Callable  # (bits) -> эталонная функция операндов
+    same: Callable = lambda result, expected: result == expected
+
+
+class CheckResult(NamedTuple):
+    name: str
+    bits: int
+    count: int
+    seconds: float
+    mismatches: int
+    examples: list
+
+    @property
+    def rate(self):
+        return self.count / self.seconds if self.seconds else float('inf')
+
+    def to_dict(self):
+        return {'name': self.name, 'bits': self.bits, 'count': self.count, 'seconds': self.seconds,
+                'ops_per_second': self.rate, 'mismatches': self.mismatches, 'examples': self.examples}
+
+
+# Генераторы операндов
+
+def _magnitude_range(bits):
+    # Прямой и обратный коды представляют модули до 2 ** (bits - 1) - 1
+    limit = (1 << (bits - 1)) - 1
+    return -limit, limit
+
+
+def _complement_range(bits):
+    return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+
+def _integers(value_range, arity=1, nonzero_last=False):
+    def generate(rng, bits, count):
+        low, high = value_range(bits)
+        rows = []
+        for _ in range(count):
+            row = [rng.randint(low, high) for _ in range(arity)]
+            while nonzero_last and row[-1] == 0:
+                row[-1] = rng.randint(low, high)
+            rows.append(tuple(row))
+        return rows
+    return generate
+
+
+def _float_words(arity):
+    # Случайные слова формата покрывают все классы чисел, включая NaN и субнормальные
+    def generate(rng, bits, count):
+        code = '<' + STRUCT_WORDS[bits]
+        dtype = FLOAT_FORMATS[bits][1]
+        rows = []
+        for _ in range(count):
+            words = [rng.getrandbits(bits) for _ in range(arity)]
+            rows.append(tuple(float(np.frombuffer(struct.pack(code, w), dtype=dtype)[0]) for w in words))
+        return rows
+    return generate
+
+
+# Эталоны на целых числах Python
+
+def _direct_expected(n, bits):
+    return ('1' if n < 0 else '0') + format(abs(n), f'0{bits - 1}b')
+
+
+def _inverse_expected(n, bits):
+    if n >= 0:
+        return _direct_expected(n, bits)
+    return '1' + format(~abs(n) & ((1 << (bits - 1)) - 1), f'0{bits - 1}b')
+
+
+def _complement_expected(n, bits):
+    return format(n & ((1 << bits) - 1), f'0{bits}b')
+
+
+def _wrapped(total, bits):
+    low, high = _complement_range(bits)
+    value = (total - low) % (1 << bits) + low
+    return _complement_expected(total, bits), value, not low <= total <= high
+
+
+def _divide_expected(a, b, bits, precision=5):
+    q = (abs(a) << precision) // abs(b)
+    binary = bin(q >> precision)[2:] + '.' + format(q & ((1 << precision) - 1), f'0{precision}b')
+    return ('1' if (a < 0) != (b < 0) else '0') + binary, Fraction(a, b)
+
+
+# Эталоны numpy для чисел с плавающей точкой
+
+def _float_oracle(operation):
+    def expected(bits):
+        dtype = FLOAT_FORMATS[bits][1]
+
+        def run(*operands):
+            with np.errstate(all='ignore'):
+                result = operation(*(dtype(x) for x in operands))
+            return _float_word(result, bits)
+        return run
+    return expected
+
+
+def _float_word(value, bits):
+    dtype = FLOAT_FORMATS[bits][1]
+    return format(int(np.asarray(value, dtype=dtype).view(f'u{bits // 8}')), f'0{bits}b')
+
+
+def _round_fraction(x, fmt):
+    # Округление к ближайшему чётному: шаг сетки формата на порядке x, но не мельче субнормального
+    magnitude = abs(x)
+    lead = magnitude.numerator.bit_length() - magnitude.denominator.bit_length()
+    if Fraction(2) ** lead > magnitude:
+        lead -= 1
+    quantum = Fraction(2) ** max(lead - fmt.mantissa_bits, fmt.min_lsb_exponent)
+    value = round(magnitude / quantum) * quantum
+    result = math.inf if value >= Fraction(2) ** (fmt.bias + 1) else float(value)
+    return -result if x < 0 else result
+
+
+def _fma_expected(bits):
+    fmt, dtype = FLOAT_FORMATS[bits]
+
+    def run(a, b, c):
+        if not (math.isfinite(a) and math.isfinite(b) and math.isfinite(c)):
+            if math.isfinite(a) and math.isfinite(b) and not math.isnan(c):
+                # Конечное произведение не меняет бесконечное c, даже если переполнится в numpy
+                result = c
+            else:
+                with np.errstate(all='ignore'):
+                    result = dtype(a) * dtype(b) + dtype(c)
+            return _float_word(result, bits)
+        exact = Fraction(a) * Fraction(b) + Fraction(c)
+        if exact == 0:
+            # -0 только при сумме двух отрицательных нулей, иначе +0
+            negative = (a == 0 or b == 0) and c == 0 and \
+                math.copysign(1, a) * math.copysign(1, b) < 0 and math.copysign(1, c) < 0
+            return _float_word(-0.0 if negative else 0.0, bits)
+        return _float_word(_round_fraction(exact, fmt), bits)
+    return run
+
+
+def _float_function(name):
+    def run(bits):
+        fmt = FLOAT_FORMATS[bits][0]
+        func = getattr(float_operations, name)
+        return lambda *operands: func(*operands, fmt=fmt)[0]
+    return run
+
+
+def _same_float(result, expected):
+    # NaN сравниваются по классу: полезную нагрузку numpy не сохраняет
+    if result == expected:
+        return True
+    bits = len(expected)
+    fmt = FLOAT_FORMATS[bits][0]
+    nan = lambda word: (int(word, 2) & ~(1 << fmt.sign_shift)) > fmt.inf_bits
+    return nan(result) and nan(expected)
+
+
+def _round_trip(encode, decode):
+    return lambda bits: lambda n: decode(encode(n, bits))
+
+
+CHECKS = [
+    Check('direct_code', 'int', _integers(_magnitude_range),
+          lambda bits: lambda n: direct_code.direct_code(n, bits),
+          lambda bits: lambda n: _direct_expected(n, bits)),
+    Check('binary_to_decimal', 'int', _integers(_magnitude_range),
+          _round_trip(direct_code.decimal_to_binary, direct_code.binary_to_decimal),
+          lambda bits: lambda n: n),
+    Check('inverse_code', 'int', _integers(_magnitude_range),
+          lambda bits: lambda n: inverse_code.inverse_code(n, bits),
+          lambda bits: lambda n: _inverse_expected(n, bits)),
+    Check('inverse_to_decimal', 'int', _integers(_magnitude_range),
+          _round_trip(inverse_code.inverse_code, inverse_code.inverse_to_decimal),
+          lambda bits: lambda n: n),
+    Check('complement_code', 'int', _integers(_complement_range),
+          lambda bits: lambda n: complement_code.complement_code(n, bits),
+          lambda bits: lambda n: _complement_expected(n, bits)),
+    Check('complement_to_decimal', 'int', _integers(_complement_range),
+          _round_trip(complement_code.complement_code, complement_code.complement_to_decimal),
+          lambda bits: lambda n: n),
+    Check('add_complement', 'int', _integers(_complement_range, 2),
+          lambda bits: lambda a, b: binary_operations.add_complement(a, b, bits),
+          lambda bits: lambda a, b: _wrapped(a + b, bits)),
+    Check('subtract_complement', 'int', _integers(_complement_range, 2),
+          lambda bits: lambda a, b: binary_operations.subtract_complement(a, b, bits),
+          lambda bits: lambda a, b: _wrapped(a - b, bits)),
+] + [
+    Check(f'multiply_direct:{method}', 'int', _integers(_magnitude_range, 2),
+          lambda bits, method=method: lambda a, b: binary_operations.multiply_direct(a, b, bits, method),
+          lambda bits: lambda a, b: (_direct_expected(a * b, 2 * bits), a * b))
+    for method in ('shift', 'booth', 'karatsuba')
+] + [
+    Check(f'divide_direct:{method}', 'int', _integers(_magnitude_range, 2, nonzero_last=True),
+          lambda bits, method=method: lambda a, b: binary_operations.divide_direct(a, b, bits, method=method),
+          lambda bits: lambda a, b: _divide_expected(a, b, bits))
+    for method in ('restoring', 'nonrestoring', 'srt')
+] + [
+    Check(name, 'float', _float_words(arity), _float_function(name), _float_oracle(operation), _same_float)
+    for name, arity, operation in (
+        ('add_float', 2, lambda a, b: a + b),
+        ('subtract_float', 2, lambda a, b: a - b),
+        ('multiply_float', 2, lambda a, b: a * b),
+        ('divide_float', 2, lambda a, b: a / b),
+        ('sqrt_float', 1, np.sqrt),
+    )
+]
+CHECKS.append(Check('fma_float', 'float', _float_words(3), _float_function('fma_float'), _fma_expected, _same_float))
+CHECKS_BY_NAME = {check.name: check for check in CHECKS}
+
+
+def applicable(check, bits):
+    """Проверяется ли функция на данной разрядности"""
+    if check.kind == 'float':
+        return bits in FLOAT_FORMATS
+    return bits >= 2
+
+
+def run_check(check, bits, count, seed=0, chunk_size=CHUNK_SIZE):
+    """Прогон count случайных операндов: время функции и расхождения с эталоном"""
+    rng = random.Random(f'{seed}:{check.name}:{bits}')
+    func, expected = check.run(bits), check.expected(bits)
+    seconds = 0.0
+    mismatches = 0
+    examples = []
+    for start in range(0, count, chunk_size):
+        rows = check.operands(rng, bits, min(chunk_size, count - start))
+        begin = time.perf_counter()
+        results = [func(*row) for row in rows]
+        seconds += time.perf_counter() - begin
+        for row, result in zip(rows, results):
+            reference = expected(*row)
+            if not check.same(result, reference):
+                mismatches += 1
+                if len(examples) < MAX_EXAMPLES:
+                    examples.append({'operands': repr(row), 'result': repr(result), 'expected': repr(reference)})
+    return CheckResult(check.name, bits, count, seconds, mismatches, examples)
+
+
+def run_all(bits_list=DEFAULT_BITS, count=DEFAULT_COUNT, seed=0, names=None, log=None):
+    """Отчёт по всем проверкам и разрядностям в виде словаря для JSON"""
+    results = []
+    for check in CHECKS:
+        if names and check.name not in names:
+            continue
+        for bits in bits_list:
+            if applicable(check, bits):
+                result = run_check(check, bits, count, seed)
+                results.append(result.to_dict())
+                if log:
+                    print(f"{result.name:<28} {bits:>3} {result.rate:>14,.0f} ops/s "
+                          f"{result.mismatches:>8} расхождений", file=log)
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'seed': seed,
+        'count': count,
+        'results': results,
+    }
+
+
+def compare_reports(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """Замедления относительно baseline больше чем на долю tolerance: (имя, разрядность, было, стало)"""
+    previous = {(r['name'], r['bits']): r['ops_per_second'] for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        key = (r['name'], r['bits'])
+        if key in previous and r['ops_per_second'] < previous[key] * (1 - tolerance):
+            regressions.append((r['name'], r['bits'], previous[key], r['ops_per_second']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Дифференциальная проверка и замеры лабораторной работы 1")
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help="Операндов на функцию и разрядность")
+    parser.add_argument('--bits', type=int, nargs='+', default=list(DEFAULT_BITS))
+    parser.add_argument('--check', choices=sorted(CHECKS_BY_NAME), action='append',
+                        help="Проверяемая функция (по умолчанию все)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Файл отчёта JSON (по умолчанию stdout)")
+    parser.add_argument('--baseline', help="Отчёт предыдущего прогона для сравнения скорости")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    report = run_all(args.bits, args.count, args.seed, args.check, log=sys.stderr)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as out:
+            out.write(text + '\n')
+    else:
+        print(text)
+
+    failed = sum(r['mismatches'] for r in report['results'])
+    if failed:
+        print(f"Расхождений с эталоном: {failed}", file=sys.stderr)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare_reports(json.load(f), report, args.tolerance)
+        for name, bits, before, after in regressions:
+            print(f"Замедление {name} ({bits} бит): {before:,.0f} -> {after:,.0f} ops/s", file=sys.stderr)
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Точное целочисленное деление модулей чисел для divide_direct.
+
+Дробная часть частного получается делением делимого, сдвинутого на
+precision разрядов, поэтому разряды частного и остаток вычисляются без
+чисел с плавающей точкой при любой точности. Функции деления принимают
+неотрицательные n и d > 0 и необязательный список trace для шагов.
+"""
+from fractions import Fraction
+from typing import NamedTuple
+
+# Число старших разрядов делителя, по которым SRT выбирает цифру частного
+SRT_ESTIMATE_BITS = 6
+
+
+class DivisionResult(NamedTuple):
+    quotient: int  # Частное, умноженное на 2 ** precision
+    remainder: int
+    precision: int
+    divisor: int
+
+    @property
+    def fraction(self):
+        """Значение полученных разрядов частного"""
+        return Fraction(self.quotient, 1 << self.precision)
+
+    @property
+    def exact(self):
+        """Точное частное с учётом остатка"""
+        return Fraction(self.quotient * self.divisor + self.remainder, self.divisor << self.precision)
+
+    def to_binary(self):
+        int_bin = bin(self.quotient >> self.precision)[2:]
+        if not self.precision:
+            return int_bin
+        frac_bin = format(self.quotient & ((1 << self.precision) - 1), f'0{self.precision}b')
+        return int_bin + '.' + frac_bin
+
+
+def _trace_steps(n, d, q, trace, restoring):
+    """Шаги поразрядного деления, восстановленные по готовому частному
+
+    После шага i частичный остаток равен (n >> k) - d * (q >> k), где k -
+    число ещё не внесённых разрядов делимого; без восстановления остаток
+    после нулевой цифры на d меньше. Цикл деления поэтому не проверяет
+    trace на каждом шаге.
+    """
+    length = len(bin(n)) - 2
+    for step in range(length):
+        shift = length - 1 - step
+        prefix = q >> shift
+        r = (n >> shift) - d * prefix
+        if not restoring and not prefix & 1:
+            r -= d
+        trace.append((step, prefix & 1, r))
+
+
+def restoring_divide(n, d, trace=None):
+    """Деление с восстановлением остатка: по одному разряду частного за шаг"""
+    q = 0
+    r = 0
+    for bit in bin(n)[2:]:
+        r = (r << 1) | (bit == '1')
+        q <<= 1
+        if r >= d:
+            r -= d
+            q |= 1
+    if trace is not None:
+        _trace_steps(n, d, q, trace, restoring=True)
+    return q, r
+
+
+def nonrestoring_divide(n, d, trace=None):
+    """Деление без восстановления остатка: знак остатка выбирает сложение или вычитание"""
+    q = 0
+    r = 0
+    for bit in bin(n)[2:]:
+        if r >= 0:
+            r = (r << 1) + (bit == '1') - d
+        else:
+            r = (r << 1) + (bit == '1') + d
+        q = (q << 1) | (r >= 0)
+    if trace is not None:
+        _trace_steps(n, d, q, trace, restoring=False)
+    if r < 0:
+        r += d
+    return q, r
+
+
+def _trace_srt_steps(n, divisor, shift, divisor_estimate, steps, trace):
+    """Шаги SRT-деления: выбор цифр повторяется после деления
+
+    Цифры -2..2 избыточны и по готовому частному не восстанавливаются,
+    поэтому шаги проходятся ещё раз, но только при включённом журнале.
+    """
+    r = n
+    for step in range(steps):
+        r <<= 2
+        digit = max(-2, min(2, (2 * (r >> shift) + divisor_estimate) // (2 * divisor_estimate)))
+        r -= digit * divisor
+        trace.append((step, digit, r))
+
+
+def srt_radix4_divide(n, d, trace=None):
+    """SRT-деление по основанию 4 с цифрами частного -2..2"""
+    # Делитель сдвигается так, чтобы |r| <= 2d/3 выполнялось с первого шага
+    steps = max(0, (n.bit_length() - d.bit_length()) // 2 + 2)
+    divisor = d << (2 * steps)
+    shift = max(0, divisor.bit_length() - SRT_ESTIMATE_BITS)
+    divisor_estimate = divisor >> shift
+    q = 0
+    r = n
+    for _ in range(steps):
+        r <<= 2
+        # Цифра выбирается по старшим разрядам остатка и делителя
+        r_estimate = r >> shift
+        digit = max(-2, min(2, (2 * r_estimate + divisor_estimate) // (2 * divisor_estimate)))
+        r -= digit * divisor
+        q = (q << 2) + digit
+    if trace is not None:
+        _trace_srt_steps(n, divisor, shift, divisor_estimate, steps, trace)
+    r >>= 2 * steps
+    if r < 0:
+        q -= 1
+        r += d
+    return q, r
+
+
+DIVIDE_METHODS = {
+    'restoring': restoring_divide,
+    'nonrestoring': nonrestoring_divide,
+    'srt': srt_radix4_divide,
+}
+
+
+def divide_magnitudes(n, d, precision, method='restoring', trace=None):
+    """Частное n / d с precision двоичными разрядами дробной части"""
+    if method not in DIVIDE_METHODS:
+        raise ValueError(f"Unknown division method: {method}")
+    if d == 0:
+        raise ZeroDivisionError("Division by zero")
+    q, r = DIVIDE_METHODS[method](n << precision, d, trace)
+    return DivisionResult(q, r, precision, d)
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""Целочисленная арифметика IEEE-754.
+
+Мантиссы хранятся целыми числами со скрытой единицей; при выравнивании
+порядков к ним добавляются защитный (guard), округляющий (round) и
+липкий (sticky) разряды. Результат округляется один раз в выбранном
+режиме, флаги исключительных ситуаций возвращаются вместе со словом.
+Умножение, деление, FMA и корень строят точное целочисленное значение
+(или частное с липким разрядом остатка) и округляют его той же
+функцией round_pack. Формат слов задаётся параметром fmt (FloatFormat
+из ieee754), по умолчанию binary32.
+"""
+import math
+from typing import NamedTuple
+
+from ieee754 import BINARY32, BINARY64, decompose, float_to_bits
+
+ROUND_NEAREST_EVEN = 'nearest_even'
+ROUND_TOWARD_ZERO = 'toward_zero'
+ROUND_TOWARD_POSITIVE = 'toward_positive'
+ROUND_TOWARD_NEGATIVE = 'toward_negative'
+ROUNDING_MODES = (ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_TOWARD_POSITIVE, ROUND_TOWARD_NEGATIVE)
+
+# Флаги исключений IEEE-754, объединяются побитовым ИЛИ
+FLAG_INVALID = 1
+FLAG_DIVIDE_BY_ZERO = 2
+FLAG_OVERFLOW = 4
+FLAG_UNDERFLOW = 8
+FLAG_INEXACT = 16
+FLAG_NAMES = {
+    FLAG_INVALID: 'invalid',
+    FLAG_DIVIDE_BY_ZERO: 'divide_by_zero',
+    FLAG_OVERFLOW: 'overflow',
+    FLAG_UNDERFLOW: 'underflow',
+    FLAG_INEXACT: 'inexact',
+}
+
+DEFAULT_NAN = BINARY32.default_nan
+MAX_FINITE = BINARY32.max_finite
+# Порядок младшего разряда субнормальных чисел и наименьший порядок нормальных
+MIN_EXPONENT = BINARY32.min_exponent
+MIN_LSB_EXPONENT = BINARY32.min_lsb_exponent
+# Дополнительные разряды при выравнивании: guard, round, sticky
+GRS_BITS = 3
+
+
+class FloatResult(NamedTuple):
+    bits: int
+    flags: int
+
+
+def flag_names(flags):
+    """Имена установленных флагов"""
+    return [name for flag, name in FLAG_NAMES.items() if flags & flag]
+
+
+def _check_rounding(rounding):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+
+
+def _unpack(bits, fmt):
+    """Знак, целочисленная мантисса и порядок её младшего разряда"""
+    sign, exponent, mantissa = decompose(bits, fmt)
+    if exponent == 0:
+        return sign, mantissa, fmt.min_lsb_exponent
+    return sign, mantissa | (1 << fmt.mantissa_bits), exponent - fmt.bias - fmt.mantissa_bits
+
+
+def _is_nan(bits, fmt):
+    return (bits & ~(1 << fmt.sign_shift)) > fmt.inf_bits
+
+
+def _is_inf(bits, fmt):
+    return (bits & ~(1 << fmt.sign_shift)) == fmt.inf_bits
+
+
+def _propagate_nan(operands, fmt):
+    """Тихий NaN из первого NaN-операнда; сигнальный NaN взводит invalid"""
+    flags = FLAG_INVALID if any(_is_nan(x, fmt) and not x & fmt.quiet_bit for x in operands) else 0
+    for x in operands:
+        if _is_nan(x, fmt):
+            return FloatResult(x | fmt.quiet_bit, flags)
+
+
+def _round_up(sign, lsb, guard, sticky, rounding):
+    if rounding == ROUND_NEAREST_EVEN:
+        return guard and (sticky or lsb)
+    if rounding == ROUND_TOWARD_POSITIVE:
+        return not sign and (guard or sticky)
+    if rounding == ROUND_TOWARD_NEGATIVE:
+        return sign and (guard or sticky)
+    return False
+
+
+def _overflow_bits(sign, rounding, fmt):
+    to_inf = (rounding == ROUND_NEAREST_EVEN
+              or rounding == ROUND_TOWARD_POSITIVE and not sign
+              or rounding == ROUND_TOWARD_NEGATIVE and sign)
+    return (sign << fmt.sign_shift) | (fmt.inf_bits if to_inf else fmt.max_finite)
+
+
+def round_pack(sign, sig, exp, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Округление точного значения (-1)**sign * sig * 2**exp до формата fmt
+
+    Младший разряд sig может быть липким: ненулевой остаток, отброшенный
+    раньше, должен быть отражён в нём.
+    """
+    mantissa_bits = fmt.mantissa_bits
+    if sig == 0:
+        return FloatResult(sign << fmt.sign_shift, 0)
+    lead = exp + sig.bit_length() - 1
+    lsb = max(lead - mantissa_bits, fmt.min_lsb_exponent)
+    shift = lsb - exp
+    if shift > 0:
+        q = sig >> shift
+        guard = (sig >> (shift - 1)) & 1
+        sticky = sig & ((1 << (shift - 1)) - 1) != 0
+    else:
+        q = sig << -shift
+        guard = sticky = 0
+    flags = FLAG_INEXACT if guard or sticky else 0
+    if lead < fmt.min_exponent and flags:
+        flags |= FLAG_UNDERFLOW
+    if _round_up(sign, q & 1, guard, sticky, rounding):
+        q += 1
+        if q >> (mantissa_bits + 1):
+            q >>= 1
+            lsb += 1
+    exponent = lsb - fmt.min_lsb_exponent + 1 if q >> mantissa_bits else 0
+    if exponent >= fmt.exponent_mask:
+        return FloatResult(_overflow_bits(sign, rounding, fmt), FLAG_OVERFLOW | FLAG_INEXACT)
+    return FloatResult((sign << fmt.sign_shift) | (exponent << mantissa_bits) | (q & fmt.mantissa_mask), flags)
+
+
+def _align(sig, shift):
+    """Сдвиг вправо со сбором выдвинутых разрядов в липкий разряд"""
+    if shift == 0:
+        return sig
+    if shift > sig.bit_length():
+        return 1 if sig else 0
+    return (sig >> shift) | (sig & ((1 << shift) - 1) != 0)
+
+
+def add_bits(a, b, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Сумма двух слов"""
+    _check_rounding(rounding)
+    if _is_nan(a, fmt) or _is_nan(b, fmt):
+        return _propagate_nan((a, b), fmt)
+    sign_a, sign_b = a >> fmt.sign_shift, b >> fmt.sign_shift
+    if _is_inf(a, fmt) or _is_inf(b, fmt):
+        if _is_inf(a, fmt) and _is_inf(b, fmt) and sign_a != sign_b:
+            return FloatResult(fmt.default_nan, FLAG_INVALID)
+        return FloatResult(a if _is_inf(a, fmt) else b, 0)
+
+    sign_a, sig_a, exp_a = _unpack(a, fmt)
+    sign_b, sig_b, exp_b = _unpack(b, fmt)
+    # Первым идёт операнд с большим модулем
+    if (a & ~(1 << fmt.sign_shift)) < (b & ~(1 << fmt.sign_shift)):
+        sign_a, sig_a, exp_a, sign_b, sig_b, exp_b = sign_b, sig_b, exp_b, sign_a, sig_a, exp_a
+    sig_a <<= GRS_BITS
+    sig_b = _align(sig_b << GRS_BITS, exp_a - exp_b)
+    total = sig_a + sig_b if sign_a == sign_b else sig_a - sig_b
+    if total == 0:
+        # Точный ноль: -0 только при округлении к минус бесконечности или для -0 + -0
+        zero_sign = sign_a & sign_b if sign_a == sign_b else int(rounding == ROUND_TOWARD_NEGATIVE)
+        return FloatResult(zero_sign << fmt.sign_shift, 0)
+    return round_pack(sign_a, total, exp_a - GRS_BITS, rounding, fmt)
+
+
+def sub_bits(a, b, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Разность двух слов"""
+    return add_bits(a, b ^ (1 << fmt.sign_shift), rounding, fmt)
+
+
+def _is_zero(bits, fmt):
+    return (bits & ~(1 << fmt.sign_shift)) == 0
+
+
+def _signed(sign, bits, fmt):
+    return FloatResult((sign << fmt.sign_shift) | bits, 0)
+
+
+def mul_bits(a, b, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Произведение двух слов"""
+    _check_rounding(rounding)
+    if _is_nan(a, fmt) or _is_nan(b, fmt):
+        return _propagate_nan((a, b), fmt)
+    sign = (a ^ b) >> fmt.sign_shift
+    if _is_inf(a, fmt) or _is_inf(b, fmt):
+        if _is_zero(a, fmt) or _is_zero(b, fmt):
+            return FloatResult(fmt.default_nan, FLAG_INVALID)
+        return _signed(sign, fmt.inf_bits, fmt)
+    _, sig_a, exp_a = _unpack(a, fmt)
+    _, sig_b, exp_b = _unpack(b, fmt)
+    return round_pack(sign, sig_a * sig_b, exp_a + exp_b, rounding, fmt)
+
+
+def div_bits(a, b, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Частное двух слов"""
+    _check_rounding(rounding)
+    if _is_nan(a, fmt) or _is_nan(b, fmt):
+        return _propagate_nan((a, b), fmt)
+    sign = (a ^ b) >> fmt.sign_shift
+    if _is_inf(a, fmt):
+        return FloatResult(fmt.default_nan, FLAG_INVALID) if _is_inf(b, fmt) else _signed(sign, fmt.inf_bits, fmt)
+    if _is_inf(b, fmt):
+        return _signed(sign, 0, fmt)
+    if _is_zero(b, fmt):
+        if _is_zero(a, fmt):
+            return FloatResult(fmt.default_nan, FLAG_INVALID)
+        return FloatResult((sign << fmt.sign_shift) | fmt.inf_bits, FLAG_DIVIDE_BY_ZERO)
+    if _is_zero(a, fmt):
+        return _signed(sign, 0, fmt)
+    _, sig_a, exp_a = _unpack(a, fmt)
+    _, sig_b, exp_b = _unpack(b, fmt)
+    # Частное получает не меньше fmt.mantissa_bits + 3 разрядов, остаток уходит в липкий разряд
+    shift = max(0, fmt.mantissa_bits + 3 + sig_b.bit_length() - sig_a.bit_length())
+    q, r = divmod(sig_a << shift, sig_b)
+    return round_pack(sign, (q << 1) | (r != 0), exp_a - exp_b - shift - 1, rounding, fmt)
+
+
+def fma_bits(a, b, c, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """a * b + c с одним округлением"""
+    _check_rounding(rounding)
+    product_inf = _is_inf(a, fmt) or _is_inf(b, fmt)
+    if product_inf and (_is_zero(a, fmt) or _is_zero(b, fmt)):
+        return FloatResult(fmt.default_nan, FLAG_INVALID)
+    if _is_nan(a, fmt) or _is_nan(b, fmt) or _is_nan(c, fmt):
+        return _propagate_nan((a, b, c), fmt)
+    product_sign = (a ^ b) >> fmt.sign_shift
+    sign_c = c >> fmt.sign_shift
+    if product_inf:
+        if _is_inf(c, fmt) and sign_c != product_sign:
+            return FloatResult(fmt.default_nan, FLAG_INVALID)
+        return _signed(product_sign, fmt.inf_bits, fmt)
+    if _is_inf(c, fmt):
+        return FloatResult(c, 0)
+
+    _, sig_a, exp_a = _unpack(a, fmt)
+    _, sig_b, exp_b = _unpack(b, fmt)
+    _, sig_c, exp_c = _unpack(c, fmt)
+    sig_p, exp_p = sig_a * sig_b, exp_a + exp_b
+    # Точная сумма на общем (меньшем) порядке
+    exp = min(exp_p, exp_c)
+    total = (sig_p << (exp_p - exp)) * (-1 if product_sign else 1) + (sig_c << (exp_c - exp)) * (-1 if sign_c else 1)
+    if total == 0:
+        if product_sign == sign_c:
+            return _signed(product_sign, 0, fmt)
+        return _signed(int(rounding == ROUND_TOWARD_NEGATIVE), 0, fmt)
+    return round_pack(int(total < 0), abs(total), exp, rounding, fmt)
+
+
+def sqrt_bits(a, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Квадратный корень слова"""
+    _check_rounding(rounding)
+    if _is_nan(a, fmt):
+        return _propagate_nan((a,), fmt)
+    if _is_zero(a, fmt):
+        return FloatResult(a, 0)
+    if a >> fmt.sign_shift:
+        return FloatResult(fmt.default_nan, FLAG_INVALID)
+    if _is_inf(a, fmt):
+        return FloatResult(a, 0)
+    _, sig, exp = _unpack(a, fmt)
+    # Порядок делается чётным, а подкоренное значение - не короче 2 * (fmt.mantissa_bits + 3) разрядов
+    if exp & 1:
+        sig <<= 1
+        exp -= 1
+    shift = max(0, (2 * (fmt.mantissa_bits + 3) - sig.bit_length() + 1) // 2)
+    radicand = sig << (2 * shift)
+    root = math.isqrt(radicand)
+    sticky = root * root != radicand
+    return round_pack(0, (root << 1) | sticky, (exp - 2 * shift) // 2 - 1, rounding, fmt)
+
+
+def encode_float(value, rounding=ROUND_NEAREST_EVEN, fmt=BINARY32):
+    """Слово формата fmt для числа с однократным округлением"""
+    _check_rounding(rounding)
+    value = float(value)
+    sign = int(math.copysign(1.0, value) < 0)
+    if math.isnan(value):
+        # Старшие разряды нагрузки NaN сохраняются, сигнальный NaN взводит invalid
+        mantissa = float_to_bits(value, BINARY64) & BINARY64.mantissa_mask
+        shift = BINARY64.mantissa_bits - fmt.mantissa_bits
+        payload = mantissa >> shift if shift >= 0 else mantissa << -shift
+        flags = 0 if mantissa & BINARY64.quiet_bit else FLAG_INVALID
+        return FloatResult((sign << fmt.sign_shift) | fmt.inf_bits | fmt.quiet_bit | (payload & fmt.mantissa_mask), flags)
+    if math.isinf(value):
+        return _signed(sign, fmt.inf_bits, fmt)
+    numerator, denominator = abs(value).as_integer_ratio()
+    return round_pack(sign, numerator, 1 - denominator.bit_length(), rounding, fmt)
\ No newline at end of file
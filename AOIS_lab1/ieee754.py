@@ -0,0 +1,145 @@
+"""Побитовое представление чисел IEEE-754.
+
+Формат задаётся дескриптором FloatFormat (ширина порядка и мантиссы);
+по умолчанию все функции работают с binary32. Число переводится в слово
+через struct (для binary16, binary32 и binary64), а знак, порядок и
+мантисса выделяются сдвигами и масками, без построения строки по одному
+символу.
+"""
+import math
+import struct
+from typing import NamedTuple
+
+
+class FloatFormat(NamedTuple):
+    """Формат с плавающей точкой и производные от него маски и порядки"""
+    name: str
+    exponent_bits: int
+    mantissa_bits: int
+    bits: int
+    bias: int
+    exponent_mask: int
+    mantissa_mask: int
+    sign_shift: int
+    inf_bits: int
+    quiet_bit: int
+    default_nan: int
+    max_finite: int
+    min_exponent: int  # Порядок наименьшего нормального числа
+    min_lsb_exponent: int  # Порядок младшего разряда субнормальных чисел
+
+
+def float_format(exponent_bits, mantissa_bits, name=None):
+    """Дескриптор формата с exponent_bits разрядами порядка и mantissa_bits разрядами мантиссы"""
+    if exponent_bits < 2 or mantissa_bits < 1:
+        raise ValueError("Format needs at least 2 exponent bits and 1 mantissa bit")
+    bias = (1 << (exponent_bits - 1)) - 1
+    exponent_mask = (1 << exponent_bits) - 1
+    inf_bits = exponent_mask << mantissa_bits
+    quiet_bit = 1 << (mantissa_bits - 1)
+    return FloatFormat(
+        name=name or f'e{exponent_bits}m{mantissa_bits}',
+        exponent_bits=exponent_bits,
+        mantissa_bits=mantissa_bits,
+        bits=1 + exponent_bits + mantissa_bits,
+        bias=bias,
+        exponent_mask=exponent_mask,
+        mantissa_mask=(1 << mantissa_bits) - 1,
+        sign_shift=exponent_bits + mantissa_bits,
+        inf_bits=inf_bits,
+        quiet_bit=quiet_bit,
+        default_nan=inf_bits | quiet_bit,
+        max_finite=inf_bits - 1,
+        min_exponent=1 - bias,
+        min_lsb_exponent=1 - bias - mantissa_bits,
+    )
+
+
+BINARY16 = float_format(5, 10, 'binary16')
+BFLOAT16 = float_format(8, 7, 'bfloat16')
+BINARY32 = float_format(8, 23, 'binary32')
+BINARY64 = float_format(11, 52, 'binary64')
+FORMATS = {fmt.name: fmt for fmt in (BINARY16, BFLOAT16, BINARY32, BINARY64)}
+# Форматы, которые struct умеет упаковывать сам
+STRUCT_CODES = {BINARY16: 'e', BINARY32: 'f', BINARY64: 'd'}
+
+EXPONENT_BITS = BINARY32.exponent_bits
+MANTISSA_BITS = BINARY32.mantissa_bits
+BIAS = BINARY32.bias
+EXPONENT_MASK = BINARY32.exponent_mask
+MANTISSA_MASK = BINARY32.mantissa_mask
+SIGN_SHIFT = BINARY32.sign_shift
+INF_BITS = BINARY32.inf_bits
+QUIET_BIT = BINARY32.quiet_bit
+
+
+def _struct_code(fmt):
+    if fmt not in STRUCT_CODES:
+        raise ValueError(f"No struct encoding for {fmt.name}, use float_arithmetic.encode_float")
+    return STRUCT_CODES[fmt]
+
+
+def float_to_bits(f, fmt=BINARY32):
+    """Слово формата fmt для числа (с округлением к ближайшему)"""
+    code = _struct_code(fmt)
+    try:
+        return int.from_bytes(struct.pack('>' + code, f), 'big')
+    except OverflowError:
+        # Число вне диапазона формата округляется до бесконечности
+        return (1 << fmt.sign_shift if f < 0 else 0) | fmt.inf_bits
+
+
+def bits_to_float(bits, fmt=BINARY32):
+    """Число по слову формата fmt"""
+    bits &= (1 << fmt.bits) - 1
+    if fmt in STRUCT_CODES:
+        return struct.unpack('>' + STRUCT_CODES[fmt], bits.to_bytes(fmt.bits // 8, 'big'))[0]
+    sign = -1.0 if bits >> fmt.sign_shift else 1.0
+    kind = classify(bits, fmt)
+    if kind == 'nan':
+        return math.copysign(math.nan, sign)
+    if kind == 'inf':
+        return sign * math.inf
+    sig, exp = significand(bits, fmt)
+    try:
+        return sign * math.ldexp(sig, exp)
+    except OverflowError:
+        return sign * math.inf
+
+
+def decompose(bits, fmt=BINARY32):
+    """Знак, смещённый порядок и мантисса слова"""
+    return bits >> fmt.sign_shift, (bits >> fmt.mantissa_bits) & fmt.exponent_mask, bits & fmt.mantissa_mask
+
+
+def compose(sign, exponent, mantissa, fmt=BINARY32):
+    """Слово из знака, смещённого порядка и мантиссы"""
+    return ((sign << fmt.sign_shift) | ((exponent & fmt.exponent_mask) << fmt.mantissa_bits)
+            | (mantissa & fmt.mantissa_mask))
+
+
+def classify(bits, fmt=BINARY32):
+    """Класс числа: zero, subnormal, normal, inf или nan"""
+    _, exponent, mantissa = decompose(bits, fmt)
+    if exponent == 0:
+        return 'subnormal' if mantissa else 'zero'
+    if exponent == fmt.exponent_mask:
+        return 'nan' if mantissa else 'inf'
+    return 'normal'
+
+
+def nan_payload(bits, fmt=BINARY32):
+    """Полезная нагрузка NaN (мантисса без бита тишины)"""
+    return bits & (fmt.mantissa_mask & ~fmt.quiet_bit)
+
+
+def is_quiet_nan(bits, fmt=BINARY32):
+    return classify(bits, fmt) == 'nan' and bool(bits & fmt.quiet_bit)
+
+
+def significand(bits, fmt=BINARY32):
+    """Целочисленная мантисса со скрытой единицей и несмещённый порядок её младшего разряда"""
+    _, exponent, mantissa = decompose(bits, fmt)
+    if exponent == 0:
+        return mantissa, fmt.min_lsb_exponent
+    return mantissa | (1 << fmt.mantissa_bits), exponent - fmt.bias - fmt.mantissa_bits
\ No newline at end of file
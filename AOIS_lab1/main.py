@@ -1,99 +1,120 @@
-from direct_code import decimal_to_binary, binary_to_decimal
-from inverse_code import inverse_code, inverse_to_decimal
-from complement_code import complement_code, complement_to_decimal
-from binary_operations import add_complement, subtract_complement, multiply_direct, divide_direct
-from float_operations import float_to_binary, binary_to_float, add_float
+import argparse
+import sys
+from contextlib import nullcontext
+
+import binary_operations
+import complement_code
+import direct_code
+import float_operations
+import inverse_code
+from float_arithmetic import ROUNDING_MODES, ROUND_NEAREST_EVEN
+from ieee754 import FORMATS, BINARY32
+from stream_pipeline import OPERATIONS, OUTPUT_FORMATS, run_pipeline
+
+def read_int_operands():
+    a = int(input("Введите первое число: "))
+    b = int(input("Введите второе число: "))
+    bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
+    return a, b, bits
 
 def handle_conversion():
     num = int(input("Введите целое число: "))
     bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
-    print("\nПрямой код:", decimal_to_binary(num, bits))
-    print("Обратный код:", inverse_code(num, bits))
-    print("Дополнительный код:", complement_code(num, bits))
-
-def handle_addition():
-    a = int(input("Введите первое число: "))
-    b = int(input("Введите второе число: "))
-    bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
-    binary, decimal = add_complement(a, b, bits)
-    print(f"\n{a} в дополнительном коде: {complement_code(a, bits)}")
-    print(f"{b} в дополнительном коде: {complement_code(b, bits)}")
+    print("\nПрямой код:", direct_code.decimal_to_binary(num, bits))
+    print("Обратный код:", inverse_code.inverse_code(num, bits))
+    print("Дополнительный код:", complement_code.complement_code(num, bits))
+
+def handle_complement(operation, result_name):
+    a, b, bits = read_int_operands()
+    binary, decimal, overflow = operation(a, b, bits)
+    print(f"\n{a} в дополнительном коде: {complement_code.complement_code(a, bits)}")
+    print(f"{b} в дополнительном коде: {complement_code.complement_code(b, bits)}")
+    print(f"{result_name} в двоичном виде:", binary)
+    print(f"{result_name} в десятичном виде:", decimal)
+    if overflow:
+        print("Предупреждение: произошло переполнение!")
+
+def handle_direct(operation, result_name):
+    a, b, bits = read_int_operands()
+    try:
+        binary, decimal = operation(a, b, bits)
+    except ZeroDivisionError as e:
+        print(f"\nОшибка: {e}")
+        return
+    print(f"\n{a} в прямом коде: {direct_code.decimal_to_binary(a, bits)}")
+    print(f"{b} в прямом коде: {direct_code.decimal_to_binary(b, bits)}")
+    print(f"{result_name} в двоичном виде:", binary)
+    print(f"{result_name} в десятичном виде:", float(decimal) if operation is binary_operations.divide_direct else decimal)
+
+def handle_float_addition():
+    a = float(input("Введите первое число с плавающей точкой: "))
+    b = float(input("Введите второе число с плавающей точкой: "))
+    binary, decimal = float_operations.add_float(a, b)
+    print(f"\n{a} в IEEE-754: {float_operations.float_to_binary(a)}")
+    print(f"{b} в IEEE-754: {float_operations.float_to_binary(b)}")
     print("Сумма в двоичном виде:", binary)
     print("Сумма в десятичном виде:", decimal)
 
-# Аналогично для других операций...
-
-def main():
+# Пункты меню: (название, обработчик)
+MENU = {
+    '1': ("Преобразовать число в прямой, обратный и дополнительный коды", handle_conversion),
+    '2': ("Сложить два числа в дополнительном коде",
+          lambda: handle_complement(binary_operations.add_complement, "Сумма")),
+    '3': ("Вычесть два числа в дополнительном коде",
+          lambda: handle_complement(binary_operations.subtract_complement, "Разность")),
+    '4': ("Умножить два числа в прямом коде",
+          lambda: handle_direct(binary_operations.multiply_direct, "Произведение")),
+    '5': ("Разделить два числа в прямом коде",
+          lambda: handle_direct(binary_operations.divide_direct, "Частное")),
+    '6': ("Сложить два числа с плавающей точкой (IEEE-754)", handle_float_addition),
+}
+EXIT_CHOICE = '7'
+
+def menu():
     while True:
         print("\nМеню:")
-        print("1. Преобразовать число в прямой, обратный и дополнительный коды")
-        print("2. Сложить два числа в дополнительном коде")
-        print("3. Вычесть два числа в дополнительном коде")
-        print("4. Умножить два числа в прямом коде")
-        print("5. Разделить два числа в прямом коде")
-        print("6. Сложить два числа с плавающей точкой (IEEE-754)")
-        print("7. Выход")
+        for choice, (title, _) in MENU.items():
+            print(f"{choice}. {title}")
+        print(f"{EXIT_CHOICE}. Выход")
 
         choice = input("Выберите пункт меню: ")
 
-        if choice == '1':
-            handle_conversion()
-        elif choice == '2':
-            handle_addition()
-
-        elif choice == '3':
-            a = int(input("Введите первое число: "))
-            b = int(input("Введите второе число: "))
-            bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
-
-            binary, decimal = subtract_complement(a, b, bits)
-            print(f"\n{a} в дополнительном коде: {complement_code(a, bits)}")
-            print(f"{b} в дополнительном коде: {complement_code(b, bits)}")
-            print("Разность в двоичном виде:", binary)
-            print("Разность в десятичном виде:", decimal)
-
-        elif choice == '4':
-            a = int(input("Введите первое число: "))
-            b = int(input("Введите второе число: "))
-            bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
-
-            binary, decimal = multiply_direct(a, b, bits)
-            print(f"\n{a} в прямом коде: {decimal_to_binary(a, bits)}")
-            print(f"{b} в прямом коде: {decimal_to_binary(b, bits)}")
-            print("Произведение в двоичном виде:", binary)
-            print("Произведение в десятичном виде:", decimal)
-
-        elif choice == '5':
-            a = int(input("Введите первое число: "))
-            b = int(input("Введите второе число: "))
-            bits = int(input("Введите количество бит (по умолчанию 8): ") or "8")
-
-            try:
-                binary, decimal = divide_direct(a, b, bits)
-                print(f"\n{a} в прямом коде: {decimal_to_binary(a, bits)}")
-                print(f"{b} в прямом коде: {decimal_to_binary(b, bits)}")
-                print("Частное в двоичном виде:", binary)
-                print("Частное в десятичном виде:", decimal)
-            except ZeroDivisionError as e:
-                print(f"\nОшибка: {e}")
-
-        elif choice == '6':
-            a = float(input("Введите первое число с плавающей точкой: "))
-            b = float(input("Введите второе число с плавающей точкой: "))
-
-            binary, decimal = add_float(a, b)
-            print(f"\n{a} в IEEE-754: {float_to_binary(a)}")
-            print(f"{b} в IEEE-754: {float_to_binary(b)}")
-            print("Сумма в двоичном виде:", binary)
-            print("Сумма в десятичном виде:", decimal)
-
-        elif choice == '7':
+        if choice in MENU:
+            MENU[choice][1]()
+        elif choice == EXIT_CHOICE:
             print("Выход из программы...")
             break
-
         else:
             print("Неверный выбор. Пожалуйста, попробуйте еще раз.")
 
+def run_batch(argv, stdin=None, stdout=None, stderr=None):
+    parser = argparse.ArgumentParser(
+        description="Пакетный режим: операнды читаются построчно (CSV) из файла или stdin")
+    parser.add_argument('--op', choices=sorted(OPERATIONS), required=True)
+    parser.add_argument('--bits', type=int, default=8, help="Разрядность целочисленных кодов")
+    parser.add_argument('--format', choices=sorted(FORMATS), default=BINARY32.name,
+                        help="Формат чисел с плавающей точкой")
+    parser.add_argument('--rounding', choices=ROUNDING_MODES, default=ROUND_NEAREST_EVEN)
+    parser.add_argument('--output', choices=OUTPUT_FORMATS, default='csv')
+    parser.add_argument('--input', help="Файл операндов (по умолчанию stdin)")
+    args = parser.parse_args(argv)
+
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    source = open(args.input, newline='') if args.input else nullcontext(stdin or sys.stdin)
+    with source as lines:
+        throughput = run_pipeline(lines, stdout, OPERATIONS[args.op], args.output,
+                                  args.bits, FORMATS[args.format], args.rounding)
+    print(throughput.report(), file=stderr)
+    return throughput
+
+def main(argv=None):
+    # Без аргументов запускается интерактивное меню
+    if argv:
+        run_batch(argv)
+    else:
+        menu()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""Алгоритмы умножения модулей чисел для multiply_direct.
+
+Каждая функция принимает неотрицательные a и b, ширину множителя width
+и необязательный список trace, в который добавляются шаги вычисления.
+"""
+
+# Операнды не шире порога перемножаются встроенным умножением
+KARATSUBA_THRESHOLD = 128
+
+
+def _multiplier_bits(b, width):
+    # Разряды множителя от младшего к старшему; строка строится один раз
+    return format(b & ((1 << width) - 1), f'0{width}b')[::-1]
+
+
+def _trace_partials(partials, trace):
+    """Шаги умножения по парам (номер шага, частичное произведение)
+
+    Журнал заполняется после цикла умножения, чтобы цикл не проверял
+    trace на каждом разряде.
+    """
+    result = 0
+    for step, partial in partials:
+        result += partial
+        trace.append((step, partial, result))
+
+
+def shift_add_multiply(a, b, width, trace=None):
+    """Умножение сдвигами и сложениями: одно частичное произведение на разряд"""
+    result = 0
+    for i, bit in enumerate(_multiplier_bits(b, width)):
+        if bit == '1':
+            result += a << i
+    if trace is not None:
+        _trace_partials(((i, a << i) for i, bit in enumerate(_multiplier_bits(b, width)) if bit == '1'), trace)
+    return result
+
+
+# Цифра Бута по окну из трёх разрядов b[2k+1] b[2k] b[2k-1]
+BOOTH_WINDOWS = {'000': 0, '001': 1, '010': 1, '011': 2, '100': -2, '101': -1, '110': -1, '111': 0}
+
+
+def booth_digits(b, width):
+    """Цифры перекодировки Бута по основанию 4 (от младших к старшим)"""
+    # К множителю добавляются нулевой знаковый разряд и b[-1] = 0
+    count = width // 2 + 1
+    bits = format((b & ((1 << width) - 1)) << 1, f'0{2 * count + 1}b')
+    return [BOOTH_WINDOWS[bits[i:i + 3]] for i in range(2 * count - 2, -1, -2)]
+
+
+def booth_radix4_multiply(a, b, width, trace=None):
+    """Умножение с перекодировкой Бута: частичных произведений вдвое меньше"""
+    multiples = {1: a, 2: a << 1, -1: -a, -2: -(a << 1)}
+    result = 0
+    digits = booth_digits(b, width)
+    for step, digit in enumerate(digits):
+        if digit:
+            result += multiples[digit] << (2 * step)
+    if trace is not None:
+        _trace_partials(((step, multiples[digit] << (2 * step)) for step, digit in enumerate(digits) if digit), trace)
+    return result
+
+
+def karatsuba_multiply(a, b, width=None, trace=None, _depth=0):
+    """Умножение Карацубы: три умножения половин вместо четырёх"""
+    n = max(a.bit_length(), b.bit_length())
+    if n <= KARATSUBA_THRESHOLD:
+        return a * b
+    half = n // 2
+    mask = (1 << half) - 1
+    a_high, a_low = a >> half, a & mask
+    b_high, b_low = b >> half, b & mask
+    low = karatsuba_multiply(a_low, b_low, trace=trace, _depth=_depth + 1)
+    high = karatsuba_multiply(a_high, b_high, trace=trace, _depth=_depth + 1)
+    middle = karatsuba_multiply(a_low + a_high, b_low + b_high, trace=trace, _depth=_depth + 1) - low - high
+    result = (high << (2 * half)) + (middle << half) + low
+    if trace is not None:
+        trace.append((_depth, half, result))
+    return result
+
+
+MULTIPLY_METHODS = {
+    'shift': shift_add_multiply,
+    'booth': booth_radix4_multiply,
+    'karatsuba': karatsuba_multiply,
+}
\ No newline at end of file
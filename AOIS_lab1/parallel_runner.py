@@ -0,0 +1,87 @@
+"""Параллельное выполнение операций над большими массивами операндов.
+
+Операнды один раз копируются в блок multiprocessing.shared_memory, а
+процессам ProcessPoolExecutor передаются только имя блока и границы
+очередной порции, поэтому операнды не сериализуются по одному. Каждый
+процесс читает свою порцию прямо из общей памяти; результаты порций
+возвращаются в порядке операндов.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import binary_operations
+import float_operations
+from stream_pipeline import read_operands
+
+# Операция: функция и код типа операндов в общей памяти (int64 или float64)
+BULK_OPERATIONS = {
+    'add_complement': (binary_operations.add_complement, 'q'),
+    'multiply_direct': (binary_operations.multiply_direct, 'q'),
+    'divide_direct': (binary_operations.divide_direct, 'q'),
+    'add_float': (float_operations.add_float, 'd'),
+}
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _check_operation(operation):
+    if operation not in BULK_OPERATIONS:
+        raise ValueError(f"Unknown bulk operation: {operation}")
+    return BULK_OPERATIONS[operation]
+
+
+def load_operands(lines, operation):
+    """Столбцы операндов из строк CSV в виде двух array нужного типа"""
+    _, typecode = _check_operation(operation)
+    parse = int if typecode == 'q' else float
+    a, b = array(typecode), array(typecode)
+    for row in read_operands(lines):
+        if len(row) != 2:
+            raise ValueError(f"Expected 2 operands, got {len(row)}")
+        a.append(parse(row[0]))
+        b.append(parse(row[1]))
+    return a, b
+
+
+def _run_chunk(task):
+    name, size, operation, start, stop, kwargs = task
+    func, typecode = BULK_OPERATIONS[operation]
+    block = shared_memory.SharedMemory(name=name)
+    # Представление освобождается и при исключении, иначе close() заменит его на BufferError
+    try:
+        with block.buf.cast(typecode) as view:
+            a = view[start:stop].tolist()
+            b = view[size + start:size + stop].tolist()
+    finally:
+        block.close()
+    return [func(x, y, **kwargs) for x, y in zip(a, b)]
+
+
+def run_bulk(operation, a, b, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """Результаты operation(a[i], b[i], **kwargs) по порядку, вычисленные в workers процессах"""
+    _, typecode = _check_operation(operation)
+    if len(a) != len(b):
+        raise ValueError("Operand columns must have the same length")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    size = len(a)
+    if size == 0:
+        return []
+
+    itemsize = array(typecode).itemsize
+    block = shared_memory.SharedMemory(create=True, size=2 * size * itemsize)
+    try:
+        with block.buf.cast(typecode) as view:
+            view[:size] = array(typecode, a)
+            view[size:] = array(typecode, b)
+        tasks = [(block.name, size, operation, start, min(start + chunk_size, size), kwargs)
+                 for start in range(0, size, chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            for chunk in executor.map(_run_chunk, tasks):
+                results.extend(chunk)
+        return results
+    finally:
+        block.close()
+        block.unlink()
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Журнал шагов арифметики лабораторной работы 1.
+
+Функции add_complement, subtract_complement, multiply_direct и
+divide_direct принимают необязательный параметр trace. Без него шаги не
+записываются вовсе; с ним каждая функция открывает раздел журнала и
+добавляет события (шаг, первое значение, второе значение):
+
+* сложение и вычитание - слово переносов в разряды и слово суммы;
+* умножение - частичное произведение и накопленная сумма;
+* деление - цифра частного и остаток.
+
+Trace хранит события в array и bytearray, без кортежа и списка на
+событие, и совместим со списком по append, len, индексу и итерации.
+"""
+import json
+from array import array
+
+
+def _encode(value):
+    return value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+
+
+class Trace:
+    """Компактный журнал событий (шаг, значение, значение) по разделам"""
+
+    def __init__(self):
+        self.labels = []
+        self._label_index = {}
+        self._sections = array('H')
+        self._steps = array('q')
+        self._offsets = array('Q', [0])
+        self._data = bytearray()
+        self.begin('')
+
+    def begin(self, label):
+        """Начало раздела: последующие события относятся к label"""
+        if label not in self._label_index:
+            self._label_index[label] = len(self.labels)
+            self.labels.append(label)
+        self._section = self._label_index[label]
+        return self._section
+
+    def append(self, event):
+        step, first, second = event
+        self._sections.append(self._section)
+        self._steps.append(step)
+        for value in (first, second):
+            self._data += _encode(value)
+            self._offsets.append(len(self._data))
+
+    def _value(self, index):
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return int.from_bytes(self._data[start:stop], 'little', signed=True)
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __getitem__(self, index):
+        index = range(len(self))[index]
+        return self._steps[index], self._value(2 * index), self._value(2 * index + 1)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def events(self):
+        """События с метками разделов: (метка, шаг, значение, значение)"""
+        for i, event in enumerate(self):
+            yield (self.labels[self._sections[i]],) + event
+
+    @property
+    def nbytes(self):
+        """Объём памяти под события"""
+        return (len(self._data) + self._offsets.itemsize * len(self._offsets)
+                + self._steps.itemsize * len(self._steps) + self._sections.itemsize * len(self._sections))
+
+    def to_json_lines(self, out):
+        """Запись событий в поток out по одному объекту JSON в строке"""
+        for label, step, first, second in self.events():
+            out.write(json.dumps({'label': label, 'step': step, 'values': [first, second]}) + '\n')
+
+
+def begin(trace, label):
+    """Открытие раздела, если журнал - Trace (обычный список разделов не имеет)"""
+    if isinstance(trace, Trace):
+        trace.begin(label)
\ No newline at end of file
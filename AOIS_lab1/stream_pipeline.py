@@ -0,0 +1,146 @@
+"""Потоковая обработка операндов для пакетного режима main.py.
+
+Конвейер собран из генераторов: строки входа разбираются в операнды,
+операнды превращаются в записи результатов, записи сразу пишутся в
+CSV или JSON lines. В памяти одновременно находится одна строка, поэтому
+вход может быть любого размера.
+"""
+import csv
+import json
+import time
+from typing import Callable, NamedTuple
+
+import binary_operations
+import complement_code
+import direct_code
+import float_operations
+import inverse_code
+from float_arithmetic import ROUND_NEAREST_EVEN
+from ieee754 import BINARY32
+
+OUTPUT_FORMATS = ('csv', 'jsonl')
+
+
+def _convert(a, bits, **_):
+    return {
+        'direct': direct_code.decimal_to_binary(a, bits),
+        'inverse': inverse_code.inverse_code(a, bits),
+        'complement': complement_code.complement_code(a, bits),
+    }
+
+
+def _integer_operation(name):
+    def run(a, b, bits, **_):
+        binary, decimal, *overflow = getattr(binary_operations, name)(a, b, bits)
+        result = {'binary': binary, 'decimal': float(decimal) if name == 'divide_direct' else decimal}
+        if overflow:
+            result['overflow'] = overflow[0]
+        return result
+    return run
+
+
+def _float_operation(name):
+    def run(*operands, fmt, rounding, **_):
+        binary, decimal = getattr(float_operations, name)(*operands, rounding=rounding, fmt=fmt)
+        return {'binary': binary, 'decimal': decimal}
+    return run
+
+
+class Operation(NamedTuple):
+    """Операция пакетного режима: число и тип операндов, функция и поля результата"""
+    arity: int
+    parse: Callable
+    run: Callable
+    fields: tuple
+
+    @property
+    def columns(self):
+        return ('a', 'b', 'c')[:self.arity] + self.fields + ('error',)
+
+
+OPERATIONS = {
+    'convert': Operation(1, int, _convert, ('direct', 'inverse', 'complement')),
+    'add': Operation(2, int, _integer_operation('add_complement'), ('binary', 'decimal', 'overflow')),
+    'sub': Operation(2, int, _integer_operation('subtract_complement'), ('binary', 'decimal', 'overflow')),
+    'mul': Operation(2, int, _integer_operation('multiply_direct'), ('binary', 'decimal')),
+    'div': Operation(2, int, _integer_operation('divide_direct'), ('binary', 'decimal')),
+    'float_add': Operation(2, float, _float_operation('add_float'), ('binary', 'decimal')),
+    'float_sub': Operation(2, float, _float_operation('subtract_float'), ('binary', 'decimal')),
+    'float_mul': Operation(2, float, _float_operation('multiply_float'), ('binary', 'decimal')),
+    'float_div': Operation(2, float, _float_operation('divide_float'), ('binary', 'decimal')),
+    'float_fma': Operation(3, float, _float_operation('fma_float'), ('binary', 'decimal')),
+    'float_sqrt': Operation(1, float, _float_operation('sqrt_float'), ('binary', 'decimal')),
+}
+
+
+def read_operands(lines, delimiter=','):
+    """Строки операндов из потока; пустые строки и строки с # пропускаются"""
+    for row in csv.reader(lines, delimiter=delimiter):
+        fields = [field.strip() for field in row]
+        if fields and fields[0] and not fields[0].startswith('#'):
+            yield fields
+
+
+def evaluate(rows, operation, bits=8, fmt=BINARY32, rounding=ROUND_NEAREST_EVEN):
+    """Записи результатов; ошибка в строке попадает в поле error и не прерывает поток"""
+    for row in rows:
+        record = dict(zip(('a', 'b', 'c'), row))
+        try:
+            if len(row) != operation.arity:
+                raise ValueError(f"Expected {operation.arity} operands, got {len(row)}")
+            operands = [operation.parse(value) for value in row]
+            record.update(operation.run(*operands, bits=bits, fmt=fmt, rounding=rounding))
+        except (ValueError, ZeroDivisionError, OverflowError) as e:
+            record['error'] = str(e)
+        yield record
+
+
+def write_csv(records, out, columns):
+    writer = csv.DictWriter(out, fieldnames=columns, lineterminator='\n')
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+        yield record
+
+
+def write_jsonl(records, out):
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        yield record
+
+
+class Throughput:
+    """Счётчик записей и времени обработки"""
+
+    def __init__(self):
+        self.count = 0
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+
+    def track(self, records):
+        for record in records:
+            self.count += 1
+            yield record
+        self.elapsed = time.perf_counter() - self.start
+
+    @property
+    def rate(self):
+        return self.count / self.elapsed if self.elapsed else float('inf')
+
+    def report(self):
+        return f"Обработано записей: {self.count} за {self.elapsed:.3f} с ({self.rate:,.0f} записей/с)"
+
+
+def run_pipeline(lines, out, operation, output='csv', bits=8, fmt=BINARY32, rounding=ROUND_NEAREST_EVEN):
+    """Прогон всего потока; возвращает Throughput с числом записей и временем"""
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output}")
+    throughput = Throughput()
+    records = evaluate(read_operands(lines), operation, bits, fmt, rounding)
+    if output == 'csv':
+        records = write_csv(records, out, operation.columns)
+    else:
+        records = write_jsonl(records, out)
+    for _ in throughput.track(records):
+        pass
+    return throughput
\ No newline at end of file
@@ -0,0 +1,49 @@
+import pytest
+from alu import ALU, AluResult
+
+
+def test_add_without_overflow():
+    alu = ALU(8)
+    result = alu.add(alu.load(5), alu.load(-3))
+    assert result == AluResult(0b00000010, 1, False)
+    assert alu.value(result.word) == 2
+
+
+def test_add_overflow_flags():
+    alu = ALU(8)
+    assert alu.add(alu.load(127), alu.load(1)).overflow
+    assert alu.add(alu.load(-128), alu.load(-1)).overflow
+    assert not alu.add(alu.load(-128), alu.load(127)).overflow
+
+
+def test_sub():
+    alu = ALU(8)
+    word, carry, overflow = alu.sub(alu.load(3), alu.load(5))
+    assert alu.to_str(word) == '11111110'
+    assert not overflow
+    assert alu.sub(alu.load(-128), alu.load(1)).overflow
+    assert alu.value(alu.negate(alu.load(7)).word) == -7
+
+
+def test_carries():
+    alu = ALU(8)
+    # 0b0111 + 0b0001: переносы в разряды 1, 2 и 3
+    assert alu.carries(0b0111, 0b0001) == 0b1110
+
+
+def test_wide_words():
+    alu = ALU(4096)
+    a = (1 << 4000) + 17
+    b = -(1 << 3999)
+    result = alu.add(alu.load(a), alu.load(b))
+    assert alu.value(result.word) == a + b
+    assert not result.overflow
+    top = (1 << 4095) - 1
+    assert alu.add(alu.load(top), alu.load(1)).overflow
+
+
+def test_invalid_width():
+    with pytest.raises(ValueError):
+        ALU(0)
+    with pytest.raises(ValueError):
+        ALU(4097)
\ No newline at end of file
@@ -0,0 +1,76 @@
+from array import array
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_codes import (
+    direct_code_batch,
+    inverse_code_batch,
+    complement_code_batch,
+    binary_to_decimal_batch,
+    inverse_to_decimal_batch,
+    complement_to_decimal_batch,
+    words_to_bits,
+    bits_to_words
+)
+from direct_code import direct_code, binary_to_decimal
+from inverse_code import inverse_code, inverse_to_decimal
+from complement_code import complement_code, complement_to_decimal
+
+
+def _strings(words, bits):
+    return [format(int(w), f'0{bits}b') for w in words]
+
+
+def test_batch_matches_scalar_8_bit():
+    values = np.arange(-127, 128)
+    assert _strings(direct_code_batch(values, 8), 8) == [direct_code(int(v), 8) for v in values]
+    assert _strings(inverse_code_batch(values, 8), 8) == [inverse_code(int(v), 8) for v in values]
+    assert _strings(complement_code_batch(values, 8), 8) == [complement_code(int(v), 8) for v in values]
+
+
+def test_batch_out_of_range_keeps_sign():
+    values = np.array([-128, -200, 200])
+    assert _strings(inverse_code_batch(values, 8), 8) == [inverse_code(int(v), 8) for v in values]
+    assert inverse_to_decimal_batch(inverse_code_batch(values, 8), 8).tolist() == [0, -72, 72]
+
+
+def test_batch_decoders_match_scalar():
+    words = np.arange(256, dtype=np.uint64)
+    codes = _strings(words, 8)
+    assert binary_to_decimal_batch(words, 8).tolist() == [binary_to_decimal(c) for c in codes]
+    assert inverse_to_decimal_batch(words, 8).tolist() == [inverse_to_decimal(c) for c in codes]
+    assert complement_to_decimal_batch(words, 8).tolist() == [complement_to_decimal(c) for c in codes]
+
+
+def test_round_trip_64_bit():
+    rng = np.random.default_rng(0)
+    values = rng.integers(-(2 ** 62), 2 ** 62, size=1000, dtype=np.int64)
+    assert np.array_equal(complement_to_decimal_batch(complement_code_batch(values, 64), 64), values)
+    assert np.array_equal(inverse_to_decimal_batch(inverse_code_batch(values, 64), 64), values)
+    assert np.array_equal(binary_to_decimal_batch(direct_code_batch(values, 64), 64), values)
+
+
+def test_array_q_input():
+    values = array('q', [5, -5, 0])
+    assert complement_code_batch(values, 8).tolist() == [5, 0b11111011, 0]
+
+
+def test_bit_matrix():
+    words = complement_code_batch([5, -5], 8)
+    matrix = words_to_bits(words, 8)
+    assert matrix.dtype == np.uint8
+    assert matrix.tolist() == [[0, 0, 0, 0, 0, 1, 0, 1], [1, 1, 1, 1, 1, 0, 1, 1]]
+    assert np.array_equal(bits_to_words(matrix, 8), words)
+
+    packed = words_to_bits(words, 12, packed=True)
+    assert packed.shape == (2, 2)
+    assert np.array_equal(bits_to_words(packed, 12, packed=True), words)
+
+
+def test_invalid_bits():
+    with pytest.raises(ValueError):
+        complement_code_batch([1], 65)
+    with pytest.raises(ValueError):
+        direct_code_batch([1], 0)
\ No newline at end of file
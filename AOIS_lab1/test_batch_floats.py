@@ -0,0 +1,200 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_floats import (
+    floats_to_bits_batch,
+    bits_to_floats_batch,
+    decompose_batch,
+    float_to_binary_batch,
+    binary_to_float_batch,
+    add_bits_batch,
+    sub_bits_batch,
+    mul_bits_batch,
+    div_bits_batch,
+    fma_bits_batch,
+    sqrt_bits_batch,
+    add_batch,
+    sub_batch,
+    mul_batch,
+    div_batch,
+    fma_batch,
+    sqrt_batch,
+    encode_batch,
+    decode_batch,
+    decode_table
+)
+from float_arithmetic import ROUNDING_MODES, add_bits, sub_bits, mul_bits, div_bits, fma_bits, sqrt_bits, encode_float
+from float_operations import float_to_binary
+from ieee754 import BINARY16, BFLOAT16, BINARY32, BINARY64, float_format, float_to_bits, bits_to_float, decompose
+
+
+def test_batch_matches_scalar():
+    values = [1.0, -2.5, 0.1, 1e-45, 0.0, -0.0, float('inf'), 1e300]
+    assert floats_to_bits_batch(values).tolist() == [float_to_bits(v) for v in values]
+
+
+def test_random_round_trip():
+    rng = np.random.default_rng(0)
+    words = rng.integers(0, 2 ** 32, size=10000, dtype=np.uint64).astype(np.uint32)
+    # NaN отбрасываются по словам, до приведения к float64
+    finite = (words & np.uint32(0x7FFFFFFF)) <= np.uint32(0x7F800000)
+    values = bits_to_floats_batch(words[finite]).astype(np.float64)
+    assert np.array_equal(floats_to_bits_batch(values), words[finite])
+
+    signs, exponents, mantissas = decompose_batch(words)
+    for word, s, e, m in list(zip(words.tolist(), signs, exponents, mantissas))[:100]:
+        assert decompose(word) == (s, e, m)
+
+
+def test_bit_matrix():
+    matrix = float_to_binary_batch([1.0, -2.5])
+    assert [''.join(map(str, row)) for row in matrix.tolist()] == [float_to_binary(1.0), float_to_binary(-2.5)]
+    assert binary_to_float_batch(matrix).tolist() == [1.0, -2.5]
+    packed = float_to_binary_batch([1.0, -2.5], packed=True)
+    assert binary_to_float_batch(packed, packed=True).tolist() == [1.0, -2.5]
+
+
+def random_pairs(size, seed=0):
+    """Случайные пары слов: половина с произвольными, половина с близкими порядками"""
+    rng = np.random.default_rng(seed)
+    words = rng.integers(0, 2 ** 32, size=(size, 2), dtype=np.uint64).astype(np.uint32)
+    exponents = rng.integers(0, 256, size=size // 2)
+    close = np.stack([exponents, np.clip(exponents + rng.integers(-30, 30, size=size // 2), 0, 255)], axis=1)
+    words[:size // 2] = (words[:size // 2] & np.uint32(0x807FFFFF)) | (close.astype(np.uint32) << np.uint32(23))
+    return words[:, 0], words[:, 1]
+
+
+def test_add_batch_matches_numpy():
+    a, b = random_pairs(200000)
+    with np.errstate(all='ignore'):
+        expected = a.view(np.float32) + b.view(np.float32)
+    result, _ = add_batch(a.view(np.float32), b.view(np.float32))
+    nan = np.isnan(expected)
+    assert np.array_equal(np.isnan(result), nan)
+    assert np.array_equal(result.view(np.uint32)[~nan], expected.view(np.uint32)[~nan])
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_add_batch_matches_scalar(rounding):
+    a, b = random_pairs(2000, seed=1)
+    bits, flags = add_bits_batch(a, b, rounding)
+    for x, y, word, flag in zip(a.tolist(), b.tolist(), bits.tolist(), flags.tolist()):
+        assert add_bits(x, y, rounding) == (word, flag)
+
+
+def assert_same_floats(result, expected):
+    nan = np.isnan(expected)
+    assert np.array_equal(np.isnan(result), nan)
+    assert np.array_equal(result[~nan], expected[~nan])
+    assert np.array_equal(np.signbit(result[~nan]), np.signbit(expected[~nan]))
+
+
+@pytest.mark.parametrize("operation, batch", [
+    (np.subtract, sub_batch),
+    (np.multiply, mul_batch),
+    (np.divide, div_batch),
+])
+def test_binary_batch_matches_numpy(operation, batch):
+    a, b = random_pairs(200000, seed=2)
+    x, y = a.view(np.float32), b.view(np.float32)
+    with np.errstate(all='ignore'):
+        expected = operation(x, y)
+    assert_same_floats(batch(x, y)[0], expected)
+
+
+def test_sqrt_batch_matches_numpy():
+    a, b = random_pairs(200000, seed=3)
+    words = np.concatenate([a, b])
+    with np.errstate(invalid='ignore'):
+        expected = np.sqrt(words.view(np.float32))
+    assert_same_floats(sqrt_batch(words.view(np.float32))[0], expected)
+
+
+def test_fma_batch_matches_float64_reference():
+    # Для произведений без отмены одно округление float64 -> float32 совпадает с двойным
+    rng = np.random.default_rng(4)
+    x, y, z = (rng.standard_normal(100000).astype(np.float32) for _ in range(3))
+    expected = (x.astype(np.float64) * y + z).astype(np.float32)
+    result, _ = fma_batch(x, y, z)
+    mismatch = result != expected
+    assert mismatch.mean() < 1e-3
+    for i in np.flatnonzero(mismatch)[:20]:
+        assert fma_bits(*(int(v.view(np.uint32)) for v in (x[i], y[i], z[i]))).bits == result.view(np.uint32)[i]
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_operations_batch_match_scalar(rounding):
+    a, b = random_pairs(1000, seed=5)
+    c, _ = random_pairs(1000, seed=6)
+    # Половина слагаемых близка к -a * b, чтобы проверить сокращение разрядов
+    with np.errstate(all='ignore'):
+        cancel = (-(a.view(np.float32).astype(np.float64) * b.view(np.float32))).astype(np.float32)
+    c[::2] = cancel.view(np.uint32)[::2]
+    cases = [
+        (sub_bits_batch, sub_bits, (a, b)),
+        (mul_bits_batch, mul_bits, (a, b)),
+        (div_bits_batch, div_bits, (a, b)),
+        (fma_bits_batch, fma_bits, (a, b, c)),
+        (sqrt_bits_batch, sqrt_bits, (a,)),
+    ]
+    for batch, scalar, operands in cases:
+        bits, flags = batch(*operands, rounding=rounding)
+        for args, word, flag in zip(zip(*(o.tolist() for o in operands)), bits.tolist(), flags.tolist()):
+            assert scalar(*args, rounding) == (word, flag)
+
+
+def random_values(size, seed=0):
+    """Числа float64 широкого диапазона вместе со специальными значениями"""
+    rng = np.random.default_rng(seed)
+    values = rng.standard_normal(size) * 10.0 ** rng.integers(-12, 12, size)
+    return np.concatenate([values, [0.0, -0.0, np.inf, -np.inf, np.nan, 65520.0, 6e-8, 3e-8, 1e300]])
+
+
+def test_encode_batch_matches_numpy():
+    values = random_values(100000)
+    with np.errstate(all='ignore'):
+        half, single = values.astype(np.float16), values.astype(np.float32)
+    words, _ = encode_batch(values, BINARY16)
+    assert words.dtype == np.uint16
+    assert np.array_equal(words, half.view(np.uint16))
+    assert np.array_equal(encode_batch(values)[0], single.view(np.uint32))
+    assert np.array_equal(encode_batch(values, BINARY64)[0], values.view(np.uint64))
+
+
+def test_decode_batch_matches_numpy():
+    words = np.arange(1 << 16, dtype=np.uint16)
+    assert_same_floats(decode_batch(words, BINARY16), words.view(np.float16).astype(np.float64))
+    with np.errstate(invalid='ignore'):
+        bfloat = (words.astype(np.uint32) << np.uint32(16)).view(np.float32).astype(np.float64)
+    assert_same_floats(decode_batch(words, BFLOAT16), bfloat)
+    values = random_values(10000)
+    assert_same_floats(decode_batch(values.view(np.uint64), BINARY64), values)
+    with np.errstate(over='ignore'):
+        single = values.astype(np.float32)
+    assert_same_floats(decode_batch(single.view(np.uint32)), single.astype(np.float64))
+
+
+def test_decode_table():
+    table = decode_table(BINARY16)
+    assert table.shape == (1 << 16,)
+    assert decode_table(BINARY16) is table
+    assert not table.flags.writeable
+    with pytest.raises(ValueError):
+        decode_table(BINARY32)
+
+
+@pytest.mark.parametrize("fmt", [BFLOAT16, float_format(4, 3), float_format(5, 2), float_format(12, 51)])
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_custom_formats_match_scalar(fmt, rounding):
+    values = random_values(500, seed=7)
+    words, flags = encode_batch(values, fmt, rounding)
+    for value, word, flag in zip(values.tolist(), words.tolist(), flags.tolist()):
+        assert encode_float(value, rounding, fmt) == (word, flag)
+    decoded = decode_batch(words, fmt)
+    assert_same_floats(decoded, np.array([bits_to_float(w, fmt) for w in words.tolist()]))
+
+
+def test_batch_format_limit():
+    with pytest.raises(ValueError):
+        encode_batch([1.0], float_format(11, 60))
\ No newline at end of file
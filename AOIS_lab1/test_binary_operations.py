@@ -8,19 +8,19 @@ from binary_operations import (
 
 def test_add_complement():
     # Тест на сложение положительных чисел
-    assert add_complement(5, 3, 8) == ('00001000', 8)
+    assert add_complement(5, 3, 8) == ('00001000', 8, False)
     # Тест на сложение отрицательных чисел
-    assert add_complement(-5, -3, 8) == ('11111000', -8)
+    assert add_complement(-5, -3, 8) == ('11111000', -8, False)
     # Тест на сложение с разными знаками
-    assert add_complement(5, -3, 8) == ('00000010', 2)
+    assert add_complement(5, -3, 8) == ('00000010', 2, False)
 
 def test_subtract_complement():
     # Тест на вычитание положительных чисел
-    assert subtract_complement(5, 3, 8) == ('00000010', 2)
+    assert subtract_complement(5, 3, 8) == ('00000010', 2, False)
     # Тест на вычитание с отрицательным результатом
-    assert subtract_complement(3, 5, 8) == ('11111110', -2)
+    assert subtract_complement(3, 5, 8) == ('11111110', -2, False)
     # Тест на вычитание отрицательных чисел
-    assert subtract_complement(-3, -5, 8) == ('00000010', 2)
+    assert subtract_complement(-3, -5, 8) == ('00000010', 2, False)
 
 def test_multiply_edge_cases():
     # Умножение на ноль
@@ -47,9 +47,10 @@ def test_divide_direct():
 
 def test_add_overflow():
     # Тест на переполнение (127 + 1 в 8-битном доп. коде)
-    result_bin, result_dec = add_complement(127, 1, 8)
+    result_bin, result_dec, overflow = add_complement(127, 1, 8)
     assert result_bin == '10000000'  # Проверяем бинарное представление
     assert result_dec == -128  # Проверяем числовой результат
+    assert overflow  # Переполнение возвращается флагом
 
 def test_divide_by_zero():
     # Проверка обработки деления на ноль
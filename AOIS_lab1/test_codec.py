@@ -0,0 +1,101 @@
+import pytest
+from codec import (
+    word_mask,
+    direct_word,
+    inverse_word,
+    complement_word,
+    direct_value,
+    inverse_value,
+    complement_value,
+    word_to_str,
+    str_to_word,
+    str_to_value,
+    word_strings,
+    clear_tables,
+    TABLE_CACHE_SIZE
+)
+
+
+def test_word_mask():
+    assert word_mask(8) == 0xFF
+    assert word_mask(1) == 1
+    with pytest.raises(ValueError):
+        word_mask(0)
+
+
+def test_encode_words():
+    assert word_to_str(direct_word(-5, 8), 8) == '10000101'
+    assert word_to_str(inverse_word(-5, 8), 8) == '11111010'
+    assert word_to_str(complement_word(-5, 8), 8) == '11111011'
+    assert word_to_str(complement_word(-128, 8), 8) == '10000000'
+    # Положительные числа одинаковы во всех кодах
+    assert direct_word(5, 8) == inverse_word(5, 8) == complement_word(5, 8) == 5
+
+
+def test_round_trip_all_8_bit_values():
+    for n in range(-127, 128):
+        assert direct_value(direct_word(n, 8), 8) == n
+        assert inverse_value(inverse_word(n, 8), 8) == n
+    for n in range(-128, 128):
+        assert complement_value(complement_word(n, 8), 8) == n
+
+
+def test_out_of_range_keeps_sign():
+    # Модуль усекается, как в прямом коде, но знак не теряется
+    assert word_to_str(inverse_word(-128, 8), 8) == '11111111'
+    assert inverse_value(inverse_word(-200, 8), 8) == direct_value(direct_word(-200, 8), 8) == -72
+
+
+def test_wide_words():
+    bits = 4096
+    n = -(1 << 4000) + 12345
+    assert complement_value(complement_word(n, bits), bits) == n
+    assert inverse_value(inverse_word(n, bits), bits) == n
+    assert direct_value(direct_word(n, bits), bits) == n
+
+
+def test_str_to_word():
+    assert str_to_word('00000101') == (5, 8)
+    assert str_to_word('1') == (1, 1)
+
+
+def test_tables_match_direct_computation():
+    clear_tables()
+    for bits in (1, 8):
+        for word in range(1 << bits):
+            string = format(word, f'0{bits}b')
+            assert word_to_str(word, bits) == string
+            for decode in (direct_value, inverse_value, complement_value):
+                assert str_to_value(string, decode) == decode(word, bits)
+    assert word_to_str(-1, 16) == '1' * 16
+    assert len(word_strings(16)) == 1 << 16
+
+
+def test_wide_words_bypass_tables():
+    clear_tables()
+    assert word_to_str(5, 17) == '0' * 14 + '101'
+    assert str_to_value('1' * 20, complement_value) == -1
+    assert word_strings.cache_info().currsize == 0
+    with pytest.raises(ValueError):
+        str_to_value('10x', direct_value)
+
+
+def test_mixed_decoders_and_widths():
+    # Декодирование не строит таблиц, так что чередование кодов и ширин не вытесняет кэш
+    clear_tables()
+    for _ in range(3):
+        for bits in (8, 16):
+            for decode in (direct_value, inverse_value, complement_value):
+                assert str_to_value('1' * bits, decode) == decode(word_mask(bits), bits)
+    assert word_strings.cache_info().currsize == 0
+
+
+def test_tables_are_lru_bounded():
+    clear_tables()
+    for bits in range(1, TABLE_CACHE_SIZE + 3):
+        word_to_str(1, bits)
+    assert word_strings.cache_info().currsize == TABLE_CACHE_SIZE
+    # Недавно использованная ширина остаётся в кэше
+    hits = word_strings.cache_info().hits
+    word_to_str(3, TABLE_CACHE_SIZE + 2)
+    assert word_strings.cache_info().hits == hits + 1
\ No newline at end of file
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from differential import CHECKS, Check, applicable, compare_reports, main, run_all, run_check
+
+
+@pytest.mark.parametrize("check", CHECKS, ids=lambda check: check.name)
+@pytest.mark.parametrize("bits", [2, 8, 16, 32, 64])
+def test_matches_reference(check, bits):
+    if not applicable(check, bits):
+        pytest.skip("Width not supported by this check")
+    result = run_check(check, bits, 300, seed=1)
+    assert result.count == 300
+    assert result.mismatches == 0, result.examples
+
+
+def test_detects_mismatches():
+    check = CHECKS[0]
+    broken = check._replace(run=lambda bits: lambda n: check.run(bits)(n + 1))
+    result = run_check(broken, 8, 50)
+    assert result.mismatches == 50
+    assert len(result.examples) == 5
+
+
+def test_same_operands_for_same_seed():
+    seen = []
+    check = Check('identity', 'int', CHECKS[0].operands,
+                  lambda bits: lambda n: seen.append(n), lambda bits: lambda n: None)
+    run_check(check, 16, 20, seed=3)
+    run_check(check, 16, 20, seed=3)
+    assert seen[:20] == seen[20:]
+
+
+def test_compare_reports():
+    baseline = {'results': [{'name': 'add', 'bits': 8, 'ops_per_second': 1000.0},
+                            {'name': 'mul', 'bits': 8, 'ops_per_second': 1000.0}]}
+    current = {'results': [{'name': 'add', 'bits': 8, 'ops_per_second': 950.0},
+                           {'name': 'mul', 'bits': 8, 'ops_per_second': 500.0},
+                           {'name': 'div', 'bits': 8, 'ops_per_second': 1.0}]}
+    assert compare_reports(baseline, current, tolerance=0.1) == [('mul', 8, 1000.0, 500.0)]
+
+
+def test_report_and_regression_gate(tmp_path):
+    output = tmp_path / 'report.json'
+    assert main(['--count', '100', '--bits', '8', '--check', 'add_complement',
+                 '--output', str(output)]) == 0
+    report = json.loads(output.read_text(encoding='utf-8'))
+    [result] = report['results']
+    assert result['name'] == 'add_complement' and result['bits'] == 8
+    assert result['mismatches'] == 0 and result['ops_per_second'] > 0
+
+    result['ops_per_second'] *= 1000
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(report), encoding='utf-8')
+    assert main(['--count', '100', '--bits', '8', '--check', 'add_complement',
+                 '--output', str(output), '--baseline', str(baseline)]) == 1
+
+
+def test_run_all_selects_checks():
+    report = run_all([8, 32], count=10, names=['complement_code', 'add_float'])
+    assert [(r['name'], r['bits']) for r in report['results']] == [
+        ('complement_code', 8), ('complement_code', 32), ('add_float', 32)]
\ No newline at end of file
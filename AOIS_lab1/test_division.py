@@ -0,0 +1,66 @@
+import random
+from fractions import Fraction
+
+import pytest
+from division import DIVIDE_METHODS, divide_magnitudes
+from binary_operations import divide_direct
+
+
+@pytest.mark.parametrize("method", sorted(DIVIDE_METHODS))
+def test_methods_match_divmod(method):
+    divide = DIVIDE_METHODS[method]
+    for n in range(100):
+        for d in range(1, 20):
+            assert divide(n, d) == divmod(n, d)
+    rng = random.Random(2)
+    for _ in range(50):
+        n, d = rng.getrandbits(3000), rng.getrandbits(700) | 1
+        assert divide(n, d) == divmod(n, d)
+
+
+@pytest.mark.parametrize("method", sorted(DIVIDE_METHODS))
+def test_divide_direct_methods(method):
+    binary, value = divide_direct(-10, 3, precision=5, method=method)
+    assert binary == '111.01010'
+    assert value == Fraction(-10, 3)
+
+
+def test_division_result():
+    result = divide_magnitudes(1, 3, 5)
+    assert result.to_binary() == '0.01010'
+    assert result.fraction == Fraction(10, 32)
+    assert result.exact == Fraction(1, 3)
+    assert divide_magnitudes(7, 2, 0).to_binary() == '11'
+
+
+def test_high_precision():
+    result = divide_magnitudes(1, 3, 4000, method='srt')
+    assert result.to_binary() == '0.' + '01' * 2000
+    assert result.exact == Fraction(1, 3)
+
+
+def test_trace():
+    trace = []
+    divide_direct(5, 2, precision=2, trace=trace)
+    # 5 << 2 = 10100, частное 01010
+    assert [bit for _, bit, _ in trace] == [0, 1, 0, 1, 0]
+
+
+def test_srt_trace():
+    n, d = 1000, 7
+    trace = []
+    q, r = DIVIDE_METHODS['srt'](n, d, trace)
+    # Цифры -2..2 по основанию 4 дают частное до коррекции отрицательного остатка
+    raw = 0
+    for _, digit, _ in trace:
+        assert -2 <= digit <= 2
+        raw = 4 * raw + digit
+    assert raw - (trace[-1][2] < 0) == q == n // d
+    assert DIVIDE_METHODS['srt'](n, d) == (q, r)
+
+
+def test_errors():
+    with pytest.raises(ZeroDivisionError):
+        divide_magnitudes(1, 0, 5)
+    with pytest.raises(ValueError):
+        divide_direct(1, 3, method='newton')
\ No newline at end of file
@@ -0,0 +1,256 @@
+import math
+import random
+from fractions import Fraction
+
+import pytest
+from float_arithmetic import (
+    ROUNDING_MODES,
+    ROUND_NEAREST_EVEN,
+    ROUND_TOWARD_ZERO,
+    ROUND_TOWARD_POSITIVE,
+    ROUND_TOWARD_NEGATIVE,
+    FLAG_INVALID,
+    FLAG_DIVIDE_BY_ZERO,
+    FLAG_OVERFLOW,
+    FLAG_UNDERFLOW,
+    FLAG_INEXACT,
+    DEFAULT_NAN,
+    MAX_FINITE,
+    add_bits,
+    sub_bits,
+    mul_bits,
+    div_bits,
+    fma_bits,
+    sqrt_bits,
+    round_pack,
+    encode_float,
+    flag_names
+)
+from ieee754 import BINARY16, BFLOAT16, BINARY64, float_format, float_to_bits, bits_to_float
+from float_operations import (
+    float_to_binary,
+    binary_to_float,
+    add_float,
+    subtract_float,
+    multiply_float,
+    divide_float,
+    fma_float,
+    sqrt_float
+)
+
+
+def exact(bits):
+    return Fraction(bits_to_float(bits))
+
+
+def reference_round(value, rounding):
+    """Округление точного значения перебором соседних чисел binary32"""
+    sign = 1 << 31 if value < 0 else 0
+    magnitude = abs(value)
+    near = float_to_bits(float(magnitude))
+    candidates = [c for c in (near - 1, near, near + 1) if 0 <= c < 0x7F800000]
+    below = max((c for c in candidates if exact(c) <= magnitude), key=exact)
+    above = min((c for c in candidates if exact(c) >= magnitude), key=exact)
+    if below == above or rounding == ROUND_TOWARD_ZERO:
+        return sign | below
+    if rounding == ROUND_TOWARD_POSITIVE:
+        return sign | (below if sign else above)
+    if rounding == ROUND_TOWARD_NEGATIVE:
+        return sign | (above if sign else below)
+    low_gap, high_gap = magnitude - exact(below), exact(above) - magnitude
+    if low_gap != high_gap:
+        return sign | (below if low_gap < high_gap else above)
+    return sign | (below if below % 2 == 0 else above)
+
+
+def random_word(rng):
+    # Близкие порядки дают больше случаев с переносом и потерей разрядов
+    return (rng.getrandbits(1) << 31) | (rng.randint(0, 40) + 100 << 23) | rng.getrandbits(23)
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_add_matches_exact_rounding(rounding):
+    rng = random.Random(7)
+    for _ in range(2000):
+        a, b = random_word(rng), random_word(rng)
+        value = exact(a) + exact(b)
+        if value == 0:
+            continue
+        result = add_bits(a, b, rounding)
+        assert result.bits == reference_round(value, rounding)
+        assert bool(result.flags & FLAG_INEXACT) == (exact(result.bits) != value)
+
+
+def test_subnormal_results():
+    smallest_normal = 0x00800000
+    result = sub_bits(smallest_normal + 1, smallest_normal)
+    assert result == (1, 0)
+    # Половина наименьшего субнормального числа округляется к чётному нулю
+    assert round_pack(0, 1, -150, ROUND_NEAREST_EVEN) == (0, FLAG_INEXACT | FLAG_UNDERFLOW)
+    assert round_pack(0, 3, -150, ROUND_NEAREST_EVEN) == (2, FLAG_INEXACT | FLAG_UNDERFLOW)
+    assert round_pack(0, 1, -150, ROUND_TOWARD_POSITIVE).bits == 1
+
+
+def test_nearest_even_ties():
+    one, half_ulp = float_to_bits(1.0), float_to_bits(2.0 ** -24)
+    # Ровно половина единицы младшего разряда: к чётной мантиссе вниз и вверх
+    assert add_bits(one, half_ulp, ROUND_NEAREST_EVEN) == (one, FLAG_INEXACT)
+    assert add_bits(one + 1, half_ulp, ROUND_NEAREST_EVEN) == (one + 2, FLAG_INEXACT)
+    assert add_bits(one | 1 << 31, half_ulp | 1 << 31, ROUND_NEAREST_EVEN) == (one | 1 << 31, FLAG_INEXACT)
+    assert add_bits(one, half_ulp, ROUND_TOWARD_POSITIVE).bits == one + 1
+
+
+def test_overflow_by_rounding_mode():
+    big = float_to_bits(3e38)
+    assert add_bits(big, big) == (0x7F800000, FLAG_OVERFLOW | FLAG_INEXACT)
+    assert add_bits(big, big, ROUND_TOWARD_ZERO).bits == MAX_FINITE
+    negative = big | 1 << 31
+    assert add_bits(negative, negative, ROUND_TOWARD_POSITIVE).bits == MAX_FINITE | 1 << 31
+    assert add_bits(negative, negative, ROUND_TOWARD_NEGATIVE).bits == 0xFF800000
+
+
+def test_special_operands():
+    inf, ninf = 0x7F800000, 0xFF800000
+    assert add_bits(inf, ninf) == (DEFAULT_NAN, FLAG_INVALID)
+    assert add_bits(inf, float_to_bits(1.0)) == (inf, 0)
+    # Сигнальный NaN становится тихим и взводит invalid
+    assert add_bits(0x7F800001, float_to_bits(1.0)) == (0x7FC00001, FLAG_INVALID)
+    assert add_bits(0x7FC00002, 0x7F800001) == (0x7FC00002, FLAG_INVALID)
+
+
+def test_signed_zero():
+    one, minus_one = float_to_bits(1.0), float_to_bits(-1.0)
+    assert add_bits(one, minus_one).bits == 0
+    assert add_bits(one, minus_one, ROUND_TOWARD_NEGATIVE).bits == 1 << 31
+    assert add_bits(1 << 31, 1 << 31).bits == 1 << 31
+
+
+def test_flag_names():
+    assert flag_names(FLAG_OVERFLOW | FLAG_INEXACT) == ['overflow', 'inexact']
+    with pytest.raises(ValueError):
+        add_bits(0, 0, 'stochastic')
+
+
+def test_add_float():
+    assert add_float(1.5, 2.5) == ('01000000100000000000000000000000', 4.0)
+    assert add_float(0.1, 0.2, ROUND_TOWARD_ZERO)[1] < add_float(0.1, 0.2, ROUND_TOWARD_POSITIVE)[1]
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_mul_div_fma_match_exact_rounding(rounding):
+    rng = random.Random(11)
+    for _ in range(1000):
+        a, b, c = random_word(rng), random_word(rng), random_word(rng)
+        assert mul_bits(a, b, rounding).bits == reference_round(exact(a) * exact(b), rounding)
+        assert div_bits(a, b, rounding).bits == reference_round(exact(a) / exact(b), rounding)
+        # Слагаемое порядка произведения даёт сокращение старших разрядов
+        c = (c & 0x807FFFFF) | (min(254, max(1, ((a >> 23) & 0xFF) + ((b >> 23) & 0xFF) - 127)) << 23)
+        value = exact(a) * exact(b) + exact(c)
+        if value:
+            assert fma_bits(a, b, c, rounding).bits == reference_round(value, rounding)
+
+
+def test_sqrt_is_correctly_rounded():
+    rng = random.Random(13)
+    for _ in range(2000):
+        a = random_word(rng) & 0x7FFFFFFF
+        down = sqrt_bits(a, ROUND_TOWARD_ZERO)
+        assert exact(down.bits) ** 2 <= exact(a) < exact(down.bits + 1) ** 2
+        assert sqrt_bits(a, ROUND_TOWARD_NEGATIVE) == down
+        up = sqrt_bits(a, ROUND_TOWARD_POSITIVE).bits
+        assert up == (down.bits if exact(down.bits) ** 2 == exact(a) else down.bits + 1)
+        middle = (exact(down.bits) + exact(down.bits + 1)) / 2
+        assert sqrt_bits(a).bits == (down.bits if middle ** 2 > exact(a) else down.bits + 1)
+
+
+def test_mul_div_special_operands():
+    inf, one, zero = float_to_bits(float('inf')), float_to_bits(1.0), 0
+    assert mul_bits(inf, zero) == (DEFAULT_NAN, FLAG_INVALID)
+    assert mul_bits(inf, one | 1 << 31) == (inf | 1 << 31, 0)
+    assert div_bits(one, zero) == (inf, FLAG_DIVIDE_BY_ZERO)
+    assert div_bits(one, zero | 1 << 31) == (inf | 1 << 31, FLAG_DIVIDE_BY_ZERO)
+    assert div_bits(zero, zero) == (DEFAULT_NAN, FLAG_INVALID)
+    assert div_bits(inf, inf) == (DEFAULT_NAN, FLAG_INVALID)
+    assert div_bits(one, inf) == (0, 0)
+    assert mul_bits(0x7F800001, one) == (0x7FC00001, FLAG_INVALID)
+    # Произведение наименьших нормальных чисел исчезает
+    assert mul_bits(0x00800000, 0x00800000, ROUND_TOWARD_POSITIVE) == (1, FLAG_UNDERFLOW | FLAG_INEXACT)
+
+
+def test_fma_single_rounding():
+    word = float_to_bits(1.0 + 2.0 ** -12)
+    a = exact(word)
+    # Слагаемое 2 ** -24 в a * a - 1 теряется при отдельном округлении произведения
+    assert exact(add_bits(mul_bits(word, word).bits, float_to_bits(-1.0)).bits) != a * a - 1
+    result = fma_bits(word, word, float_to_bits(-1.0))
+    assert exact(result.bits) == a * a - 1
+    assert result.flags == 0
+    assert fma_bits(float_to_bits(float('inf')), 0, DEFAULT_NAN) == (DEFAULT_NAN, FLAG_INVALID)
+    assert fma_bits(float_to_bits(1.0), float_to_bits(-1.0), float_to_bits(1.0)).bits == 0
+    assert fma_bits(float_to_bits(1.0), float_to_bits(-1.0), float_to_bits(1.0), ROUND_TOWARD_NEGATIVE).bits == 1 << 31
+
+
+def test_sqrt_special_operands():
+    assert sqrt_bits(1 << 31) == (1 << 31, 0)
+    assert sqrt_bits(float_to_bits(-1.0)) == (DEFAULT_NAN, FLAG_INVALID)
+    assert sqrt_bits(float_to_bits(float('inf'))) == (float_to_bits(float('inf')), 0)
+    assert sqrt_bits(float_to_bits(2.25)) == (float_to_bits(1.5), 0)
+    assert sqrt_bits(1).bits == float_to_bits(2.0 ** -74.5)
+
+
+def test_float_operations():
+    assert subtract_float(1.5, 2.5) == ('10111111100000000000000000000000', -1.0)
+    assert multiply_float(1.5, -2.0)[1] == -3.0
+    assert divide_float(1.0, 3.0) == (format(float_to_bits(1 / 3), '032b'), bits_to_float(float_to_bits(1 / 3)))
+    assert divide_float(1.0, 3.0, ROUND_TOWARD_ZERO)[1] < divide_float(1.0, 3.0, ROUND_TOWARD_POSITIVE)[1]
+    assert fma_float(2.0, 3.0, 1.0)[1] == 7.0
+    assert sqrt_float(2.0)[1] == bits_to_float(float_to_bits(2.0 ** 0.5))
+
+
+def test_encode_matches_struct():
+    rng = random.Random(17)
+    values = [0.1, -2.5, 65519.99, 65520.0, 1e-8, 3e-8, 6e-8, 1e300, -0.0, float('inf')]
+    values += [rng.uniform(-1, 1) * 2.0 ** rng.randint(-30, 20) for _ in range(2000)]
+    for value in values:
+        assert encode_float(value, fmt=BINARY16).bits == float_to_bits(value, BINARY16)
+        assert encode_float(value).bits == float_to_bits(value)
+        assert encode_float(value, fmt=BINARY64) == (float_to_bits(value, BINARY64), 0)
+
+
+def test_encode_flags_and_modes():
+    assert encode_float(1.0, fmt=BFLOAT16) == (0x3F80, 0)
+    third = 1 / 3
+    assert encode_float(third, ROUND_TOWARD_ZERO, BFLOAT16) == (0x3EAA, FLAG_INEXACT)
+    assert encode_float(third, ROUND_TOWARD_POSITIVE, BFLOAT16) == (0x3EAB, FLAG_INEXACT)
+    assert encode_float(-third, ROUND_TOWARD_NEGATIVE, BFLOAT16) == (0xBEAB, FLAG_INEXACT)
+    assert encode_float(1e6, fmt=BINARY16) == (0x7C00, FLAG_OVERFLOW | FLAG_INEXACT)
+    assert encode_float(1e6, ROUND_TOWARD_ZERO, BINARY16) == (0x7BFF, FLAG_OVERFLOW | FLAG_INEXACT)
+    assert encode_float(1e-8, fmt=BINARY16) == (0, FLAG_UNDERFLOW | FLAG_INEXACT)
+    assert encode_float(float('nan'), fmt=BINARY16).bits == 0x7E00
+
+
+@pytest.mark.parametrize("fmt", [BINARY16, float_format(5, 2)])
+def test_operations_in_narrow_formats(fmt):
+    # Точный результат float64 округляется до узкого формата с тем же итогом (53 >= 2p + 2)
+    rng = random.Random(19)
+    words = [rng.getrandbits(fmt.bits) for _ in range(400)]
+    words = [w for w in words if (w >> fmt.mantissa_bits) & fmt.exponent_mask != fmt.exponent_mask]
+    for a, b in zip(words, reversed(words)):
+        x, y = bits_to_float(a, fmt), bits_to_float(b, fmt)
+        assert add_bits(a, b, fmt=fmt).bits == encode_float(x + y, fmt=fmt).bits
+        assert mul_bits(a, b, fmt=fmt).bits == encode_float(x * y, fmt=fmt).bits
+        if y:
+            assert div_bits(a, b, fmt=fmt).bits == encode_float(x / y, fmt=fmt).bits
+        if x >= 0:
+            assert sqrt_bits(a, fmt=fmt).bits == encode_float(math.sqrt(x), fmt=fmt).bits
+
+
+def test_float_operations_formats():
+    assert float_to_binary(1.5, BINARY16) == '0011111000000000'
+    assert float_to_binary(1.0, BFLOAT16) == '0011111110000000'
+    assert binary_to_float('0011111110000000', BFLOAT16) == 1.0
+    with pytest.raises(ValueError):
+        binary_to_float('0' * 32, BINARY16)
+    assert add_float(1.0, 2.0 ** -11, fmt=BINARY16)[1] == 1.0
+    assert add_float(1.0, 2.0 ** -11, ROUND_TOWARD_POSITIVE, BINARY16)[1] == 1.0 + 2.0 ** -10
+    assert multiply_float(0.1, 0.1, fmt=BINARY64)[1] == 0.1 * 0.1
\ No newline at end of file
@@ -0,0 +1,96 @@
+import math
+import struct
+
+import pytest
+from ieee754 import (
+    BINARY16,
+    BFLOAT16,
+    BINARY32,
+    BINARY64,
+    FORMATS,
+    float_format,
+    float_to_bits,
+    bits_to_float,
+    decompose,
+    compose,
+    classify,
+    nan_payload,
+    is_quiet_nan,
+    significand
+)
+
+
+def test_round_trip():
+    for value in (1.0, -2.5, 0.1, 3.4028234663852886e38, 1e-45, -0.0):
+        bits = float_to_bits(value)
+        assert bits == int.from_bytes(struct.pack('>f', value), 'big')
+        assert bits_to_float(bits) == struct.unpack('>f', struct.pack('>f', value))[0]
+
+
+def test_fields():
+    bits = float_to_bits(-2.5)
+    assert decompose(bits) == (1, 128, 0b01 << 21)
+    assert compose(*decompose(bits)) == bits
+    assert significand(float_to_bits(1.0)) == (1 << 23, -23)
+
+
+def test_subnormals():
+    smallest = float_to_bits(1e-45)
+    assert smallest == 1
+    assert classify(smallest) == 'subnormal'
+    assert significand(smallest) == (1, -149)
+    assert bits_to_float(smallest) == math.ldexp(1, -149)
+
+
+def test_special_values():
+    assert classify(float_to_bits(0.0)) == 'zero'
+    assert float_to_bits(-0.0) == 1 << 31
+    assert classify(float_to_bits(float('inf'))) == 'inf'
+    assert float_to_bits(float('-inf')) == 0xFF800000
+    # Переполнение binary32 даёт бесконечность
+    assert float_to_bits(1e300) == 0x7F800000
+    assert float_to_bits(-1e300) == 0xFF800000
+
+
+def test_nan_payload():
+    bits = 0x7FC00123
+    assert classify(bits) == 'nan'
+    assert is_quiet_nan(bits)
+    assert nan_payload(bits) == 0x123
+    assert not is_quiet_nan(float_to_bits(1.0))
+    assert math.isnan(bits_to_float(bits))
+
+
+def test_standard_formats():
+    assert [(f.bits, f.bias) for f in (BINARY16, BFLOAT16, BINARY32, BINARY64)] == [(16, 15), (16, 127), (32, 127), (64, 1023)]
+    assert FORMATS['bfloat16'] is BFLOAT16
+    assert BINARY32.default_nan == 0x7FC00000
+    assert BINARY16.max_finite == 0x7BFF
+    assert float_format(4, 3).name == 'e4m3'
+    with pytest.raises(ValueError):
+        float_format(1, 3)
+    with pytest.raises(ValueError):
+        float_format(4, 0)
+
+
+def test_struct_formats():
+    assert float_to_bits(1.5, BINARY16) == 0x3E00
+    assert float_to_bits(1e6, BINARY16) == 0x7C00
+    assert float_to_bits(-0.1, BINARY64) == int.from_bytes(struct.pack('>d', -0.1), 'big')
+    assert bits_to_float(0x3E00, BINARY16) == 1.5
+    assert significand(1, BINARY16) == (1, -24)
+    with pytest.raises(ValueError):
+        float_to_bits(1.0, BFLOAT16)
+
+
+def test_generic_decoding():
+    # bfloat16 - старшая половина слова binary32
+    for value in (1.0, -2.5, 3.0e38, 1e-40):
+        word = float_to_bits(value) >> 16
+        assert bits_to_float(word, BFLOAT16) == bits_to_float(word << 16)
+    assert classify(0x7F80, BFLOAT16) == 'inf'
+    assert math.isnan(bits_to_float(0xFFC1, BFLOAT16))
+    e4m3 = float_format(4, 3)
+    assert bits_to_float(compose(0, 7, 0b100, e4m3), e4m3) == 1.5
+    assert bits_to_float(1, e4m3) == 2.0 ** -9
+    assert decompose(0xB8, e4m3) == (1, 7, 0)
\ No newline at end of file
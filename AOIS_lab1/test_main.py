@@ -1,3 +1,6 @@
+import io
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 import main
@@ -30,8 +33,8 @@ def test_menu_options(choice, expected_output, capsys):
         with patch('main.direct_code.decimal_to_binary', return_value='00000000'):
             with patch('main.inverse_code.inverse_code', return_value='00000000'):
                 with patch('main.complement_code.complement_code', return_value='00000000'):
-                    with patch('main.binary_operations.add_complement', return_value=('00000000', 0)):
-                        with patch('main.binary_operations.subtract_complement', return_value=('00000000', 0)):
+                    with patch('main.binary_operations.add_complement', return_value=('00000000', 0, False)):
+                        with patch('main.binary_operations.subtract_complement', return_value=('00000000', 0, False)):
                             with patch('main.binary_operations.multiply_direct', return_value=('00000000', 0)):
                                 with patch('main.binary_operations.divide_direct', return_value=('00000000', 0)):
                                     with patch('main.float_operations.add_float', return_value=('00000000', 0.0)):
@@ -104,4 +107,19 @@ def test_immediate_exit(capsys):
     with patch('builtins.input', return_value='7'):
         main.main()
         captured = capsys.readouterr()
-        assert "Выход из программы..." in captured.out
\ No newline at end of file
+        assert "Выход из программы..." in captured.out
+
+def test_batch_mode(capsys):
+    with patch('sys.stdin', io.StringIO("5,3\n-5,-3\n")):
+        main.main(['--op', 'add', '--bits', '8', '--output', 'jsonl'])
+    captured = capsys.readouterr()
+    assert [json.loads(line)['decimal'] for line in captured.out.splitlines()] == [8, -8]
+    assert "Обработано записей: 2" in captured.err
+
+
+def test_batch_mode_input_file(tmp_path, capsys):
+    source = tmp_path / "pairs.csv"
+    source.write_text("1.5,2.5\n")
+    main.main(['--op', 'float_mul', '--input', str(source)])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ['a,b,binary,decimal,error', '1.5,2.5,01000000011100000000000000000000,3.75,']
\ No newline at end of file
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+from multiplication import (
+    MULTIPLY_METHODS,
+    booth_digits,
+    booth_radix4_multiply,
+    karatsuba_multiply
+)
+from binary_operations import multiply_direct
+
+
+@pytest.mark.parametrize("method", sorted(MULTIPLY_METHODS))
+def test_methods_match_builtin(method):
+    rng = random.Random(1)
+    multiply = MULTIPLY_METHODS[method]
+    for width in (1, 3, 8, 64, 1024, 4096):
+        for _ in range(20):
+            a, b = rng.getrandbits(width), rng.getrandbits(width)
+            assert multiply(a, b, width) == a * b
+
+
+@pytest.mark.parametrize("method", sorted(MULTIPLY_METHODS))
+def test_multiply_direct_methods(method):
+    assert multiply_direct(-3, 5, 8, method=method) == multiply_direct(-3, 5, 8)
+    assert multiply_direct(-3, 5, 8, method=method)[1] == -15
+    assert multiply_direct(-7, -9, 8, method=method)[1] == 63
+
+
+def test_booth_digits():
+    # 7 = 2 * 4 - 1
+    assert booth_digits(0b0111, 4) == [-1, 2, 0]
+    assert len(booth_digits((1 << 1024) - 1, 1024)) == 513
+
+
+def test_trace():
+    trace = []
+    assert booth_radix4_multiply(13, 11, 4, trace) == 143
+    assert trace and trace[-1][2] == 143
+
+    trace = []
+    a, b = (1 << 300) - 3, (1 << 299) + 5
+    assert karatsuba_multiply(a, b, trace=trace) == a * b
+    assert trace[-1][2] == a * b
+
+    trace = []
+    multiply_direct(6, 5, 8, trace=trace)
+    assert [step for step, _, _ in trace] == [0, 2]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        multiply_direct(1, 2, 8, method='wallace')
\ No newline at end of file
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+from binary_operations import add_complement, multiply_direct, divide_direct
+from float_operations import add_float
+from parallel_runner import load_operands, run_bulk
+
+
+@pytest.mark.parametrize("operation, func, kwargs", [
+    ('add_complement', add_complement, {'bits': 16}),
+    ('multiply_direct', multiply_direct, {'bits': 16, 'method': 'booth'}),
+    ('divide_direct', divide_direct, {'bits': 16, 'precision': 8}),
+])
+def test_results_in_order(operation, func, kwargs):
+    a = list(range(-500, 500))
+    b = [x * 7 % 31 + 1 for x in a]
+    expected = [func(x, y, **kwargs) for x, y in zip(a, b)]
+    assert run_bulk(operation, a, b, workers=2, chunk_size=97, **kwargs) == expected
+
+
+def test_float_operands():
+    a, b = [0.1, 1.5, -2.0], [0.2, 2.5, 2.0]
+    expected = [add_float(x, y, 'toward_zero') for x, y in zip(a, b)]
+    assert run_bulk('add_float', a, b, workers=2, chunk_size=1, rounding='toward_zero') == expected
+
+
+def test_errors_and_edge_cases():
+    assert run_bulk('add_complement', [], []) == []
+    with pytest.raises(ValueError):
+        run_bulk('power', [1], [2])
+    with pytest.raises(ValueError):
+        run_bulk('add_complement', [1, 2], [3])
+    with pytest.raises(ZeroDivisionError):
+        run_bulk('divide_direct', [1, 2], [1, 0], workers=1)
+    # Ошибка при записи в общую память не подменяется BufferError
+    with pytest.raises(OverflowError):
+        run_bulk('add_complement', [1, 2 ** 70], [1, 2])
+
+
+def test_load_operands():
+    a, b = load_operands(io.StringIO("# a,b\n1,2\n-3,4\n"), 'multiply_direct')
+    assert (a.typecode, list(a), list(b)) == ('q', [1, -3], [2, 4])
+    a, _ = load_operands(io.StringIO("0.5,1\n"), 'add_float')
+    assert list(a) == [0.5]
\ No newline at end of file
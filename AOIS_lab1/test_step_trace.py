@@ -0,0 +1,48 @@
+import io
+import json
+
+from binary_operations import add_complement, subtract_complement, multiply_direct, divide_direct
+from step_trace import Trace
+
+
+def test_trace_behaves_like_list():
+    trace = Trace()
+    trace.append((0, 5, -3))
+    trace.append((1, 1 << 100, 0))
+    assert len(trace) == 2
+    assert trace[1] == (1, 1 << 100, 0)
+    assert trace[-2] == (0, 5, -3)
+    assert list(trace) == [(0, 5, -3), (1, 1 << 100, 0)]
+
+
+def test_operations_record_sections():
+    trace = Trace()
+    add_complement(5, 3, 8, trace=trace)
+    subtract_complement(5, 3, 8, trace=trace)
+    multiply_direct(6, 5, 8, trace=trace)
+    divide_direct(5, 2, precision=2, method='nonrestoring', trace=trace)
+    events = list(trace.events())
+    # Переносы 5 + 3 = 0b101 + 0b011 входят в разряды 1, 2 и 3
+    assert events[0] == ('add_complement', 0, 0b1110, 8)
+    assert events[1][0] == 'subtract_complement' and events[1][3] == 2
+    assert [e[1:] for e in events if e[0] == 'multiply_direct:shift'] == [(0, 6, 6), (2, 24, 30)]
+    assert [e[2] for e in events if e[0] == 'divide_direct:nonrestoring'] == [0, 1, 0, 1, 0]
+    assert trace.labels[1:] == ['add_complement', 'subtract_complement', 'multiply_direct:shift', 'divide_direct:nonrestoring']
+
+
+def test_list_traces_still_work():
+    trace = []
+    add_complement(127, 1, 8, trace=trace)
+    divide_direct(7, 2, precision=0, trace=trace)
+    assert trace == [(0, 0b11111110, 0b10000000), (0, 0, 1), (1, 1, 1), (2, 1, 1)]
+
+
+def test_json_lines_export():
+    trace = Trace()
+    multiply_direct(13, 11, 4, method='booth', trace=trace)
+    out = io.StringIO()
+    trace.to_json_lines(out)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {line['label'] for line in lines} == {'multiply_direct:booth'}
+    assert lines[-1]['values'][1] == 143
+    assert trace.nbytes < 100
\ No newline at end of file
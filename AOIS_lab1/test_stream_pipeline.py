@@ -0,0 +1,69 @@
+import io
+import json
+
+import pytest
+from ieee754 import BINARY16
+from stream_pipeline import OPERATIONS, read_operands, evaluate, run_pipeline
+
+
+def test_read_operands_skips_comments_and_blanks():
+    lines = io.StringIO("# a,b\n5, 3\n\n-1,2\n")
+    assert list(read_operands(lines)) == [['5', '3'], ['-1', '2']]
+
+
+def test_evaluate_integer_operations():
+    records = list(evaluate([['5', '3'], ['127', '1']], OPERATIONS['add'], bits=8))
+    assert records[0] == {'a': '5', 'b': '3', 'binary': '00001000', 'decimal': 8, 'overflow': False}
+    assert records[1]['overflow']
+    record, = evaluate([['-5']], OPERATIONS['convert'], bits=8)
+    assert (record['direct'], record['inverse'], record['complement']) == ('10000101', '11111010', '11111011')
+
+
+def test_errors_do_not_stop_the_stream():
+    records = list(evaluate([['10', '0'], ['x', '1'], ['1'], ['6', '3']], OPERATIONS['div']))
+    assert [r.get('error') for r in records[:3]] == [
+        'Division by zero',
+        "invalid literal for int() with base 10: 'x'",
+        'Expected 2 operands, got 1',
+    ]
+    assert records[3]['decimal'] == 2.0
+
+
+def test_float_operations_use_format_and_rounding():
+    record, = evaluate([['1', '3']], OPERATIONS['float_div'], fmt=BINARY16, rounding='toward_zero')
+    assert record['binary'] == '0011010101010101'
+    record, = evaluate([['2', '3', '1']], OPERATIONS['float_fma'])
+    assert record['decimal'] == 7.0
+
+
+def test_run_pipeline_csv():
+    out = io.StringIO()
+    throughput = run_pipeline(io.StringIO("5,3\n10,0\n"), out, OPERATIONS['sub'], bits=8)
+    assert out.getvalue().splitlines() == [
+        'a,b,binary,decimal,overflow,error',
+        '5,3,00000010,2,False,',
+        '10,0,00001010,10,False,',
+    ]
+    assert throughput.count == 2
+
+
+def test_run_pipeline_jsonl():
+    out = io.StringIO()
+    run_pipeline(io.StringIO("1.5,2.5\n"), out, OPERATIONS['float_add'], output='jsonl')
+    assert json.loads(out.getvalue()) == {'a': '1.5', 'b': '2.5', 'binary': '01000000100000000000000000000000', 'decimal': 4.0}
+    with pytest.raises(ValueError):
+        run_pipeline(io.StringIO(""), out, OPERATIONS['add'], output='xml')
+
+
+def test_pipeline_is_lazy():
+    # Следующая строка читается только после записи результата предыдущей
+    consumed = []
+
+    def lines():
+        for line in ("1,2\n", "3,4\n"):
+            consumed.append(line)
+            yield line
+
+    records = evaluate(read_operands(lines()), OPERATIONS['mul'])
+    next(records)
+    assert consumed == ["1,2\n"]
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""Замеры производительности лабораторной работы 2.
+
+Запуск: python benchmark.py [--variables N] [--section имя]
+"""
+import argparse
+import time
+import tracemalloc
+from itertools import product
+
+from canonical_forms import write_sdnf
+from expression import compile_expression
+from expression_cache import configure_cache
+from main import build_sdnf, generate_truth_table, numeric_forms
+from truth_table import evaluate_table
+
+
+def measure(func, *args, repeat=3):
+    """Лучшее время выполнения func(*args) из repeat запусков"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args):
+    """Наибольший объём памяти, выделенной за время func(*args), и её результат"""
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def sample_expression(n):
+    """Выражение от n переменных x0..x{n-1}, истинное примерно в половине строк"""
+    variables = [f'x{i}' for i in range(n)]
+    text = ' | '.join(f'({variables[i]} & !{variables[(i + 1) % n]} & {variables[(i + 2) % n]})'
+                      for i in range(0, n, 2))
+    return text, variables
+
+
+def dict_rows(function, variables):
+    # Прежнее представление: словарь на каждую строку
+    table = []
+    for values in product([0, 1], repeat=len(variables)):
+        row = dict(zip(variables, values))
+        row['result'] = function(*values)
+        table.append(row)
+    return table
+
+
+def bench_truth_table(n):
+    """Построчное вычисление со словарями против вычисления над масками"""
+    text, variables = sample_expression(n)
+    function = compile_expression(text, variables)
+    rows = 2 ** n
+    return [
+        (f'truth_table/dict_rows n={n}', rows, measure(dict_rows, function, variables, repeat=1)),
+        (f'truth_table/bitset n={n}', rows, measure(evaluate_table, function, variables)),
+    ]
+
+
+def bench_memory(n):
+    """Память под таблицу: список словарей против TruthTable"""
+    text, variables = sample_expression(n)
+    function = compile_expression(text, variables)
+    dict_peak, _ = peak_memory(dict_rows, function, variables)
+    table_peak, table = peak_memory(evaluate_table, function, variables)
+    return [
+        (f'memory/dict_rows n={n}', 2 ** n, dict_peak),
+        (f'memory/TruthTable n={n}', 2 ** n, table_peak),
+        (f'memory/TruthTable.nbytes n={n}', 2 ** n, table.nbytes),
+    ]
+
+
+def bench_forms(n):
+    """СДНФ и числовые формы по TruthTable и по списку словарей"""
+    text, variables = sample_expression(n)
+    function = compile_expression(text, variables)
+    table = evaluate_table(function, variables)
+    rows = dict_rows(function, variables)
+    return [
+        (f'forms/sdnf TruthTable n={n}', 2 ** n, measure(build_sdnf, variables, table)),
+        (f'forms/sdnf dict_rows n={n}', 2 ** n, measure(build_sdnf, variables, rows)),
+        (f'forms/numeric TruthTable n={n}', 2 ** n, measure(numeric_forms, variables, table)),
+    ]
+
+
+class _Sink:
+    # Поток, отбрасывающий запись: измеряется только память построения
+    def write(self, text):
+        return len(text)
+
+
+def bench_streaming(n):
+    """Пиковая память СДНФ: строка целиком против потоковой записи"""
+    text, variables = sample_expression(n)
+    table = evaluate_table(compile_expression(text, variables), variables)
+    joined_peak, _ = peak_memory(build_sdnf, variables, table)
+    stream_peak, _ = peak_memory(write_sdnf, _Sink(), variables, table)
+    return [
+        (f'streaming/build_sdnf n={n}', 2 ** n, joined_peak),
+        (f'streaming/write_sdnf n={n}', 2 ** n, stream_peak),
+    ]
+
+
+def bench_cache(n):
+    """Повторное построение таблицы и СДНФ: без кэша и по каноническому ключу"""
+    text, variables = sample_expression(n)
+    # То же выражение с другим порядком операндов и синонимом операции
+    respaced = ' or '.join(reversed(text.split(' | ')))
+
+    def build(expr):
+        names, table = generate_truth_table(expr, variables)
+        return build_sdnf(names, table)
+    cold = measure(build, text)
+    configure_cache()
+    build(text)
+    warm = measure(build, respaced)
+    configure_cache(maxbytes=0)
+    return [
+        (f'cache/cold n={n}', 2 ** n, cold),
+        (f'cache/warm n={n}', 2 ** n, warm),
+    ]
+
+
+def report(rows, unit):
+    for name, size, value in rows:
+        if unit == 'bytes':
+            print(f"{name:<36} {size:>10} {value:>14,} B {value / size:>10.2f} B/row")
+        else:
+            print(f"{name:<36} {size:>10} {value:>10.4f} s {size / value if value else float('inf'):>14,.0f} rows/s")
+
+
+# Раздел: (функция замера, единица результата)
+SECTIONS = {
+    'truth_table': (bench_truth_table, 'seconds'),
+    'memory': (bench_memory, 'bytes'),
+    'forms': (bench_forms, 'seconds'),
+    'streaming': (bench_streaming, 'bytes'),
+    'cache': (bench_cache, 'seconds'),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--variables', type=int, default=16)
+    parser.add_argument('--section', choices=sorted(SECTIONS), action='append',
+                        help="Раздел замеров (по умолчанию все)")
+    args = parser.parse_args()
+    # Повторные замеры не должны попадать в кэш; раздел cache включает его сам
+    configure_cache(maxbytes=0)
+    for section in args.section or sorted(SECTIONS):
+        bench, unit = SECTIONS[section]
+        report(bench(args.variables), unit)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
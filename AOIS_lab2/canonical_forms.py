@@ -0,0 +1,117 @@
+"""Потоковый вывод СДНФ, СКНФ и числовых форм.
+
+Термы канонических форм порождаются генераторами по номерам строк
+TruthTable и пишутся в поток порциями по chunk_size символов, поэтому
+память не зависит от числа переменных. Поток - любой объект с методом
+write: файл, io.StringIO или socket.makefile('w', encoding='utf-8').
+
+Числовая форма пишется в двоичный поток компактно: число переменных,
+число номеров и разности соседних номеров строк в кодировке varint
+(LEB128, по 7 разрядов в байте).
+"""
+from truth_table import as_truth_table
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _terms(variables, table, value, literal, connector):
+    table = as_truth_table(table, variables)
+    for index in table.indices(value):
+        yield "(" + connector.join(literal(var, bit) for var, bit in zip(variables, table.values(index))) + ")"
+
+
+def sdnf_terms(variables, table):
+    """Конъюнкции СДНФ по одной, в порядке номеров строк"""
+    return _terms(variables, table, 1, lambda var, bit: var if bit else f"¬{var}", " ∧ ")
+
+
+def sknf_terms(variables, table):
+    """Дизъюнкции СКНФ по одной, в порядке номеров строк"""
+    return _terms(variables, table, 0, lambda var, bit: f"¬{var}" if bit else var, " ∨ ")
+
+
+def write_terms(out, terms, separator, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Запись термов через separator порциями; возвращает число термов"""
+    buffer = []
+    buffered = 0
+    count = 0
+    for term in terms:
+        if count:
+            buffer.append(separator)
+            buffered += len(separator)
+        buffer.append(term)
+        buffered += len(term)
+        count += 1
+        if buffered >= chunk_size:
+            out.write("".join(buffer))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        out.write("".join(buffer))
+    return count
+
+
+def write_sdnf(out, variables, table, chunk_size=DEFAULT_CHUNK_SIZE):
+    return write_terms(out, sdnf_terms(variables, table), " ∨ ", chunk_size)
+
+
+def write_sknf(out, variables, table, chunk_size=DEFAULT_CHUNK_SIZE):
+    return write_terms(out, sknf_terms(variables, table), " ∧ ", chunk_size)
+
+
+def encode_varint(value, buffer):
+    """Дописывает неотрицательное целое в buffer в кодировке LEB128"""
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def write_numeric_form(out, variables, table, value=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Числовая форма (номера строк со значением value) в двоичный поток out
+
+    Формат: varint числа переменных, varint числа номеров, затем для
+    каждого номера varint разности с предыдущим номером минус один.
+    Возвращает число записанных байт.
+    """
+    table = as_truth_table(table, variables)
+    buffer = bytearray()
+    encode_varint(len(variables), buffer)
+    encode_varint(table.count(value), buffer)
+    written = 0
+    previous = -1
+    for index in table.indices(value):
+        encode_varint(index - previous - 1, buffer)
+        previous = index
+        if len(buffer) >= chunk_size:
+            out.write(bytes(buffer))
+            written += len(buffer)
+            buffer.clear()
+    out.write(bytes(buffer))
+    return written + len(buffer)
+
+
+def _read_varint(data):
+    value = 0
+    shift = 0
+    while True:
+        byte = data.read(1)
+        if not byte:
+            raise ValueError("Truncated numeric form")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def read_numeric_form(data):
+    """Число переменных и генератор номеров строк из потока write_numeric_form"""
+    variables = _read_varint(data)
+    count = _read_varint(data)
+
+    def indices():
+        index = -1
+        for _ in range(count):
+            index += _read_varint(data) + 1
+            yield index
+    return variables, indices()
\ No newline at end of file
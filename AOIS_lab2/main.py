@@ -1,4 +1,9 @@
-from itertools import product
+import sys
+
+from canonical_forms import sdnf_terms, sknf_terms, write_sdnf, write_sknf
+from expression import ExpressionError, compile_expression, evaluate, find_variables
+from expression_cache import cached_truth_table, table_cached
+from truth_table import as_truth_table, evaluate_table
 
 
 def parse_expression(expr):
@@ -14,107 +19,77 @@ def parse_expression(expr):
 
 def evaluate_expression(expr, variables):
     """Вычисляет значение логического выражения для заданных значений переменных"""
-    env = variables.copy()
     try:
-        return int(eval(expr, {}, env))
-    except:
+        return evaluate(expr, variables)
+    except ExpressionError:
         return None
 
 
 def get_variables(expr):
     """Извлекает переменные из выражения"""
-    variables = set()
-    for c in expr:
-        if c.islower() and c >= 'a' and c <= 'e':
-            variables.add(c)
-    return sorted(variables)
+    return find_variables(expr)
 
 
-def generate_truth_table(expr):
-    """Генерирует таблицу истинности для выражения"""
-    variables = get_variables(expr)
-    parsed_expr = parse_expression(expr)
+def generate_truth_table(expr, variables=None, dont_care=()):
+    """Генерирует таблицу истинности для выражения
 
-    table = []
-    for values in product([0, 1], repeat=len(variables)):
-        row = dict(zip(variables, values))
-        result = evaluate_expression(parsed_expr, row)
-        if result is not None:
-            row['result'] = result
-            table.append(row)
-    return variables, table
+    variables задаёт порядок переменных (старшая - первая); по умолчанию по алфавиту.
+    Строки с номерами из dont_care безразличны и не входят ни в СДНФ, ни в СКНФ.
+    Некорректное выражение или переменная вне variables - ExpressionError.
+    """
+    variables = list(variables) if variables is not None else get_variables(expr)
+    # Выражение разбирается и компилируется один раз для всех строк,
+    # а выражения с одинаковым каноническим деревом - один раз вообще
+    table = cached_truth_table(expr, variables,
+                               lambda: evaluate_table(compile_expression(expr, variables), variables))
+    return variables, table.with_dont_care(dont_care) if dont_care else table
 
 
+@table_cached
 def build_sdnf(variables, table):
     """Строит СДНФ по таблице истинности"""
-    terms = []
-    for row in table:
-        if row['result'] == 1:
-            term = []
-            for var in variables:
-                if row[var] == 0:
-                    term.append(f"¬{var}")
-                else:
-                    term.append(var)
-            terms.append(" ∧ ".join(term))
-    return " ∨ ".join(f"({term})" for term in terms)
+    return " ∨ ".join(sdnf_terms(variables, table))
 
 
+@table_cached
 def build_sknf(variables, table):
     """Строит СКНФ по таблице истинности"""
-    terms = []
-    for row in table:
-        if row['result'] == 0:
-            term = []
-            for var in variables:
-                if row[var] == 1:
-                    term.append(f"¬{var}")
-                else:
-                    term.append(var)
-            terms.append(" ∨ ".join(term))
-    return " ∧ ".join(f"({term})" for term in terms)
+    return " ∧ ".join(sknf_terms(variables, table))
 
 
 def numeric_forms(variables, table):
     """Возвращает числовые формы СДНФ и СКНФ"""
-    sdnf_numbers = []
-    sknf_numbers = []
-
-    for i, row in enumerate(table):
-        if row['result'] == 1:
-            sdnf_numbers.append(i)
-        else:
-            sknf_numbers.append(i)
-
-    return sdnf_numbers, sknf_numbers
+    table = as_truth_table(table, variables)
+    return list(table.indices(1)), list(table.indices(0))
 
 
 def index_form(table):
     """Вычисляет индексную форму функции"""
-    index = 0
-    for i, row in enumerate(table):
-        if row['result'] == 1:
-            index += 2 ** i
-    return index
+    # Разряд i битового множества - значение функции в строке i
+    return as_truth_table(table).bits
 
 
 def main():
     expr = input("Введите логическую функцию: ")
-    variables, table = generate_truth_table(expr)
+    try:
+        variables, table = generate_truth_table(expr)
+    except ExpressionError as error:
+        print(f"Ошибка в выражении: {error}")
+        return
 
     print("\nТаблица истинности:")
     print(" ".join(variables) + " | result")
-    print("-" * (len(variables) * 2 + 7))
+    print("-" * (sum(len(var) + 1 for var in variables) + 7))
     for row in table:
-        print(" ".join(str(row[var]) for var in variables) + " | " + str(row['result']))
-
-    sdnf = build_sdnf(variables, table)
-    sknf = build_sknf(variables, table)
+        print(" ".join(str(row[var]).rjust(len(var)) for var in variables) + " | " + str(row['result']))
 
+    # Формы пишутся в stdout порциями, не собираясь в одну строку
     print("\nСовершенная дизъюнктивная нормальная форма (СДНФ):")
-    print(sdnf)
+    write_sdnf(sys.stdout, variables, table)
+    print()
     print("\nСовершенная конъюнктивная нормальная форма (СКНФ):")
-    print(sknf)
+    write_sknf(sys.stdout, variables, table)
+    print()
 
     sdnf_nums, sknf_nums = numeric_forms(variables, table)
     print("\nЧисловые формы:")
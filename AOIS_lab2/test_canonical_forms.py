@@ -0,0 +1,88 @@
+import io
+import tracemalloc
+import unittest
+from itertools import product
+
+from canonical_forms import (
+    sdnf_terms, sknf_terms, write_sdnf, write_sknf, write_terms,
+    encode_varint, write_numeric_form, read_numeric_form,
+)
+from expression import compile_expression
+from truth_table import TruthTable, evaluate_table
+
+
+class _Chunks:
+    """Поток, запоминающий размеры порций"""
+
+    def __init__(self):
+        self.sizes = []
+
+    def write(self, text):
+        self.sizes.append(len(text))
+
+
+class TestCanonicalForms(unittest.TestCase):
+    def setUp(self):
+        self.variables = ['a', 'b']
+        self.table = TruthTable(self.variables, 0b0110)
+
+    def test_terms(self):
+        self.assertEqual(list(sdnf_terms(self.variables, self.table)), ["(¬a ∧ b)", "(a ∧ ¬b)"])
+        self.assertEqual(list(sknf_terms(self.variables, self.table)), ["(a ∨ b)", "(¬a ∨ ¬b)"])
+
+    def test_write_forms(self):
+        out = io.StringIO()
+        self.assertEqual(write_sdnf(out, self.variables, self.table), 2)
+        self.assertEqual(out.getvalue(), "(¬a ∧ b) ∨ (a ∧ ¬b)")
+        out = io.StringIO()
+        write_sknf(out, self.variables, [{'a': a, 'b': b, 'result': 1} for a, b in product([0, 1], repeat=2)])
+        self.assertEqual(out.getvalue(), "")
+
+    def test_chunked_writes(self):
+        out = _Chunks()
+        count = write_terms(out, (f"t{i}" for i in range(1000)), " | ", chunk_size=100)
+        self.assertEqual(count, 1000)
+        self.assertGreater(len(out.sizes), 30)
+        self.assertLess(max(out.sizes), 110)
+
+    def test_varint(self):
+        buffer = bytearray()
+        for value in (0, 127, 128, 300, 2 ** 24):
+            encode_varint(value, buffer)
+        self.assertEqual(bytes(buffer), b'\x00\x7f\x80\x01\xac\x02\x80\x80\x80\x08')
+
+    def test_numeric_form_round_trip(self):
+        variables = [f'x{i}' for i in range(12)]
+        table = evaluate_table(compile_expression("x0 & !x3 | x5 ~ x11", variables), variables)
+        for value in (1, 0):
+            out = io.BytesIO()
+            size = write_numeric_form(out, variables, table, value, chunk_size=64)
+            self.assertEqual(size, len(out.getvalue()))
+            n, indices = read_numeric_form(io.BytesIO(out.getvalue()))
+            self.assertEqual(n, 12)
+            self.assertEqual(list(indices), list(table.indices(value)))
+        # Соседние номера занимают по байту
+        self.assertLess(size, table.count(0) + 8)
+
+    def test_truncated_numeric_form(self):
+        out = io.BytesIO()
+        write_numeric_form(out, self.variables, self.table)
+        _, indices = read_numeric_form(io.BytesIO(out.getvalue()[:-1]))
+        with self.assertRaises(ValueError):
+            list(indices)
+
+    def test_streaming_memory_is_flat(self):
+        peaks = []
+        for n in (12, 16):
+            variables = [f'x{i}' for i in range(n)]
+            table = evaluate_table(compile_expression("x0 | !x1", variables), variables)
+            tracemalloc.start()
+            write_sdnf(_Chunks(), variables, table, chunk_size=4096)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        # Таблица выросла в 16 раз, пиковая память - нет
+        self.assertLess(peaks[1], 2 * peaks[0] + 8192)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
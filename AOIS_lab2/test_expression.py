@@ -0,0 +1,84 @@
+import unittest
+from itertools import product
+
+from expression import (
+    ExpressionError, MAX_DEPTH, Var, Const, Not, BinOp,
+    tokenize, parse, find_variables, variables_of, canonical_text, compile_expression, evaluate,
+)
+
+
+class TestExpression(unittest.TestCase):
+    def test_tokenize_aliases(self):
+        kinds = [(t.kind, t.value) for t in tokenize("not a and b <= c")]
+        self.assertEqual(kinds, [('op', '!'), ('name', 'a'), ('op', '&'), ('name', 'b'),
+                                 ('op', '->'), ('name', 'c'), ('end', None)])
+        self.assertEqual([t.value for t in tokenize("¬a ∧ b ∨ c → d ↔ 1")][:-1],
+                         ['!', 'a', '&', 'b', '|', 'c', '->', 'd', '~', 1])
+
+    def test_parse_precedence(self):
+        self.assertEqual(parse("!a & b | c"),
+                         BinOp('|', BinOp('&', Not(Var('a')), Var('b')), Var('c')))
+        self.assertEqual(parse("a -> b -> c"),
+                         BinOp('->', Var('a'), BinOp('->', Var('b'), Var('c'))))
+        self.assertEqual(parse("a | b -> c ~ 0"),
+                         BinOp('~', BinOp('->', BinOp('|', Var('a'), Var('b')), Var('c')), Const(0)))
+        self.assertEqual(parse("((a))"), Var('a'))
+
+    def test_syntax_errors(self):
+        for text in ["", "a &", "(a", "a)", "a b", "a # b", "a & 2", "!"]:
+            with self.assertRaises(ExpressionError, msg=text):
+                parse(text)
+
+    def test_nesting_limit(self):
+        self.assertEqual(parse("(" * MAX_DEPTH + "a" + ")" * MAX_DEPTH), Var('a'))
+        with self.assertRaises(ExpressionError):
+            parse("!" * (MAX_DEPTH + 1) + "a")
+
+    def test_variables_of(self):
+        self.assertEqual(variables_of(parse("c & (a | !b) -> a")), ['a', 'b', 'c'])
+        self.assertEqual(variables_of(parse("1 | 0")), [])
+
+    def test_canonical_text(self):
+        self.assertEqual(canonical_text(parse("b and (c | a) or ¬d")), "(!d | ((a | c) & b))")
+        self.assertEqual(canonical_text(parse("c ~ (a ~ b)")), canonical_text(parse("a ~ b ~ c")))
+        self.assertNotEqual(canonical_text(parse("a -> b")), canonical_text(parse("b -> a")))
+
+    def test_find_variables(self):
+        self.assertEqual(find_variables("req0 & !grant_n | req10 -> req0"), ['grant_n', 'req0', 'req10'])
+        self.assertEqual(find_variables("a and not b or x_1"), ['a', 'b', 'x_1'])
+        self.assertEqual(find_variables("1 & 2 &"), [])
+
+    def test_compiled_matches_python(self):
+        cases = {
+            "a & b | !c": lambda a, b, c: (a and b) or not c,
+            "a -> b -> c": lambda a, b, c: not a or not b or c,
+            "a ~ b ~ c": lambda a, b, c: (a == b) == c,
+            "(a ~ b) ~ (c ~ a)": lambda a, b, c: (a == b) == (c == a),
+            "!(a | b) & 1": lambda a, b, c: not (a or b),
+        }
+        for text, expected in cases.items():
+            function = compile_expression(text, ['a', 'b', 'c'])
+            for values in product([0, 1], repeat=3):
+                self.assertEqual(function(*values), int(expected(*values)), (text, values))
+
+    def test_unknown_variable(self):
+        with self.assertRaises(ExpressionError):
+            compile_expression("a & x", ['a'])
+        with self.assertRaises(ExpressionError):
+            evaluate("a & b", {'a': 1})
+
+    def test_long_expression(self):
+        text = " | ".join(f"(a & !b & c{i})" for i in range(3000))
+        variables = variables_of(parse(text))
+        function = compile_expression(text, variables)
+        self.assertEqual(function(1, 0, *[0] * 2999, 1), 1)
+        self.assertEqual(function(1, 1, *[1] * 3000), 0)
+
+    def test_no_code_injection(self):
+        for text in ["__import__('os')", "a.b", "a; b", "a[0]"]:
+            with self.assertRaises(ExpressionError, msg=text):
+                evaluate(text, {'a': 1, 'b': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,4 +1,6 @@
 import unittest
+from itertools import product
+from expression_cache import configure_cache
 from main import parse_expression, evaluate_expression, get_variables, generate_truth_table
 from main import build_sdnf, build_sknf, numeric_forms, index_form
 
@@ -89,7 +91,7 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(build_sknf(vars, table), "(a ∨ b)")
 
         # Нет ложных значений
-        table_all_true = [{'a': 1, 'b': 1, 'result': 1}] * 4
+        table_all_true = [{'a': a, 'b': b, 'result': 1} for a, b in product([0, 1], repeat=2)]
         self.assertEqual(build_sknf(vars, table_all_true), "")
 
     # Тесты для numeric_forms()
@@ -128,6 +130,29 @@ class TestLogicFunctions(unittest.TestCase):
         table_all_false = [{'result': 0}] * 4
         self.assertEqual(index_form(table_all_false), 0)
 
+    # Формы по TruthTable совпадают с формами по списку словарей
+    def test_forms_from_truth_table(self):
+        # Без кэша формы по списку строк вычисляются заново, а не берутся копией первого результата
+        configure_cache(maxbytes=0)
+        self.addCleanup(configure_cache)
+        vars, table = generate_truth_table("(a -> b) & !(c ~ a)")
+        rows = list(table)
+        self.assertEqual(build_sdnf(vars, table), build_sdnf(vars, rows))
+        self.assertEqual(build_sknf(vars, table), build_sknf(vars, rows))
+        self.assertEqual(numeric_forms(vars, table), numeric_forms(vars, rows))
+        self.assertEqual(index_form(table), index_form(rows))
+        self.assertEqual(numeric_forms(vars, table), ([1, 3, 6], [0, 2, 4, 5, 7]))
+
+    def test_forms_from_reordered_and_partial_rows(self):
+        configure_cache(maxbytes=0)
+        self.addCleanup(configure_cache)
+        rows = [{'a': 0, 'b': 0, 'result': 0}, {'a': 1, 'b': 1, 'result': 1}, {'a': 0, 'b': 1, 'result': 0}]
+        # Отсутствующая строка a=1, b=0 ложна
+        self.assertEqual(build_sdnf(['a', 'b'], rows), "(a ∧ b)")
+        self.assertEqual(build_sknf(['a', 'b'], rows), "(a ∨ b) ∧ (a ∨ ¬b) ∧ (¬a ∨ b)")
+        self.assertEqual(build_sdnf(['a', 'b'], [{'a': 1, 'b': 1, 'result': 1}]), "(a ∧ b)")
+        self.assertEqual(build_sdnf(['a', 'b'], rows[::-1]), build_sdnf(['a', 'b'], rows))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
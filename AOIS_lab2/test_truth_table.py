@@ -0,0 +1,125 @@
+import sys
+import unittest
+from itertools import product
+
+from expression import compile_expression
+from truth_table import DONT_CARE, MAX_VARIABLES, TruthTable, as_truth_table, evaluate_table, variable_masks
+
+
+class TestTruthTable(unittest.TestCase):
+    def test_variable_masks(self):
+        self.assertEqual(variable_masks(3), (0b11110000, 0b11001100, 0b10101010))
+        self.assertEqual(variable_masks(1), (0b10,))
+        self.assertEqual(variable_masks(0), ())
+
+    def test_matches_row_by_row(self):
+        variables = ['a', 'b', 'c', 'd']
+        function = compile_expression("(a -> b) & !(c ~ d) | a & d", variables)
+        table = evaluate_table(function, variables)
+        self.assertEqual(len(table), 16)
+        for i, values in enumerate(product([0, 1], repeat=4)):
+            expected = dict(zip(variables, values), result=function(*values))
+            self.assertEqual(table[i], expected)
+
+    def test_list_compatibility(self):
+        table = TruthTable(['a', 'b'], 0b1000)
+        rows = [{'a': 0, 'b': 0, 'result': 0}, {'a': 0, 'b': 1, 'result': 0},
+                {'a': 1, 'b': 0, 'result': 0}, {'a': 1, 'b': 1, 'result': 1}]
+        self.assertEqual(table, rows)
+        self.assertEqual(list(table), rows)
+        self.assertEqual(table[-1], rows[-1])
+        self.assertEqual(table[1:3], rows[1:3])
+        self.assertNotEqual(table, rows[:3])
+        self.assertEqual(TruthTable(['a'], 0, size=0), [])
+        with self.assertRaises(IndexError):
+            table[4]
+
+    def test_indices_and_count(self):
+        table = TruthTable(['a', 'b', 'c'], 0b10110010)
+        self.assertEqual(list(table.indices()), [1, 4, 5, 7])
+        self.assertEqual(list(table.indices(0)), [0, 2, 3, 6])
+        self.assertEqual((table.count(), table.count(0)), (4, 4))
+        self.assertEqual(table.values(6), (1, 1, 0))
+        self.assertEqual([table.result(i) for i in range(8)], [0, 1, 0, 0, 1, 1, 0, 1])
+        # Неполный последний байт не даёт лишних ложных строк
+        self.assertEqual(list(TruthTable(['a'], 0b10).indices(0)), [0])
+
+    def test_from_rows(self):
+        rows = [{'a': 0, 'result': 1}, {'a': 1, 'result': 0}]
+        table = as_truth_table(rows, ['a'])
+        self.assertEqual(table, TruthTable(['a'], 0b01))
+        self.assertIs(as_truth_table(table), table)
+        # Номер строки - по значениям переменных, а не по позиции в списке
+        rows = [{'a': 1, 'b': 1, 'result': 1}, {'a': 0, 'b': 1, 'result': 0}]
+        self.assertEqual(as_truth_table(rows, ['a', 'b']), TruthTable(['a', 'b'], 0b1000))
+        self.assertEqual(as_truth_table(rows, ['b', 'a']), TruthTable(['b', 'a'], 0b1000))
+        self.assertEqual(as_truth_table(rows).variables, ['a', 'b'])
+        self.assertEqual(as_truth_table([{'result': 1}]), TruthTable([], 1))
+        self.assertEqual(as_truth_table([{'result': 1}, {'result': 0}]).bits, 0b01)
+        with self.assertRaises(ValueError):
+            as_truth_table([{'result': 1}] * 3)
+        with self.assertRaises(ValueError):
+            as_truth_table([{'a': 0, 'result': 1}, {'a': 0, 'result': 0}], ['a'])
+        with self.assertRaises(ValueError):
+            as_truth_table([{'a': 0, 'result': 1}] * 3, ['a'])
+        with self.assertRaises(ValueError):
+            as_truth_table([{'a': 0, 'result': 1}], ['a', 'b'])
+
+    def test_dont_care(self):
+        table = TruthTable(['a', 'b', 'c'], 0b10110010).with_dont_care([0, 5])
+        self.assertEqual(list(table.indices()), [1, 4, 7])
+        self.assertEqual(list(table.indices(0)), [2, 3, 6])
+        self.assertEqual(list(table.dont_cares()), [0, 5])
+        self.assertEqual((table.count(), table.count(0)), (3, 3))
+        self.assertEqual(table[5]['result'], DONT_CARE)
+        self.assertTrue(table.is_dont_care(0))
+        self.assertFalse(table.is_dont_care(1))
+        self.assertEqual(as_truth_table(list(table), table.variables), table)
+        self.assertNotEqual(table, TruthTable(['a', 'b', 'c'], 0b10010010))
+        self.assertEqual(TruthTable(['a'], 0b11, dont_care=0b01).bits, 0b10)
+        with self.assertRaises(ValueError):
+            table.with_dont_care([8])
+
+    def test_compact_storage(self):
+        variables = [f'x{i}' for i in range(16)]
+        table = evaluate_table(compile_expression("x0 ~ x15", variables), variables)
+        self.assertEqual(table.nbytes, 2 ** 16 // 8)
+        self.assertEqual(table.count(), 2 ** 15)
+        self.assertEqual(sum(1 for _ in table.indices()), 2 ** 15)
+
+    def test_constant(self):
+        table = evaluate_table(compile_expression("1", []), [])
+        self.assertEqual(list(table), [{'result': 1}])
+
+    def test_twenty_variables(self):
+        variables = [f'x{i}' for i in range(20)]
+        text = " | ".join(f"({variables[i]} & !{variables[(i + 1) % 20]})" for i in range(20))
+        function = compile_expression(text, variables)
+        table = evaluate_table(function, variables)
+        # Ложь только в строках, где все переменные равны
+        self.assertEqual(table.bits.bit_count(), 2 ** 20 - 2)
+        self.assertEqual(table.result(0), 0)
+        self.assertEqual(table.result(2 ** 20 - 1), 0)
+        self.assertEqual(table.result(1), 1)
+
+    def test_named_signals_at_limit(self):
+        variables = [f'req{i}' for i in range(MAX_VARIABLES - 1)] + ['grant_n']
+        text = "grant_n -> (" + " | ".join(variables[:-1]) + ")"
+        table = evaluate_table(compile_expression(text, variables), variables)
+        self.assertEqual(len(table), 2 ** 24)
+        # Ложь только при grant_n = 1 и всех req = 0
+        self.assertEqual(table.bits.bit_count(), 2 ** 24 - 1)
+        self.assertEqual(table.result(1), 0)
+        # Около 2 МБ: длинное целое хранит по 30 разрядов в 4 байтах
+        self.assertLess(sys.getsizeof(table.bits), 2.5 * 2 ** 20)
+
+    def test_variable_limits(self):
+        variables = [f'x{i}' for i in range(MAX_VARIABLES + 1)]
+        with self.assertRaises(ValueError):
+            evaluate_table(compile_expression("x0", variables), variables)
+        with self.assertRaises(ValueError):
+            evaluate_table(compile_expression("a", ['a', 'a']), ['a', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
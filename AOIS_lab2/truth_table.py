@@ -0,0 +1,222 @@
+"""Таблица истинности в виде битового множества.
+
+Строке i таблицы соответствует i-й разряд целого числа bits; первая
+переменная - старший разряд номера строки, как в itertools.product.
+Каждая переменная задаётся маской из 2 ** n разрядов (для a, b, c:
+a = 0b11110000, b = 0b11001100, c = 0b10101010), поэтому вся таблица
+вычисляется скомпилированным выражением за несколько операций &, |, ^
+над длинными целыми на каждый узел дерева, без цикла по строкам.
+
+Безразличные строки (don't care) хранятся отдельным битовым множеством
+dont_care: в bits они равны 0 и не входят ни в истинные, ни в ложные.
+"""
+from functools import lru_cache
+
+# Таблица из 2 ** 24 строк занимает 2 МБ
+MAX_VARIABLES = 24
+# Значение функции в безразличной строке
+DONT_CARE = '-'
+
+
+@lru_cache(maxsize=32)
+def variable_masks(n):
+    """Маски разрядов n переменных: строки, в которых переменная равна 1"""
+    size = 1 << n
+    masks = []
+    for j in range(n):
+        period = 1 << (n - 1 - j)
+        mask = ((1 << period) - 1) << period
+        # Блок длины 2 * period удваивается сдвигом, пока не заполнит все строки
+        width = 2 * period
+        while width < size:
+            mask |= mask << width
+            width *= 2
+        masks.append(mask)
+    return tuple(masks)
+
+
+def evaluate_table(function, variables):
+    """Таблица истинности скомпилированного выражения function(*values, one=...)"""
+    n = len(variables)
+    if n > MAX_VARIABLES:
+        raise ValueError(f"At most {MAX_VARIABLES} variables are supported, got {n}")
+    if len(set(variables)) != n:
+        raise ValueError("Variable names must be unique")
+    full = (1 << (1 << n)) - 1
+    return TruthTable(variables, function(*variable_masks(n), one=full) & full)
+
+
+def _row_index(row, variables):
+    index = 0
+    for name in variables:
+        value = row.get(name)
+        if value not in (0, 1):
+            raise ValueError(f"Row {row!r} has no 0/1 value for {name!r}")
+        index = index << 1 | value
+    return index
+
+
+# Номера единичных разрядов каждого байта
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+class TruthTable:
+    """Значения функции во всех 2 ** n строках, упакованные в битовое множество
+
+    Столбец результата хранится в bytes (разряд i - строка i), поэтому
+    значение строки читается за O(1), а номера истинных и ложных строк
+    перечисляются побайтно. Для старого кода таблица совместима со списком
+    словарей строк: len, индекс, итерация и сравнение со списком создают
+    словари {переменная: значение, 'result': ...} только при обращении.
+    """
+
+    def __init__(self, variables, bits, size=None, dont_care=0):
+        self.variables = list(variables)
+        self.size = 1 << len(self.variables) if size is None else size
+        full = (1 << self.size) - 1
+        self.dont_care = dont_care & full
+        self.bits = bits & full & ~self.dont_care
+        self._data = self._bytes(self.bits)
+
+    @classmethod
+    def from_rows(cls, variables, rows):
+        """Таблица из списка словарей строк
+
+        Номер строки берётся из значений переменных (первая - старший разряд),
+        а не из позиции в списке: строки могут идти в любом порядке, а
+        отсутствующие строки ложны. Без variables переменными считаются
+        ключи первой строки, кроме 'result'; строки из одного 'result'
+        нумеруются по позиции, и их число должно быть степенью двойки.
+        """
+        rows = list(rows)
+        if not variables and rows:
+            variables = [name for name in rows[0] if name != 'result']
+        variables = list(variables)
+        if variables or len(rows) <= 1:
+            size = 1 << len(variables)
+            if len(rows) > size:
+                raise ValueError(f"{len(rows)} rows do not fit a table of {size} rows")
+            indexed = ((_row_index(row, variables), row) for row in rows)
+        else:
+            size = len(rows)
+            if size & (size - 1):
+                raise ValueError(f"{size} positional rows are not a power of two")
+            indexed = enumerate(rows)
+        data = bytearray((size + 7) // 8)
+        dont_care = bytearray(len(data))
+        seen = bytearray(len(data))
+        for i, row in indexed:
+            byte, bit = i >> 3, 1 << (i & 7)
+            result = DONT_CARE if row['result'] == DONT_CARE else int(bool(row['result']))
+            if seen[byte] & bit:
+                # Повтор строки допустим, только если значение то же
+                previous = DONT_CARE if dont_care[byte] & bit else int(bool(data[byte] & bit))
+                if previous != result:
+                    raise ValueError(f"Row {i} is listed twice with different results")
+                continue
+            seen[byte] |= bit
+            if result == DONT_CARE:
+                dont_care[byte] |= bit
+            elif result:
+                data[byte] |= bit
+        return cls(variables, int.from_bytes(data, 'little'), size=size,
+                   dont_care=int.from_bytes(dont_care, 'little'))
+
+    def with_dont_care(self, indices):
+        """Копия таблицы, в которой строки indices безразличны"""
+        dont_care = self.dont_care
+        for index in indices:
+            if not 0 <= index < self.size:
+                raise ValueError(f"Row {index} is out of range for {self.size} rows")
+            dont_care |= 1 << index
+        return TruthTable(self.variables, self.bits, self.size, dont_care)
+
+    @property
+    def nbytes(self):
+        """Объём столбца результата в байтах"""
+        return len(self._data)
+
+    def result(self, index):
+        """Значение функции в строке index (в безразличной строке - 0)"""
+        return self._data[index >> 3] >> (index & 7) & 1
+
+    def is_dont_care(self, index):
+        return self.dont_care >> index & 1 == 1
+
+    def values(self, index):
+        """Значения переменных в строке index (первая переменная - старший разряд)"""
+        n = len(self.variables)
+        return tuple((index >> (n - 1 - j)) & 1 for j in range(n))
+
+    def indices(self, value=1):
+        """Номера строк, в которых функция равна value, по возрастанию"""
+        if value:
+            data, flip = self._data, 0
+        elif self.dont_care:
+            data, flip = self._bytes(self.bits | self.dont_care), 0xFF
+        else:
+            data, flip = self._data, 0xFF
+        for position, byte in enumerate(data):
+            byte ^= flip
+            if byte:
+                base = position << 3
+                for bit in _BYTE_BITS[byte]:
+                    index = base + bit
+                    if index >= self.size:
+                        return
+                    yield index
+
+    def dont_cares(self):
+        """Номера безразличных строк по возрастанию"""
+        for position, byte in enumerate(self._bytes(self.dont_care)):
+            base = position << 3
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+    def count(self, value=1):
+        """Число строк, в которых функция равна value"""
+        ones = self.bits.bit_count()
+        return ones if value else self.size - ones - self.dont_care.bit_count()
+
+    def _bytes(self, mask):
+        return mask.to_bytes((self.size + 7) // 8, 'little')
+
+    def row(self, index):
+        row = dict(zip(self.variables, self.values(index)))
+        row['result'] = DONT_CARE if self.is_dont_care(index) else self.result(index)
+        return row
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(self.size)[index]]
+        return self.row(range(self.size)[index])
+
+    def __iter__(self):
+        return (self.row(i) for i in range(self.size))
+
+    def __eq__(self, other):
+        if isinstance(other, TruthTable):
+            return ((self.variables, self.size, self.bits, self.dont_care)
+                    == (other.variables, other.size, other.bits, other.dont_care))
+        if isinstance(other, list):
+            return len(other) == self.size and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        if self.dont_care:
+            return f"TruthTable({self.variables!r}, {self.bits:#x}, dont_care={self.dont_care:#x})"
+        return f"TruthTable({self.variables!r}, {self.bits:#x})"
+
+    def __reduce__(self):
+        # Сохраняются только битовые множества; _data восстанавливается конструктором
+        return TruthTable, (self.variables, self.bits, self.size, self.dont_care)
+
+
+def as_truth_table(table, variables=()):
+    """TruthTable как есть; список словарей строк упаковывается в TruthTable"""
+    if isinstance(table, TruthTable):
+        return table
+    return TruthTable.from_rows(variables, table)
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""Замеры производительности лабораторной работы 3.
+
+Запуск: python benchmark.py [--variables N] [--section имя]
+"""
+import argparse
+import random
+import time
+
+from expression_cache import configure_cache
+from cover import minimum_cover
+from minimizator import (
+    build_prime_implicant_chart, calc_skleivanie, minimize_espresso, minimize_expression, term_to_bin,
+)
+from pla import minimize_outputs
+from quine_mccluskey import prime_implicants, to_binary
+from truth_table import TruthTable
+
+# Дальше попарное склеивание строк работает минутами
+LEGACY_MAX_VARIABLES = 10
+
+
+def measure(func, *args, repeat=3):
+    """Лучшее время выполнения func(*args) из repeat запусков"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def sample_indices(n, density=0.5, seed=0):
+    """Номера истинных строк случайной функции n переменных"""
+    rng = random.Random(seed)
+    return [i for i in range(2 ** n) if rng.random() < density]
+
+
+def legacy_primes(indices, n):
+    # Прежний путь: попарное сравнение строк на каждой стадии
+    current = {term_to_bin(i, n) for i in indices}
+    primes = set()
+    while True:
+        merged, remaining = calc_skleivanie(list(current))
+        primes |= remaining
+        if not merged:
+            return sorted(primes)
+        current = merged | remaining
+
+
+def bench_primes(n):
+    """Простые импликанты: строки попарно против групп по числу единиц"""
+    rows = []
+    legacy_n = min(n, LEGACY_MAX_VARIABLES)
+    indices = sample_indices(legacy_n)
+    rows.append((f'primes/legacy n={legacy_n}', 2 ** legacy_n, measure(legacy_primes, indices, legacy_n, repeat=1)))
+    rows.append((f'primes/bitmask n={legacy_n}', 2 ** legacy_n, measure(prime_implicants, indices, legacy_n)))
+    for size in sorted({12, n} - {legacy_n}):
+        indices = sample_indices(size)
+        rows.append((f'primes/bitmask n={size}', 2 ** size, measure(prime_implicants, indices, size)))
+    return rows
+
+
+def legacy_cover(primes, terms):
+    # Прежний выбор: обязательные импликанты, затем первая покрывающая непокрытый терм
+    chart = build_prime_implicant_chart(primes, terms)
+    chosen = []
+    covered = set()
+    for m in terms:
+        if len(chart[m]) == 1 and m not in covered:
+            chosen.append(chart[m][0])
+            covered.update(m2 for m2 in terms if chart[m][0] in chart[m2])
+    for m in terms:
+        if m not in covered:
+            for index in chart[m]:
+                if index not in chosen:
+                    chosen.append(index)
+                    covered.update(m2 for m2 in terms if index in chart[m2])
+                    break
+    return chosen
+
+
+def bench_cover(n):
+    """Выбор покрытия: прежний жадный против сокращения и ветвей и границ"""
+    rows = []
+    legacy_n = min(n, LEGACY_MAX_VARIABLES)
+    indices = sample_indices(legacy_n)
+    implicants = prime_implicants(indices, legacy_n)
+    primes = [to_binary(implicant, legacy_n) for implicant in implicants]
+    terms = [term_to_bin(i, legacy_n) for i in indices]
+    chosen = legacy_cover(primes, terms)
+    literals = sum(len(primes[i]) - primes[i].count('-') for i in chosen)
+    rows.append((f'cover/legacy n={legacy_n} terms={len(chosen)} literals={literals}', 2 ** legacy_n,
+                 measure(legacy_cover, primes, terms, repeat=1)))
+    for size in sorted({legacy_n, n}):
+        indices = sample_indices(size, density=0.1 if size > 12 else 0.5)
+        implicants = prime_implicants(indices, size)
+        cover = minimum_cover(implicants, indices, size)
+        name = f'cover/exact n={size} terms={len(cover.rows)} literals={cover.literals}'
+        if not cover.exact:
+            name += ' (budget)'
+        rows.append((name, 2 ** size, measure(minimum_cover, implicants, indices, size, repeat=1)))
+    return rows
+
+
+def expression_families(n):
+    """Структурированные функции n переменных, для которых таблица истинности не строится"""
+    names = [f'x{i}' for i in range(n)]
+    return names, {
+        'and-or': " | ".join(f"(x{i} & x{(i + 1) % n} & !x{(i + 7) % n})" for i in range(n)),
+        'implications': " & ".join(f"(x{i} -> x{i + 1})" for i in range(min(n, 24) - 1)),
+        'parity-pairs': " | ".join(f"((x{i} ~ x{i + 1}) & x{(i + 2) % n})" for i in range(0, n - 1, 2)),
+    }
+
+
+def exact_cover(indices, n):
+    return minimum_cover(prime_implicants(indices, n), indices, n)
+
+
+def bench_espresso(n):
+    """Espresso: таблица против точного покрытия, выражения до 32 переменных без таблицы"""
+    rows = []
+    size = min(n, LEGACY_MAX_VARIABLES)
+    indices = sample_indices(size)
+    variables = [f'x{i}' for i in range(size)]
+    table = TruthTable(variables, sum(1 << i for i in indices))
+    cover = exact_cover(indices, size)
+    name = f'espresso/exact n={size} terms={len(cover.rows)}'
+    if not cover.exact:
+        name += ' (budget)'
+    rows.append((name, 2 ** size,
+                 measure(exact_cover, indices, size, repeat=1)))
+    letters, _ = minimize_espresso(variables, table)
+    rows.append((f'espresso/table n={size} terms={len(letters)}', 2 ** size,
+                 measure(minimize_espresso, variables, table, repeat=1)))
+    width = max(n, 32)
+    names, families = expression_families(width)
+    for family, text in families.items():
+        _, letters, _ = minimize_expression(text, names)
+        rows.append((f'espresso/{family} n={width} terms={len(letters)}', len(text),
+                     measure(minimize_expression, text, names)))
+    return rows
+
+
+def dont_care_function(n, dont_care=0.3, seed=0):
+    """Случайная функция: доля dont_care строк безразлична, остальные истинны или ложны поровну"""
+    rng = random.Random(seed)
+    ones, dont_cares = [], []
+    for i in range(2 ** n):
+        value = rng.random()
+        if value < dont_care:
+            dont_cares.append(i)
+        elif value < (1 + dont_care) / 2:
+            ones.append(i)
+    return ones, dont_cares
+
+
+def cover_with(ones, n, dont_cares=()):
+    return minimum_cover(prime_implicants(ones, n, dont_cares), ones, n)
+
+
+def bench_dont_care(n):
+    """Безразличные строки: покрытие, когда они считаются ложными и когда доопределяются"""
+    rows = []
+    ones, dont_cares = dont_care_function(n)
+    for name, extra in (('zero', ()), ('dont-care', dont_cares)):
+        cover = cover_with(ones, n, extra)
+        label = f'dont_care/{name} n={n} terms={len(cover.rows)} literals={cover.literals}'
+        if not cover.exact:
+            label += ' (budget)'
+        rows.append((label, 2 ** n, measure(cover_with, ones, n, extra, repeat=1)))
+    return rows
+
+
+def adder_columns(width):
+    """Сумма двух чисел по width разрядов и признак a > b: width + 2 выходов"""
+    size = 1 << 2 * width
+    columns = [[0] * size for _ in range(width + 2)]
+    for i in range(size):
+        a, b = i >> width, i & ((1 << width) - 1)
+        total = a + b
+        for j in range(width + 1):
+            columns[j][i] = total >> (width - j) & 1
+        columns[width + 1][i] = int(a > b)
+    return columns
+
+
+def separate_products(columns, n):
+    # Каждый выход минимизируется отдельно, общие конъюнкции не ищутся
+    total = 0
+    for column in columns:
+        ones = [i for i, value in enumerate(column) if value]
+        total += len(minimum_cover(prime_implicants(ones, n), ones, n).rows)
+    return total
+
+
+def bench_pla(n):
+    """Система из 8 выходов от 12 входов: выходы по отдельности и с общими конъюнкциями"""
+    rows = []
+    size = 12
+    rng = random.Random(0)
+    specs = {'adder': adder_columns(size // 2)}
+    for density in (0.1, 0.5):
+        specs[f'random {density}'] = [[int(rng.random() < density) for _ in range(2 ** size)] for _ in range(8)]
+    for name, columns in specs.items():
+        products = separate_products(columns, size)
+        rows.append((f'pla/{name} separate products={products}', 2 ** size,
+                     measure(separate_products, columns, size, repeat=1)))
+        pla = minimize_outputs(columns)
+        label = f'pla/{name} shared products={len(pla.products)}'
+        if not pla.exact:
+            label += ' (budget)'
+        rows.append((label, 2 ** size, measure(minimize_outputs, columns, repeat=1)))
+    return rows
+
+
+def report(rows):
+    for name, size, value in rows:
+        print(f"{name:<52} {size:>10} {value:>10.4f} s")
+
+
+SECTIONS = {
+    'cover': bench_cover,
+    'dont_care': bench_dont_care,
+    'espresso': bench_espresso,
+    'pla': bench_pla,
+    'primes': bench_primes,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--variables', type=int, default=16)
+    parser.add_argument('--section', choices=sorted(SECTIONS), action='append',
+                        help="Раздел замеров (по умолчанию все)")
+    args = parser.parse_args()
+    # Повторные замеры не должны попадать в кэш
+    configure_cache(maxbytes=0)
+    for section in args.section or sorted(SECTIONS):
+        report(SECTIONS[section](args.variables))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,412 @@
+"""Эвристическая минимизация двухуровневых функций в духе Espresso.
+
+Функция задаётся покрытием - списком кубов (value, care) в записи
+quine_mccluskey, а не перечнем строк таблицы истинности, поэтому число
+переменных ограничено только размером покрытий, а не 2 ** n. Покрытие
+выражения строится прямо по дереву разбора (expression_cover).
+
+Цикл Espresso: EXPAND расширяет каждый куб до простой импликанты, пока
+он не пересекает OFF-множество; IRREDUNDANT удаляет кубы, покрытые
+остальными; REDUCE сжимает каждый куб до наименьшего, ещё нужного
+покрытию, давая следующему EXPAND другое направление роста. Цикл идёт,
+пока падает стоимость - число кубов, затем число литер.
+
+Дополнение покрытия и проверка тождественной истинности (tautology)
+строятся рекурсивно по разложению Шеннона по самой частой переменной,
+в которой покрытие не унатно.
+"""
+from functools import lru_cache
+
+from expression import Const, EQUIV, ExpressionError, IMPLIES, Not, OR, Var, parse, variables_of
+from truth_table import variable_masks
+
+# Сколько ближайших кубов EXPAND пытается поглотить расширяемым кубом
+ABSORB_LIMIT = 16
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
+
+
+def contains(a, b):
+    """Содержит ли куб a куб b"""
+    return not a[1] & ~b[1] and not (a[0] ^ b[0]) & a[1]
+
+
+def intersects(a, b):
+    return not (a[0] ^ b[0]) & a[1] & b[1]
+
+
+def literals(cover):
+    """Число литер в покрытии"""
+    return sum(care.bit_count() for _, care in cover)
+
+
+def _cost(cover):
+    return len(cover), literals(cover)
+
+
+def single_cube_containment(cover):
+    """Покрытие без повторов и кубов, содержащихся в других"""
+    result = []
+    # Большие кубы (меньше литер) проверяются первыми
+    for cube in sorted(set(cover), key=lambda cube: cube[1].bit_count()):
+        if not any(contains(other, cube) for other in result):
+            result.append(cube)
+    return result
+
+
+def cofactor(cover, cube):
+    """Кофактор покрытия по кубу: части кубов внутри cube без его переменных"""
+    value, care = cube
+    return [(v & ~care, c & ~care) for v, c in cover if not (v ^ value) & c & care]
+
+
+def _split_variable(cover, binate_only):
+    # Самая частая переменная; для tautology - только из неунатных
+    ones = zeros = 0
+    for value, care in cover:
+        ones |= value & care
+        zeros |= ~value & care
+    candidates = ones & zeros if binate_only else ones | zeros
+    if not candidates:
+        return 0
+    counts = {}
+    for _, care in cover:
+        care &= candidates
+        while care:
+            bit = care & -care
+            counts[bit] = counts.get(bit, 0) + 1
+            care ^= bit
+    return max(counts, key=counts.__getitem__)
+
+
+def tautology(cover):
+    """Истинно ли покрытие во всех строках"""
+    return _tautology(frozenset(cover))
+
+
+# Разложения Шеннона цепочек кубов приходят к одним и тем же кофакторам
+@lru_cache(maxsize=1 << 16)
+def _tautology(cover):
+    if any(care == 0 for _, care in cover):
+        return True
+    if not cover:
+        return False
+    support = 0
+    for _, care in cover:
+        support |= care
+    width = support.bit_count()
+    # Кубы вместе содержат меньше наборов, чем есть на их переменных
+    if sum(1 << (width - care.bit_count()) for _, care in cover) < 1 << width:
+        return False
+    components = _components(cover)
+    if len(components) > 1:
+        # Набор, где ложна каждая группа, складывается из наборов групп
+        return any(tautology(component) for component in components)
+    bit = _split_variable(cover, binate_only=True)
+    if not bit:
+        # Унатное покрытие без пустого куба не тождественно
+        return False
+    return tautology(cofactor(cover, (bit, bit))) and tautology(cofactor(cover, (0, bit)))
+
+
+def covers(cover, cube):
+    """Покрывает ли покрытие весь куб"""
+    return tautology(cofactor(cover, cube))
+
+
+def complement(cover):
+    """Покрытие дополнения"""
+    cover = list(cover)
+    if not cover:
+        return [(0, 0)]
+    if any(care == 0 for _, care in cover):
+        return []
+    if len(cover) == 1:
+        # По правилу де Моргана: по кубу на каждую инвертированную литеру
+        value, care = cover[0]
+        return [(~value & bit, bit) for bit in _bits(care)]
+    bit = _split_variable(cover, binate_only=False)
+    high = complement(cofactor(cover, (bit, bit)))
+    low = complement(cofactor(cover, (0, bit)))
+    both = set(high) & set(low)
+    result = list(both)
+    result += [(value | bit, care | bit) for value, care in high if (value, care) not in both]
+    result += [(value, care | bit) for value, care in low if (value, care) not in both]
+    return single_cube_containment(result)
+
+
+def supercube(cover):
+    """Наименьший куб, содержащий все кубы покрытия"""
+    value, care = cover[0]
+    for v, c in cover[1:]:
+        care &= c & ~(v ^ value)
+    return value & care, care
+
+
+def _components(cover):
+    # Группы кубов с непересекающимися множествами переменных
+    groups = []
+    for cube in cover:
+        support = cube[1]
+        cubes = [cube]
+        rest = []
+        for group in groups:
+            if group[0] & support:
+                support |= group[0]
+                cubes += group[1]
+            else:
+                rest.append(group)
+        groups = rest + [(support, cubes)]
+    return [cubes for _, cubes in groups]
+
+
+def _complement_supercube(cover):
+    return _cached_complement_supercube(frozenset(cover))
+
+
+@lru_cache(maxsize=1 << 16)
+def _cached_complement_supercube(cover):
+    # Наименьший куб, содержащий дополнение покрытия, без построения самого
+    # дополнения; None, если дополнение пусто
+    if not cover:
+        return 0, 0
+    if any(care == 0 for _, care in cover):
+        return None
+    if len(cover) == 1:
+        value, care = next(iter(cover))
+        # Дополнение куба из нескольких литер содержит кубы по разным переменным
+        return (~value & care, care) if not care & (care - 1) else (0, 0)
+    components = _components(cover)
+    if len(components) > 1:
+        # Дополнение - произведение дополнений групп с разными переменными
+        value = care = 0
+        for component in components:
+            part = _complement_supercube(component)
+            if part is None:
+                return None
+            value |= part[0]
+            care |= part[1]
+        return value, care
+    bit = _split_variable(cover, binate_only=True)
+    if not bit:
+        # Дополнение унатного покрытия - все наборы, задевающие каждый куб;
+        # общие для всех наборов только инверсии однолитерных кубов
+        value = care = 0
+        for v, c in cover:
+            if not c & (c - 1):
+                value |= ~v & c
+                care |= c
+        return value, care
+    high = _complement_supercube(cofactor(cover, (bit, bit)))
+    if high == (0, 0):
+        return (bit, bit) if tautology(cofactor(cover, (0, bit))) else (0, 0)
+    low = _complement_supercube(cofactor(cover, (0, bit)))
+    parts = []
+    if high is not None:
+        parts.append((high[0] | bit, high[1] | bit))
+    if low is not None:
+        parts.append((low[0], low[1] | bit))
+    return supercube(parts) if parts else None
+
+
+def _product(a, b):
+    return single_cube_containment([(va | vb, ca | cb) for va, ca in a for vb, cb in b
+                                    if intersects((va, ca), (vb, cb))])
+
+
+def expression_cover(node, variables):
+    """Покрытие выражения (дерева или текста); первая переменная - старший разряд"""
+    if isinstance(node, str):
+        node = parse(node)
+    bits = {name: 1 << (len(variables) - 1 - i) for i, name in enumerate(variables)}
+    unknown = set(variables_of(node)) - set(bits)
+    if unknown:
+        raise ExpressionError(f"Unknown variable {sorted(unknown)[0]!r}")
+    return _cover(node, bits)
+
+
+def _cover(node, bits):
+    if isinstance(node, Var):
+        bit = bits[node.name]
+        return [(bit, bit)]
+    if isinstance(node, Const):
+        return [(0, 0)] if node.value else []
+    if isinstance(node, Not):
+        return complement(_cover(node.operand, bits))
+    left, right = _cover(node.left, bits), _cover(node.right, bits)
+    if node.op == OR:
+        return single_cube_containment(left + right)
+    if node.op == IMPLIES:
+        return single_cube_containment(complement(left) + right)
+    if node.op == EQUIV:
+        return single_cube_containment(_product(left, right) + _product(complement(left), complement(right)))
+    return _product(left, right)
+
+
+def _expand_against_off(cube, off):
+    # Оставляемые литеры должны отделять куб от каждого куба OFF-множества:
+    # это задача о покрытии строк-конфликтов литерами, решаемая жадно
+    value, care = cube
+    conflicts = [(value ^ v) & care & c for v, c in off]
+    if not all(conflicts):
+        raise ValueError("Cube intersects the OFF-set")
+    columns = {}
+    for row, conflict in enumerate(conflicts):
+        for bit in _bits(conflict):
+            columns[bit] = columns.get(bit, 0) | 1 << row
+    unhit = (1 << len(conflicts)) - 1
+    keep = 0
+    for conflict in conflicts:
+        if not conflict & (conflict - 1):
+            keep |= conflict
+    for bit in _bits(keep):
+        unhit &= ~columns[bit]
+    while unhit:
+        bit = max(columns, key=lambda bit: ((columns[bit] & unhit).bit_count(), bit))
+        keep |= bit
+        unhit &= ~columns[bit]
+    # Лишние литеры, без которых конфликты всё равно разрешены
+    for bit in _bits(keep):
+        if all(conflict & keep & ~bit for conflict in conflicts):
+            keep &= ~bit
+    return value & keep, keep
+
+
+def _raise_literals(cube, cover, feasible):
+    # Литера снимается, если расширенный куб остаётся допустимым.
+    # Первыми пробуются переменные, отсутствующие в большинстве других кубов
+    value, care = cube
+    free = {bit: sum(1 for _, c in cover if not c & bit) for bit in _bits(care)}
+    for bit in sorted(free, key=lambda bit: (-free[bit], bit)):
+        wider = (value & ~bit, care & ~bit)
+        if feasible(wider):
+            value, care = wider
+    return value, care
+
+
+def outside_rows(bits, n):
+    """Проверка, что куб не задевает строки таблицы из битового множества bits"""
+    masks = variable_masks(n)
+    full = (1 << (1 << n)) - 1
+
+    def feasible(cube):
+        value, care = cube
+        rows = full
+        for j, mask in enumerate(masks):
+            bit = 1 << (n - 1 - j)
+            if care & bit:
+                rows &= mask if value & bit else ~mask
+        return not rows & bits
+    return feasible
+
+
+def _absorb(cube, targets, feasible):
+    # Куб растёт до наименьшего куба, содержащего его и ещё один куб покрытия,
+    # пока такой рост допустим; первыми пробуются ближайшие кубы
+    def distance(other):
+        return ((cube[0] ^ other[0]) & cube[1] & other[1]).bit_count() + (cube[1] & ~other[1]).bit_count()
+    for other in sorted(targets, key=distance)[:ABSORB_LIMIT]:
+        if contains(cube, other):
+            continue
+        wider = supercube([cube, other])
+        if feasible(wider):
+            cube = wider
+    return cube
+
+
+def expand(cover, dc=(), off=None):
+    """EXPAND: каждый куб расширяется до простой импликанты, поглощённые кубы удаляются
+
+    off - OFF-множество списком кубов или функцией, проверяющей, что куб его
+    не задевает (outside_rows); без off расширенный куб должен быть покрыт
+    ON- и DC-множествами. Сначала куб по возможности растёт до поглощения
+    других кубов покрытия, затем снимаются оставшиеся лишние литеры.
+    """
+    cover = list(cover)
+    dc = list(dc)
+    on = cover + dc
+    if callable(off):
+        feasible = off
+    elif off is not None:
+        def feasible(cube):
+            return not any(intersects(cube, other) for other in off)
+    else:
+        def feasible(cube):
+            return covers(on, cube)
+    result = []
+    remaining = sorted(cover, key=lambda cube: cube[1].bit_count())
+    while remaining:
+        cube = _absorb(remaining[0], remaining, feasible)
+        if off is not None and not callable(off):
+            cube = _expand_against_off(cube, off)
+        else:
+            cube = _raise_literals(cube, cover, feasible)
+        remaining = [other for other in remaining if not contains(cube, other)]
+        result = [other for other in result if not contains(cube, other)]
+        result.append(cube)
+    return result
+
+
+def irredundant(cover, dc=()):
+    """IRREDUNDANT: удаляются кубы, покрытые остальными кубами и безразличными наборами"""
+    result = list(cover)
+    # Первыми проверяются маленькие кубы: они чаще избыточны
+    for cube in sorted(cover, key=lambda cube: -cube[1].bit_count()):
+        others = [other for other in result if other != cube]
+        if covers(others + list(dc), cube):
+            result = others
+    return result
+
+
+def reduce(cover, dc=()):
+    """REDUCE: каждый куб сжимается до наименьшего, покрывающего то, что не покрыто другими"""
+    result = list(cover)
+    for cube in sorted(cover, key=lambda cube: cube[1].bit_count()):
+        others = [other for other in result if other != cube]
+        rest = _complement_supercube(cofactor(others + list(dc), cube))
+        if rest is None:
+            result = others
+            continue
+        result = others + [(cube[0] | rest[0], cube[1] | rest[1])]
+    return result
+
+
+def last_gasp(cover, dc=(), off=None):
+    """LAST_GASP: кубы сжимаются независимо друг от друга, расширяются, и
+    новые простые импликанты добавляются к покрытию перед IRREDUNDANT"""
+    dc = list(dc)
+    reduced = []
+    for cube in cover:
+        others = [other for other in cover if other != cube]
+        rest = _complement_supercube(cofactor(others + dc, cube))
+        if rest is not None:
+            reduced.append((cube[0] | rest[0], cube[1] | rest[1]))
+    primes = [cube for cube in expand(reduced, dc + cover, off) if cube not in cover]
+    if not primes:
+        return cover
+    return irredundant(primes + cover, dc)
+
+
+def espresso(on, dc=(), off=None):
+    """Минимальное (эвристически) покрытие ON-множества кубами
+
+    dc - безразличные наборы. off - OFF-множество, если оно уже известно
+    (кубы или outside_rows по ложным строкам таблицы); дополнение
+    ON-множества не вычисляется, потому что для больших функций оно огромно.
+    """
+    on = single_cube_containment(on)
+    dc = list(dc)
+    best = irredundant(expand(on, dc, off), dc)
+    while True:
+        cover = irredundant(expand(reduce(best, dc), dc, off), dc)
+        if _cost(cover) >= _cost(best):
+            cover = last_gasp(best, dc, off)
+            if _cost(cover) >= _cost(best):
+                break
+        best = cover
+    return sorted(best)
\ No newline at end of file
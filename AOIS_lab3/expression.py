@@ -0,0 +1,271 @@
+"""Разбор и компиляция логических выражений.
+
+Выражение разбирается токенизатором и парсером с рекурсивным спуском в
+дерево из узлов Var, Const, Not и BinOp. Дерево один раз компилируется в
+функцию Python, которая затем вычисляется для всех строк таблицы
+истинности; текст выражения в исходный код функции не попадает, поэтому
+вычисление безопасно для любого входа.
+
+Операции по убыванию приоритета: ! (не), & (и), | (или), -> (импликация,
+правоассоциативная), ~ (эквивалентность). Переменная - любой
+идентификатор из букв, цифр и _, например req0 или grant_n. Для каждой операции также
+принимаются синонимы: not, and, or, <= и == (вид выражения после
+parse_expression) и символы ¬, ∧, ∨, →, ↔.
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+NOT, AND, OR, IMPLIES, EQUIV = '!', '&', '|', '->', '~'
+OPERATOR_ALIASES = {
+    '!': NOT, 'not': NOT, '¬': NOT,
+    '&': AND, 'and': AND, '∧': AND,
+    '|': OR, 'or': OR, '∨': OR,
+    '->': IMPLIES, '<=': IMPLIES, '→': IMPLIES,
+    '~': EQUIV, '==': EQUIV, '↔': EQUIV,
+}
+# Наибольшая вложенность скобок и операций; глубже выражение отвергается
+MAX_DEPTH = 50
+
+_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_TOKEN = re.compile(r'\s*(?:(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<number>\d+)'
+                    r'|(?P<op>->|<=|==|[!&|~()¬∧∨→↔]))')
+
+
+class ExpressionError(ValueError):
+    """Синтаксическая ошибка или неизвестная переменная в выражении"""
+
+
+class Token(NamedTuple):
+    kind: str  # name, const, op или end
+    value: object
+    pos: int
+
+
+class Var(NamedTuple):
+    name: str
+
+
+class Const(NamedTuple):
+    value: int
+
+
+class Not(NamedTuple):
+    operand: tuple
+
+
+class BinOp(NamedTuple):
+    op: str
+    left: tuple
+    right: tuple
+
+
+def tokenize(text):
+    """Список токенов выражения; синонимы операций приводятся к одному виду"""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match:
+            pos = len(text) - len(text[pos:].lstrip())
+            raise ExpressionError(f"Unexpected character {text[pos]!r} at {pos}")
+        start = match.start(match.lastgroup)
+        name, number, op = match.group('name', 'number', 'op')
+        if name is not None:
+            if name in OPERATOR_ALIASES:
+                tokens.append(Token('op', OPERATOR_ALIASES[name], start))
+            else:
+                tokens.append(Token('name', name, start))
+        elif number is not None:
+            if number not in ('0', '1'):
+                raise ExpressionError(f"Only constants 0 and 1 are allowed, got {number} at {start}")
+            tokens.append(Token('const', int(number), start))
+        else:
+            tokens.append(Token('op', OPERATOR_ALIASES.get(op, op), start))
+        pos = match.end()
+    tokens.append(Token('end', None, len(text)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self.depth = 0
+
+    def peek(self, value):
+        token = self.tokens[self.pos]
+        return token.kind == 'op' and token.value == value
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def nested(self, parse):
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ExpressionError(f"Expression is nested deeper than {MAX_DEPTH} levels")
+        node = parse()
+        self.depth -= 1
+        return node
+
+    def parse(self):
+        node = self.equivalence()
+        token = self.tokens[self.pos]
+        if token.kind != 'end':
+            raise ExpressionError(f"Unexpected {token.value!r} at {token.pos}")
+        return node
+
+    def binary_chain(self, op, operand):
+        node = operand()
+        while self.peek(op):
+            self.take()
+            node = BinOp(op, node, operand())
+        return node
+
+    def equivalence(self):
+        return self.binary_chain(EQUIV, self.implication)
+
+    def implication(self):
+        node = self.disjunction()
+        if self.peek(IMPLIES):
+            self.take()
+            node = BinOp(IMPLIES, node, self.nested(self.implication))
+        return node
+
+    def disjunction(self):
+        return self.binary_chain(OR, self.conjunction)
+
+    def conjunction(self):
+        return self.binary_chain(AND, self.unary)
+
+    def unary(self):
+        if self.peek(NOT):
+            self.take()
+            return Not(self.nested(self.unary))
+        return self.primary()
+
+    def primary(self):
+        token = self.take()
+        if token.kind == 'name':
+            return Var(token.value)
+        if token.kind == 'const':
+            return Const(token.value)
+        if token.kind == 'op' and token.value == '(':
+            node = self.nested(self.equivalence)
+            if not self.peek(')'):
+                raise ExpressionError(f"Missing ')' at {self.tokens[self.pos].pos}")
+            self.take()
+            return node
+        if token.kind == 'end':
+            raise ExpressionError("Unexpected end of expression")
+        raise ExpressionError(f"Unexpected {token.value!r} at {token.pos}")
+
+
+def parse(text):
+    """Дерево выражения"""
+    return _Parser(text).parse()
+
+
+def find_variables(text):
+    """Имена переменных в тексте в алфавитном порядке, даже если выражение некорректно"""
+    return sorted({name for name in _NAME.findall(text) if name not in OPERATOR_ALIASES})
+
+
+def variables_of(node):
+    """Имена переменных дерева в алфавитном порядке"""
+    names = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Var):
+            names.add(node.name)
+        elif isinstance(node, Not):
+            stack.append(node.operand)
+        elif isinstance(node, BinOp):
+            stack.extend((node.left, node.right))
+    return sorted(names)
+
+
+def canonical_text(node):
+    """Каноническая запись дерева: одинакова для выражений, отличающихся
+    пробелами, синонимами операций, скобками и порядком операндов &, | и ~"""
+    if isinstance(node, Var):
+        return node.name
+    if isinstance(node, Const):
+        return str(node.value)
+    if isinstance(node, Not):
+        return '!' + canonical_text(node.operand)
+    if node.op == IMPLIES:
+        return f'({canonical_text(node.left)} -> {canonical_text(node.right)})'
+    parts = sorted(canonical_text(operand) for operand in _operands(node, node.op))
+    return '(' + f' {node.op} '.join(parts) + ')'
+
+
+def _operands(node, op):
+    # Цепочка одной ассоциативной операции как плоский список операндов
+    operands = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, BinOp) and node.op == op:
+            stack.extend((node.right, node.left))
+        else:
+            operands.append(node)
+    return operands
+
+
+def _balanced(parts, op):
+    # Сбалансированная запись цепочки: глубина скобок растёт как log(n)
+    if len(parts) == 1:
+        return parts[0]
+    middle = len(parts) // 2
+    return f'({_balanced(parts[:middle], op)} {op} {_balanced(parts[middle:], op)})'
+
+
+def _source(node, names):
+    # Значения - целые 0/1 (или маски разрядов), one - слово из единиц
+    if isinstance(node, Var):
+        if node.name not in names:
+            raise ExpressionError(f"Unknown variable {node.name!r}")
+        return names[node.name]
+    if isinstance(node, Const):
+        return 'one' if node.value else '0'
+    if isinstance(node, Not):
+        return f'(one ^ {_source(node.operand, names)})'
+    if node.op == IMPLIES:
+        return f'((one ^ {_source(node.left, names)}) | {_source(node.right, names)})'
+    parts = [_source(operand, names) for operand in _operands(node, node.op)]
+    if node.op == EQUIV:
+        # Эквивалентность ассоциативна: цепочка равна инверсии XOR при чётном числе операндов
+        source = _balanced(parts, '^')
+        return f'(one ^ {source})' if len(parts) % 2 == 0 else source
+    return _balanced(parts, node.op)
+
+
+def compile_node(node, variables):
+    """Функция f(*values, one=1) для дерева; values идут в порядке variables"""
+    names = {name: f'v{i}' for i, name in enumerate(variables)}
+    params = ''.join(f'{param}, ' for param in names.values())
+    source = f'lambda {params}*, one=1: {_source(node, names)}'
+    return eval(compile(source, '<expression>', 'eval'), {'__builtins__': {}})
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(text, variables):
+    return compile_node(parse(text), variables)
+
+
+def compile_expression(text, variables=None):
+    """Скомпилированное выражение; без variables переменные берутся из самого выражения"""
+    if variables is None:
+        variables = variables_of(parse(text))
+    return _compile_cached(text, tuple(variables))
+
+
+def evaluate(text, values):
+    """Значение выражения (0 или 1) при значениях переменных из словаря values"""
+    variables = tuple(values)
+    return compile_expression(text, variables)(*(values[name] for name in variables))
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""Кэш результатов по каноническому хэшу выражения.
+
+Ключ выражения - хэш канонической записи его дерева (canonical_text) и
+порядка переменных, поэтому выражения, отличающиеся пробелами, синонимами
+операций или порядком операндов, вычисляются один раз. Формы и результаты
+минимизации зависят только от таблицы истинности и хранятся по хэшу её
+битового множества: совпадают они и у разных выражений одной функции.
+
+Значения хранятся сериализованными pickle, так что каждое обращение
+получает свою копию. Объём кэша ограничен суммарным размером записей
+maxbytes, а не их числом: таблица 24 переменных занимает около 2 МБ, а
+форма маленькой функции - десятки байт. Давно не использованные записи
+вытесняются, пока сумма не уложится в предел; с path записи также пишутся
+в базу sqlite и переживают перезапуск процесса.
+"""
+import hashlib
+import pickle
+import sqlite3
+from collections import OrderedDict
+from functools import wraps
+from inspect import signature
+
+from expression import ExpressionError, canonical_text, parse, variables_of
+from truth_table import as_truth_table
+
+# Меняется при изменении формата записей, чтобы старые базы не читались
+CACHE_VERSION = 1
+# Предел суммарного размера сериализованных записей, байт
+DEFAULT_MAXBYTES = 64 << 20
+
+
+def _digest(*parts):
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (str(CACHE_VERSION), *parts):
+        data = part if isinstance(part, bytes) else part.encode()
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def expression_key(text, variables=None):
+    """Ключ выражения; ExpressionError, если оно некорректно или использует не все переменные из variables"""
+    node = parse(text)
+    names = variables_of(node)
+    variables = names if variables is None else list(variables)
+    unknown = set(names) - set(variables)
+    if unknown:
+        raise ExpressionError(f"Unknown variable {sorted(unknown)[0]!r}")
+    return _digest('expression', canonical_text(node), *variables)
+
+
+def table_key(variables, table):
+    """Ключ таблицы истинности (список словарей строк тоже подходит)"""
+    table = as_truth_table(table, variables)
+    parts = [table.bits.to_bytes((table.size + 7) // 8, 'little')]
+    if table.dont_care:
+        # Таблицы без безразличных строк сохраняют прежние ключи
+        parts.append(b'dc' + table.dont_care.to_bytes((table.size + 7) // 8, 'little'))
+    return _digest('table', str(table.size), *parts, *table.variables)
+
+
+class ExpressionCache:
+    """LRU-кэш значений по паре (ключ, имя) с необязательной базой sqlite"""
+
+    def __init__(self, maxbytes=DEFAULT_MAXBYTES, path=None):
+        self.maxbytes = maxbytes
+        self.hits = self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT, name TEXT, value BLOB,"
+                             " used INTEGER, PRIMARY KEY (key, name))")
+            self._clock = self._db.execute("SELECT COALESCE(MAX(used), 0) FROM entries").fetchone()[0]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, item, data):
+        old = self._entries.pop(item, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        self._entries[item] = data
+        self.nbytes += len(data)
+        # Запись больше всего предела тоже вытесняется, значение лишь возвращается
+        while self.nbytes > self.maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted)
+
+    def _load(self, item):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value FROM entries WHERE key = ? AND name = ?", item).fetchone()
+        if row is not None:
+            self._clock += 1
+            with self._db:
+                self._db.execute("UPDATE entries SET used = ? WHERE key = ? AND name = ?", (self._clock, *item))
+            return row[0]
+        return None
+
+    def _store(self, item, data):
+        if self._db is None:
+            return
+        self._clock += 1
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (*item, data, self._clock))
+            # В базе, как и в памяти, остаются последние записи общим размером до maxbytes
+            self._db.execute("DELETE FROM entries WHERE used IN (SELECT used FROM (SELECT used,"
+                             " SUM(LENGTH(value)) OVER (ORDER BY used DESC) AS total FROM entries)"
+                             " WHERE total > ?)", (self.maxbytes,))
+
+    def get(self, key, name, compute):
+        """Значение name для ключа key; при промахе вычисляется compute() и сохраняется"""
+        if self.maxbytes <= 0:
+            return compute()
+        item = (key, name)
+        data = self._entries.get(item)
+        if data is None:
+            data = self._load(item)
+        if data is not None:
+            self.hits += 1
+            self._remember(item, data)
+            return pickle.loads(data)
+        self.misses += 1
+        value = compute()
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self._remember(item, data)
+        self._store(item, data)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.nbytes = 0
+        if self._db is not None:
+            with self._db:
+                self._db.execute("DELETE FROM entries")
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+_cache = ExpressionCache()
+
+
+def default_cache():
+    """Кэш, которым пользуются generate_truth_table, формы и минимизация"""
+    return _cache
+
+
+def configure_cache(maxbytes=DEFAULT_MAXBYTES, path=None):
+    """Заменяет общий кэш; maxbytes=0 отключает кэширование, path - файл базы sqlite"""
+    global _cache
+    _cache.close()
+    _cache = ExpressionCache(maxbytes, path)
+    return _cache
+
+
+def cached_truth_table(text, variables, compute):
+    """Таблица истинности выражения из кэша по его каноническому ключу"""
+    return _cache.get(expression_key(text, variables), 'truth_table', compute)
+
+
+def table_cached(function):
+    """Кэширует function(variables, table, ...) по ключу таблицы и остальным аргументам"""
+    parameters = signature(function)
+
+    @wraps(function)
+    def wrapper(variables, table, *args, **kwargs):
+        bound = parameters.bind(variables, table, *args, **kwargs)
+        bound.apply_defaults()
+        options = tuple(bound.arguments.items())[2:]
+        name = f"{function.__name__}{options!r}"
+        return _cache.get(table_key(variables, table), name, lambda: function(variables, table, *args, **kwargs))
+    return wrapper
\ No newline at end of file
@@ -1,4 +1,26 @@
-from itertools import product, combinations
+import sys
+from itertools import combinations
+from typing import NamedTuple
+
+from canonical_forms import sdnf_terms, sknf_terms, write_sdnf, write_sknf
+from cover import build_chart, minimum_cover
+from espresso import espresso, expression_cover, outside_rows
+from expression import ExpressionError, Not, compile_expression, evaluate, find_variables, parse, variables_of
+from expression_cache import cached_truth_table, table_cached
+from quine_mccluskey import from_binary, merge_stages, to_binary, touching
+from truth_table import DONT_CARE, as_truth_table, evaluate_table
+
+QUINE_MCCLUSKEY, ESPRESSO = 'quine_mccluskey', 'espresso'
+METHODS = (QUINE_MCCLUSKEY, ESPRESSO)
+
+
+class _Minimization(NamedTuple):
+    """Результат расчёта и всё, что о нём печатается"""
+    letter_terms: list
+    binary_terms: list
+    stages: list   # [(группа, несклеенные)] в двоичной записи; None для Espresso
+    chart: list    # [(терм, покрывающие импликанты)] импликантной таблицы
+    cover: object  # Cover выбранного покрытия или None
 
 
 def parse_expression(expr):
@@ -12,57 +34,46 @@ def parse_expression(expr):
 
 
 def evaluate_expression(expr, variables):
-    env = variables.copy()
     try:
-        return int(eval(expr, {}, env))
-    except:
+        return evaluate(expr, variables)
+    except ExpressionError:
         return None
 
 
 def get_variables(expr):
-    return sorted(set(c for c in expr if c.islower() and 'a' <= c <= 'e'))
+    return find_variables(expr)
+
 
+def generate_truth_table(expr, variables=None, dont_care=()):
+    """Переменные и таблица истинности; строки с номерами из dont_care безразличны
 
-def generate_truth_table(expr):
-    variables = get_variables(expr)
-    parsed_expr = parse_expression(expr)
-    table = []
-    for values in product([0, 1], repeat=len(variables)):
-        row = dict(zip(variables, values))
-        result = evaluate_expression(parsed_expr, row)
-        if result is not None:
-            row['result'] = result
-            table.append(row)
-    return variables, table
+    Некорректное выражение или переменная вне variables - ExpressionError.
+    """
+    variables = list(variables) if variables is not None else get_variables(expr)
+    # Выражение разбирается и компилируется один раз для всех строк,
+    # а выражения с одинаковым каноническим деревом - один раз вообще
+    table = cached_truth_table(expr, variables,
+                               lambda: evaluate_table(compile_expression(expr, variables), variables))
+    return variables, table.with_dont_care(dont_care) if dont_care else table
 
 
+@table_cached
 def build_sdnf(variables, table):
-    terms = []
-    for row in table:
-        if row['result'] == 1:
-            term = [var if row[var] else f"¬{var}" for var in variables]
-            terms.append(" ∧ ".join(term))
-    return " ∨ ".join(f"({t})" for t in terms)
+    return " ∨ ".join(sdnf_terms(variables, table))
 
 
+@table_cached
 def build_sknf(variables, table):
-    terms = []
-    for row in table:
-        if row['result'] == 0:
-            term = [f"¬{var}" if row[var] else var for var in variables]
-            terms.append(" ∨ ".join(term))
-    return " ∧ ".join(f"({t})" for t in terms)
+    return " ∧ ".join(sknf_terms(variables, table))
 
 
 def numeric_forms(variables, table):
-    sdnf_numbers = [i for i, row in enumerate(table) if row['result'] == 1]
-    sknf_numbers = [i for i, row in enumerate(table) if row['result'] == 0]
-    return sdnf_numbers, sknf_numbers
+    table = as_truth_table(table, variables)
+    return list(table.indices(1)), list(table.indices(0))
 
 
 def index_form(table):
-    index = sum(2 ** i for i, row in enumerate(table) if row['result'] == 1)
-    return index
+    return as_truth_table(table).bits
 
 
 def binary_to_letter_term(binary, variables, is_sdnf=True):
@@ -106,43 +117,87 @@ def calc_skleivanie(terms):
     return new_terms, remaining
 
 
-def minimize_calc(terms, variables, is_sdnf=True):
-    print("\nСтадии склеивания:")
-    stages = []
-    current_terms = set(terms)
-    while True:
-        new_terms, remaining = calc_skleivanie(list(current_terms))
-        stages.append((current_terms, remaining))
-        if not new_terms:
-            break
-        current_terms = new_terms | remaining
+def _merge_terms(terms, variables, is_sdnf=True, dont_cares=()):
+    n = len(terms[0]) if terms else len(variables)
+    # Склеивание идёт над парами (value, care); строки нужны только для вывода.
+    # Безразличные наборы склеиваются наравне с термами
+    stages = merge_stages(from_binary(term) for term in [*terms, *dont_cares])
     prime_implicants = set()
     for _, remain in stages:
         prime_implicants.update(remain)
+    if dont_cares:
+        prime_implicants = touching(prime_implicants, [int(term, 2) for term in terms], n)
+    prime_implicants = {to_binary(implicant, n) for implicant in prime_implicants}
+    stages = [(sorted(to_binary(implicant, n) for implicant in group),
+               sorted(to_binary(implicant, n) for implicant in remain)) for group, remain in stages]
+    letter_terms = [binary_to_letter_term(term, variables, is_sdnf) for term in sorted(prime_implicants)]
+    return [t for t in letter_terms if t], sorted(prime_implicants), stages
+
+
+def _print_stages(stages):
+    print("\nСтадии склеивания:")
     for i, (group, remain) in enumerate(stages):
         print(f"\nСтадия {i + 1}:")
-        print("Группа:", sorted(group))
-        print("Невозможно склеить:", sorted(remain))
-    letter_terms = [binary_to_letter_term(term, variables, is_sdnf) for term in sorted(prime_implicants)]
-    return [t for t in letter_terms if t], sorted(prime_implicants)
+        print("Группа:", group)
+        print("Невозможно склеить:", remain)
+
+
+def minimize_calc(terms, variables, is_sdnf=True, dont_cares=()):
+    letter_terms, binary_terms, stages = _merge_terms(terms, variables, is_sdnf, dont_cares)
+    _print_stages(stages)
+    return letter_terms, binary_terms
 
 
 def term_to_bin(index, n):
     return format(index, f'0{n}b')
 
 
-def minimize_sdnf_calc(variables, table):
-    n = len(variables)
-    minterms = [term_to_bin(i, n) for i, row in enumerate(table) if row['result'] == 1]
-    letter_terms, binary_terms = minimize_calc(minterms, variables, is_sdnf=True)
-    return letter_terms, binary_terms
+def _check_method(method):
+    if method not in METHODS:
+        raise ValueError(f"Unknown minimization method {method!r}")
+    return method
+
 
+def _letter_terms(cover, variables, is_sdnf):
+    binary_terms = sorted(to_binary(cube, len(variables)) for cube in cover)
+    letter_terms = [binary_to_letter_term(term, variables, is_sdnf) for term in binary_terms]
+    return [t for t in letter_terms if t], binary_terms
 
-def minimize_sknf_calc(variables, table):
+
+def minimize_espresso(variables, table, is_sdnf=True):
+    """Минимизация методом Espresso; противоположные строки таблицы служат OFF-множеством"""
     n = len(variables)
-    maxterms = [term_to_bin(i, n) for i, row in enumerate(table) if row['result'] == 0]
-    letter_terms, binary_terms = minimize_calc(maxterms, variables, is_sdnf=False)
-    return letter_terms, binary_terms
+    table = as_truth_table(table, variables)
+    full = (1 << n) - 1
+    on = [(i, full) for i in table.indices(1 if is_sdnf else 0)]
+    dc = [(i, full) for i in table.dont_cares()]
+    off_rows = table.bits ^ table.dont_care ^ ((1 << table.size) - 1) if is_sdnf else table.bits
+    return _letter_terms(espresso(on, dc, off=outside_rows(off_rows, n)), variables, is_sdnf)
+
+
+def minimize_expression(expr, variables=None, for_sdnf=True):
+    """Минимизация выражения методом Espresso без таблицы истинности (до 32 и более переменных)
+
+    Возвращает переменные, термы и их двоичную запись, как minimize_sdnf_calc.
+    """
+    node = parse(expr)
+    variables = list(variables) if variables is not None else variables_of(node)
+    # Для СКНФ минимизируется отрицание: его импликанты - дизъюнкции СКНФ
+    cover = expression_cover(node if for_sdnf else Not(node), variables)
+    letter_terms, binary_terms = _letter_terms(espresso(cover), variables, for_sdnf)
+    return variables, letter_terms, binary_terms
+
+
+def minimize_sdnf_calc(variables, table, method=QUINE_MCCLUSKEY):
+    result = _minimize(variables, table, True, method)
+    _print_minimization(result)
+    return result.letter_terms, result.binary_terms
+
+
+def minimize_sknf_calc(variables, table, method=QUINE_MCCLUSKEY):
+    result = _minimize(variables, table, False, method)
+    _print_minimization(result)
+    return result.letter_terms, result.binary_terms
 
 
 def build_prime_implicant_chart(prime_implicants, terms):
@@ -158,74 +213,112 @@ def match(term, binary):
     return all(t == '-' or t == b for t, b in zip(term, binary))
 
 
-def minimize_table_method(variables, table, for_sdnf=True):
+def _cover_terms(implicants, indices, variables, is_sdnf=True):
     n = len(variables)
-    terms = [term_to_bin(i, n) for i, row in enumerate(table) if row['result'] == (1 if for_sdnf else 0)]
-    letter_terms, binary_prime_implicants = minimize_calc(terms, variables, is_sdnf=for_sdnf)
-    chart = build_prime_implicant_chart(binary_prime_implicants, terms)
-    print("\nИмпликантная таблица:")
-    for m in terms:
-        print(f"{m}: {[binary_prime_implicants[i] for i in chart[m]]}")
-    # Select essential prime implicants
-    essential_terms = []
-    covered_terms = set()
-    for m in terms:
-        if len(chart[m]) == 1 and m not in covered_terms:
-            pi_index = chart[m][0]
-            essential_terms.append(letter_terms[pi_index])
-            for m2 in terms:
-                if pi_index in chart[m2]:
-                    covered_terms.add(m2)
-    # Add additional terms to cover remaining minterms/maxterms
-    for m in terms:
-        if m not in covered_terms:
-            for pi_index in chart[m]:
-                if letter_terms[pi_index] not in essential_terms:
-                    essential_terms.append(letter_terms[pi_index])
-                    for m2 in terms:
-                        if pi_index in chart[m2]:
-                            covered_terms.add(m2)
-                    break
-    return essential_terms
-
-
-def minimize_karnaugh_map(variables, table, for_sdnf=True):
+    cover = minimum_cover(implicants, indices, n)
+    terms = (binary_to_letter_term(to_binary(implicants[row], n), variables, is_sdnf) for row in cover.rows)
+    return [term for term in terms if term], cover
+
+
+def _print_cover(cover):
+    print(f"Число литер: {cover.literals}" + ("" if cover.exact else " (бюджет времени исчерпан)"))
+
+
+def select_cover(implicants, indices, variables, is_sdnf=True):
+    """Минимальное покрытие строк indices простыми импликантами в виде термов"""
+    terms, cover = _cover_terms(implicants, indices, variables, is_sdnf)
+    _print_cover(cover)
+    return terms
+
+
+@table_cached
+def _minimize(variables, table, is_sdnf=True, method=QUINE_MCCLUSKEY, select=False):
+    """Расчёт без вывода; кэшируется только он, а печать повторяется при каждом вызове
+
+    С select=True термы - выбранное покрытие, иначе - все простые импликанты.
+    """
+    if _check_method(method) == ESPRESSO:
+        letter_terms, binary_terms = minimize_espresso(variables, table, is_sdnf)
+        return _Minimization(letter_terms, binary_terms, None, [], None)
+    n = len(variables)
+    table = as_truth_table(table, variables)
+    indices = list(table.indices(1 if is_sdnf else 0))
+    terms = [term_to_bin(i, n) for i in indices]
+    dont_cares = [term_to_bin(i, n) for i in table.dont_cares()]
+    letter_terms, binary_terms, stages = _merge_terms(terms, variables, is_sdnf, dont_cares)
+    if not select:
+        return _Minimization(letter_terms, binary_terms, stages, [], None)
+    # Безразличные строки расширяют импликанты, но в таблицу покрытия не входят
+    implicants = [from_binary(term) for term in binary_terms]
+    chart = build_chart(implicants, indices, n)
+    chart = [(m, [binary_terms[i] for i in rows]) for m, rows in zip(terms, chart.columns)]
+    letter_terms, cover = _cover_terms(implicants, indices, variables, is_sdnf)
+    return _Minimization(letter_terms, binary_terms, stages, chart, cover)
+
+
+def _print_minimization(result, chart=False):
+    if result.stages is None:
+        return
+    _print_stages(result.stages)
+    if chart:
+        print("\nИмпликантная таблица:")
+        for m, rows in result.chart:
+            print(f"{m}: {rows}")
+    if result.cover is not None:
+        _print_cover(result.cover)
+
+
+def minimize_table_method(variables, table, for_sdnf=True, method=QUINE_MCCLUSKEY):
+    result = _minimize(variables, table, for_sdnf, method, select=True)
+    _print_minimization(result, chart=True)
+    return result.letter_terms
+
+
+def minimize_karnaugh_map(variables, table, for_sdnf=True, method=QUINE_MCCLUSKEY):
+    _check_method(method)
     n = len(variables)
-    terms = [term_to_bin(i, n) for i, row in enumerate(table) if row['result'] == (1 if for_sdnf else 0)]
+    table = as_truth_table(table, variables)
+
+    def cell(i):
+        return DONT_CARE if table.is_dont_care(i) else table.result(i)
 
     # Create Karnaugh map grid
     if n == 2:
         rows, cols = 2, 2
         kmap = [[None] * cols for _ in range(rows)]
-        for i, row in enumerate(table):
-            r = row[variables[0]]
-            c = row[variables[1]]
-            kmap[r][c] = row['result']
+        for i in range(len(table)):
+            values = table.values(i)
+            r = values[0]
+            c = values[1]
+            kmap[r][c] = cell(i)
     elif n == 3:
         rows, cols = 2, 4
         kmap = [[None] * cols for _ in range(rows)]
         gray = [0, 1, 3, 2]  # Gray code for columns
-        for i, row in enumerate(table):
-            r = row[variables[0]]
-            c = gray.index((row[variables[1]] << 1) + row[variables[2]])
-            kmap[r][c] = row['result']
+        for i in range(len(table)):
+            values = table.values(i)
+            r = values[0]
+            c = gray.index((values[1] << 1) + values[2])
+            kmap[r][c] = cell(i)
     elif n == 4:
         rows, cols = 4, 4
         kmap = [[None] * cols for _ in range(rows)]
         gray = [0, 1, 3, 2]
-        for i, row in enumerate(table):
-            r = gray.index((row[variables[0]] << 1) + row[variables[1]])
-            c = gray.index((row[variables[2]] << 1) + row[variables[3]])
-            kmap[r][c] = row['result']
+        for i in range(len(table)):
+            values = table.values(i)
+            r = gray.index((values[0] << 1) + values[1])
+            c = gray.index((values[2] << 1) + values[3])
+            kmap[r][c] = cell(i)
     elif n == 5:
         rows, cols = 4, 8
         kmap = [[None] * cols for _ in range(rows)]
         gray_rows = [0, 1, 3, 2]
         gray_cols = [0, 1, 3, 2, 6, 7, 5, 4]  # Gray code for 3 bits
-        for i, row in enumerate(table):
-            r = gray_rows.index((row[variables[0]] << 1) + row[variables[1]])
-            c = gray_cols.index((row[variables[2]] << 2) + (row[variables[3]] << 1) + row[variables[4]])
-            kmap[r][c] = row['result']
+        for i in range(len(table)):
+            values = table.values(i)
+            r = gray_rows.index((values[0] << 1) + values[1])
+            c = gray_cols.index((values[2] << 2) + (values[3] << 1) + values[4])
+            kmap[r][c] = cell(i)
     else:
         print(f"Карта Карно не поддерживается для {n} переменных")
         return []
@@ -254,44 +347,30 @@ def minimize_karnaugh_map(variables, table, for_sdnf=True):
             print(f"{variables[0]}{variables[1]} {gray_rows[i]:02b} {kmap[i]}")
 
     # Minimize using Karnaugh map
-    letter_terms, binary_terms = minimize_calc(terms, variables, is_sdnf=for_sdnf)
-    # Select essential prime implicants
-    chart = build_prime_implicant_chart(binary_terms, terms)
-    essential_terms = []
-    covered_terms = set()
-    for m in terms:
-        if len(chart[m]) == 1 and m not in covered_terms:
-            pi_index = chart[m][0]
-            essential_terms.append(letter_terms[pi_index])
-            for m2 in terms:
-                if pi_index in chart[m2]:
-                    covered_terms.add(m2)
-    for m in terms:
-        if m not in covered_terms:
-            for pi_index in chart[m]:
-                if letter_terms[pi_index] not in essential_terms:
-                    essential_terms.append(letter_terms[pi_index])
-                    for m2 in terms:
-                        if pi_index in chart[m2]:
-                            covered_terms.add(m2)
-                    break
-    return essential_terms
+    result = _minimize(variables, table, for_sdnf, method, select=True)
+    _print_minimization(result)
+    return result.letter_terms
 
 
 def main():
     expr = input("Введите логическую функцию: ")
-    variables, table = generate_truth_table(expr)
+    try:
+        variables, table = generate_truth_table(expr)
+    except ExpressionError as error:
+        print(f"Ошибка в выражении: {error}")
+        return
 
     print("\nТаблица истинности:")
     print(" ".join(variables) + " | result")
-    print("-" * (len(variables) * 2 + 7))
+    print("-" * (sum(len(var) + 1 for var in variables) + 7))
     for row in table:
-        print(" ".join(str(row[v]) for v in variables) + " | " + str(row['result']))
+        print(" ".join(str(row[v]).rjust(len(v)) for v in variables) + " | " + str(row['result']))
 
-    sdnf = build_sdnf(variables, table)
-    sknf = build_sknf(variables, table)
-    print("\nСДНФ:", sdnf)
-    print("\nСКНФ:", sknf)
+    print("\nСДНФ: ", end="")
+    write_sdnf(sys.stdout, variables, table)
+    print("\n\nСКНФ: ", end="")
+    write_sknf(sys.stdout, variables, table)
+    print()
 
     sdnf_nums, sknf_nums = numeric_forms(variables, table)
     print("\nЧисловые формы:")
@@ -0,0 +1,104 @@
+import contextlib
+import io
+import random
+import unittest
+from itertools import combinations
+
+from cover import build_chart, minimum_cover
+from minimizator import generate_truth_table, minimize_karnaugh_map, minimize_sknf_calc, minimize_table_method
+from quine_mccluskey import covers, from_binary, prime_implicants
+
+
+def brute_force(implicants, indices):
+    # Наименьшее число импликант, затем наименьшее число литер
+    for size in range(len(implicants) + 1):
+        literals = [sum(implicants[row][1].bit_count() for row in rows)
+                    for rows in combinations(range(len(implicants)), size)
+                    if all(any(covers(implicants[row], index) for row in rows) for index in indices)]
+        if literals:
+            return size, min(literals)
+
+
+class TestCover(unittest.TestCase):
+    def test_build_chart(self):
+        implicants = [from_binary('00-'), from_binary('-01')]
+        chart = build_chart(implicants, [0, 1, 5], 3)
+        self.assertEqual(chart.rows, [0b011, 0b110])
+        self.assertEqual(chart.columns, [[0], [0, 1], [1]])
+
+    def test_cyclic_chart(self):
+        # Все шесть импликант простые и ни одна не обязательна
+        indices = [0, 1, 2, 5, 6, 7]
+        implicants = prime_implicants(indices, 3)
+        self.assertEqual(len(implicants), 6)
+        cover = minimum_cover(implicants, indices, 3)
+        self.assertEqual((len(cover.rows), cover.literals, cover.exact), (3, 6, True))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            n = rng.randint(1, 5)
+            indices = [i for i in range(2 ** n) if rng.random() < 0.5]
+            implicants = prime_implicants(indices, n)
+            cover = minimum_cover(implicants, indices, n)
+            self.assertTrue(cover.exact)
+            self.assertEqual((len(cover.rows), cover.literals), brute_force(implicants, indices), msg=indices)
+
+    def test_time_budget_fallback(self):
+        rng = random.Random(12)
+        indices = [i for i in range(2 ** 12) if rng.random() < 0.5]
+        implicants = prime_implicants(indices, 12)
+        cover = minimum_cover(implicants, indices, 12, time_budget=0)
+        self.assertFalse(cover.exact)
+        covered = set()
+        for row in cover.rows:
+            covered.update(i for i in indices if covers(implicants[row], i))
+        self.assertEqual(covered, set(indices))
+        self.assertEqual(cover.literals, sum(implicants[row][1].bit_count() for row in cover.rows))
+
+    def test_uncovered_rows(self):
+        with self.assertRaises(ValueError):
+            minimum_cover([from_binary('0-')], [0, 3], 2)
+        self.assertEqual(minimum_cover([], [], 2), ([], 0, True))
+
+    def test_methods_drop_consensus_term(self):
+        variables, table = generate_truth_table("(a & b) | (!a & c) | (b & c)")
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            by_table = minimize_table_method(variables, table, for_sdnf=True)
+            by_map = minimize_karnaugh_map(variables, table, for_sdnf=True)
+        self.assertEqual(sorted(by_table), ["a ∧ b", "¬a ∧ c"])
+        self.assertEqual(sorted(by_map), ["a ∧ b", "¬a ∧ c"])
+        self.assertIn("Число литер: 4", out.getvalue())
+
+    def test_dont_cares_matches_brute_force(self):
+        rng = random.Random(24)
+        for _ in range(100):
+            n = rng.randint(1, 5)
+            kinds = [rng.choice('01-') for _ in range(2 ** n)]
+            ones = [i for i, kind in enumerate(kinds) if kind == '1']
+            dont_cares = [i for i, kind in enumerate(kinds) if kind == '-']
+            implicants = [implicant for implicant in prime_implicants(ones + dont_cares, n)
+                          if any(covers(implicant, i) for i in ones)]
+            cover = minimum_cover(implicants, ones, n)
+            self.assertEqual((len(cover.rows), cover.literals), brute_force(implicants, ones), msg=kinds)
+            for row in cover.rows:
+                self.assertTrue(all(kinds[i] != '0' for i in range(2 ** n) if covers(implicants[row], i)))
+
+    def test_methods_use_dont_cares(self):
+        # f = Σ(1, 3, 7, 11, 15) + d(0, 2, 5) = yz ∨ ¬w¬x
+        text = "!w & !x & !y & z | !w & !x & y & z | !w & x & y & z | w & !x & y & z | w & x & y & z"
+        variables, table = generate_truth_table(text, ['w', 'x', 'y', 'z'], dont_care=[0, 2, 5])
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            by_table = minimize_table_method(variables, table)
+            by_map = minimize_karnaugh_map(variables, table)
+            by_sknf, _ = minimize_sknf_calc(variables, table)
+        self.assertEqual(sorted(by_table), ["y ∧ z", "¬w ∧ ¬x"])
+        self.assertEqual(sorted(by_map), ["y ∧ z", "¬w ∧ ¬x"])
+        # Безразличные строки видны на карте, но в покрытие не входят
+        self.assertIn("00 ['-', 1, 1, '-']", out.getvalue())
+        self.assertIn("Число литер: 4", out.getvalue())
+        self.assertEqual(sorted(by_sknf), ["z", "¬w ∨ y", "¬x ∨ y"])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import contextlib
+import io
+import random
+import unittest
+from itertools import product
+
+from espresso import (
+    complement, contains, covers, espresso, expression_cover, intersects, literals,
+    outside_rows, supercube, tautology,
+)
+from expression import compile_expression
+from minimizator import (
+    generate_truth_table, minimize_expression, minimize_karnaugh_map, minimize_sdnf_calc,
+    minimize_sknf_calc, minimize_table_method,
+)
+from quine_mccluskey import covers as covers_row, from_binary
+
+
+def rows(cover, n):
+    return {index for index in range(2 ** n) if any(covers_row(cube, index) for cube in cover)}
+
+
+def random_cover(rng, n, size):
+    cover = []
+    for _ in range(size):
+        care = rng.getrandbits(n)
+        cover.append((rng.getrandbits(n) & care, care))
+    return cover
+
+
+class TestCubes(unittest.TestCase):
+    def test_cube_relations(self):
+        self.assertTrue(contains(from_binary('1--'), from_binary('1-0')))
+        self.assertFalse(contains(from_binary('1-0'), from_binary('1--')))
+        self.assertTrue(intersects(from_binary('1--'), from_binary('-0-')))
+        self.assertFalse(intersects(from_binary('1--'), from_binary('0-1')))
+        self.assertEqual(supercube([from_binary('101'), from_binary('111')]), from_binary('1-1'))
+
+    def test_complement_and_tautology(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            n = rng.randint(1, 6)
+            cover = random_cover(rng, n, rng.randint(0, 6))
+            on = rows(cover, n)
+            self.assertEqual(rows(complement(cover), n), set(range(2 ** n)) - on)
+            self.assertEqual(tautology(cover), len(on) == 2 ** n)
+            cube = random_cover(rng, n, 1)[0]
+            self.assertEqual(covers(cover, cube), rows([cube], n) <= on)
+
+    def test_expression_cover(self):
+        variables = ['a', 'b', 'c', 'd']
+        for text in ["a & !b | c -> d", "(a ~ b) ~ (c | !d)", "!(a | b) & (c -> !a)", "1", "a & !a"]:
+            function = compile_expression(text, variables)
+            expected = {i for i, values in enumerate(product([0, 1], repeat=4)) if function(*values)}
+            self.assertEqual(rows(expression_cover(text, variables), 4), expected, msg=text)
+
+    def test_outside_rows(self):
+        feasible = outside_rows(0b10000001, 3)
+        self.assertTrue(feasible(from_binary('01-')))
+        self.assertFalse(feasible(from_binary('-00')))
+
+
+class TestEspresso(unittest.TestCase):
+    def test_minimizes_random_tables(self):
+        rng = random.Random(9)
+        for _ in range(100):
+            n = rng.randint(1, 6)
+            on = [i for i in range(2 ** n) if rng.random() < 0.5]
+            full = (1 << n) - 1
+            cover = espresso([(i, full) for i in on])
+            self.assertEqual(rows(cover, n), set(on))
+            for cube in cover:
+                # Каждый куб - простая импликанта и не покрыт остальными
+                others = [other for other in cover if other != cube]
+                self.assertFalse(covers(others, cube))
+                for bit in (1 << j for j in range(n) if cube[1] >> j & 1):
+                    self.assertFalse(rows([(cube[0] & ~bit, cube[1] & ~bit)], n) <= set(on))
+
+    def test_consensus_term_is_dropped(self):
+        cover = espresso(expression_cover("(a & b) | (!a & c) | (b & c)", ['a', 'b', 'c']))
+        self.assertEqual(sorted(cover), sorted([from_binary('11-'), from_binary('0-1')]))
+        self.assertEqual(literals(cover), 4)
+
+    def test_minimizer_methods(self):
+        variables, table = generate_truth_table("(a & b) | (!a & c) | (b & c)")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(minimize_sdnf_calc(variables, table, method="espresso"),
+                             (["¬a ∧ c", "a ∧ b"], ["0-1", "11-"]))
+            self.assertEqual(minimize_sknf_calc(variables, table, method="espresso"),
+                             (["a ∨ c", "¬a ∨ b"], ["0-0", "10-"]))
+            self.assertEqual(minimize_table_method(variables, table, method="espresso"), ["¬a ∧ c", "a ∧ b"])
+            self.assertEqual(minimize_karnaugh_map(variables, table, False, method="espresso"),
+                             ["a ∨ c", "¬a ∨ b"])
+        with self.assertRaises(ValueError):
+            minimize_sdnf_calc(variables, table, method="petrick")
+
+    def test_dont_cares(self):
+        rng = random.Random(24)
+        for _ in range(50):
+            n = rng.randint(1, 6)
+            full = (1 << n) - 1
+            kinds = [rng.choice('01-') for _ in range(2 ** n)]
+            on = [(i, full) for i, kind in enumerate(kinds) if kind == '1']
+            dc = [(i, full) for i, kind in enumerate(kinds) if kind == '-']
+            cover = espresso(on, dc)
+            covered = rows(cover, n)
+            self.assertTrue(all(kinds[i] != '0' for i in covered))
+            self.assertTrue(all(i in covered for i, _ in on))
+        variables, table = generate_truth_table("w & y & z | !w & z & (y | !x)", ['w', 'x', 'y', 'z'],
+                                                dont_care=[0, 2, 5])
+        # Оба минимальных покрытия (с 00-- или с 0--1) используют безразличные строки
+        _, binary = minimize_sdnf_calc(variables, table, method="espresso")
+        self.assertEqual(len(binary), 2)
+        self.assertIn("--11", binary)
+
+    def test_minimize_expression(self):
+        variables, terms, binary = minimize_expression("b & a | a & !b | c & !c")
+        self.assertEqual((variables, terms, binary), (['a', 'b', 'c'], ["a"], ["1--"]))
+        _, terms, _ = minimize_expression("(a | b) & (a | !b)", for_sdnf=False)
+        self.assertEqual(terms, ["a"])
+
+    def test_thirty_two_inputs(self):
+        variables = [f'x{i}' for i in range(32)]
+        text = " | ".join(f"(x{i} & !x{i + 1} & x{(i + 5) % 32}) | (x{i} & !x{i + 1} & !x{(i + 5) % 32})"
+                          for i in range(0, 32, 2))
+        _, terms, binary = minimize_expression(text, variables)
+        # Пары кубов склеиваются по x{i + 5}
+        self.assertEqual(len(terms), 16)
+        self.assertTrue(all(term.count('∧') == 1 for term in terms))
+        function = compile_expression(text, variables)
+        cubes = [from_binary(term) for term in binary]
+        rng = random.Random(32)
+        for _ in range(500):
+            values = [rng.getrandbits(1) for _ in variables]
+            index = int(''.join(map(str, values)), 2)
+            self.assertEqual(function(*values), int(any(covers_row(cube, index) for cube in cubes)))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,135 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from expression import ExpressionError
+from expression_cache import ExpressionCache, configure_cache, expression_key, table_cached, table_key
+from minimizator import build_sdnf, generate_truth_table
+from truth_table import TruthTable
+
+
+def entry_size(value):
+    return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+class TestExpressionKey(unittest.TestCase):
+    def test_equivalent_spellings(self):
+        key = expression_key("a & b | !c")
+        self.assertEqual(expression_key("  (b and a) or ¬c "), key)
+        self.assertEqual(expression_key("!c ∨ (b ∧ a)"), key)
+        self.assertNotEqual(expression_key("a & b | c"), key)
+        # Порядок переменных меняет таблицу, а значит и ключ
+        self.assertNotEqual(expression_key("a & b | !c", ['c', 'b', 'a']), key)
+        self.assertEqual(expression_key("a & b | !c", ['a', 'b', 'c']), key)
+
+    def test_invalid_expressions(self):
+        with self.assertRaises(ExpressionError):
+            expression_key("a & ")
+        with self.assertRaises(ExpressionError):
+            expression_key("a & b", ['a'])
+
+    def test_table_key(self):
+        rows = [{'a': 0, 'result': 1}, {'a': 1, 'result': 0}]
+        self.assertEqual(table_key(['a'], rows), table_key(['a'], TruthTable(['a'], 0b01)))
+        renamed = [{'b': row['a'], 'result': row['result']} for row in rows]
+        self.assertNotEqual(table_key(['a'], rows), table_key(['b'], renamed))
+        table = TruthTable(['a'], 0b01)
+        self.assertNotEqual(table_key(['a'], table.with_dont_care([1])), table_key(['a'], table))
+
+
+class TestExpressionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = configure_cache()
+
+    def tearDown(self):
+        configure_cache()
+
+    def test_generate_truth_table_is_cached(self):
+        variables, table = generate_truth_table("a -> b & c")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        again = generate_truth_table("a → (c ∧ b)")
+        self.assertEqual(again, (variables, table))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        # Некорректное выражение не кэшируется
+        with self.assertRaises(ExpressionError):
+            generate_truth_table("a &")
+        self.assertEqual(len(self.cache), 1)
+
+    def test_forms_are_shared_between_expressions(self):
+        _, first = generate_truth_table("a | b")
+        _, second = generate_truth_table("!(!a & !b)")
+        self.assertEqual(build_sdnf(['a', 'b'], first), build_sdnf(['a', 'b'], second))
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_lru_eviction(self):
+        cache = ExpressionCache(maxbytes=2 * entry_size('x'))
+        calls = []
+        for key in ('x', 'y', 'x', 'z', 'y'):
+            cache.get(key, 'value', lambda: calls.append(key) or key)
+        # y вытеснен записью z, x остаётся
+        self.assertEqual(calls, ['x', 'y', 'z', 'y'])
+        self.assertEqual((len(cache), cache.nbytes), (2, 2 * entry_size('x')))
+
+    def test_size_cap_in_bytes(self):
+        small = entry_size('x')
+        cache = ExpressionCache(maxbytes=small * 4)
+        for key in 'abcd':
+            cache.get(key, 'value', lambda: key)
+        # Большая запись вытесняет несколько маленьких, а больше предела - не хранится
+        big = 'y' * (small * 2)
+        cache.get('big', 'value', lambda: big)
+        self.assertLessEqual(cache.nbytes, cache.maxbytes)
+        self.assertEqual(len(cache), 5 - (entry_size(big) + small - 1) // small)
+        self.assertEqual(cache.get('huge', 'value', lambda: big * 4), big * 4)
+        self.assertIsNone(cache.get('huge', 'value', lambda: None))
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_values_are_copies(self):
+        @table_cached
+        def terms(variables, table, value=1):
+            return list(TruthTable(variables, table.bits).indices(value))
+        table = TruthTable(['a', 'b'], 0b0110)
+        terms(['a', 'b'], table).append(99)
+        self.assertEqual(terms(['a', 'b'], table, value=1), [1, 2])
+        self.assertEqual(terms(['a', 'b'], table, 0), [0, 3])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_disabled(self):
+        cache = configure_cache(maxbytes=0)
+        generate_truth_table("a")
+        generate_truth_table("a")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            configure_cache(path=path)
+            _, table = generate_truth_table("x0 ~ x1 ~ x2")
+            # Новый процесс получает таблицу из базы без вычисления
+            cache = configure_cache(path=path)
+            cache.get(expression_key("x2 ~ x1 ~ x0"), 'truth_table', self.fail)
+            self.assertEqual(generate_truth_table("x1 ~ x0 ~ x2")[1], table)
+            self.assertEqual((cache.hits, cache.misses), (2, 0))
+            cache.clear()
+            self.assertEqual(configure_cache(path=path).get('x', 'truth_table', lambda: 1), 1)
+            configure_cache()
+
+    def test_persistent_size_cap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = ExpressionCache(maxbytes=3 * entry_size('a'), path=path)
+            for key in 'abcde':
+                cache.get(key, 'value', lambda: key)
+            cache.close()
+            cache = ExpressionCache(maxbytes=3 * entry_size('a'), path=path)
+            computed = []
+            for key in 'edcba':
+                cache.get(key, 'value', lambda: computed.append(key))
+            cache.close()
+            self.assertEqual(computed, ['b', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
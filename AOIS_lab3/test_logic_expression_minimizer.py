@@ -1,5 +1,9 @@
+import contextlib
+import io
 import unittest
 from itertools import product
+from expression import ExpressionError
+from expression_cache import configure_cache
 from minimizator import parse_expression, get_variables, evaluate_expression, generate_truth_table, build_sdnf, build_sknf, numeric_forms, index_form, minimize_sdnf_calc, minimize_sknf_calc, minimize_table_method, minimize_karnaugh_map, term_to_bin, binary_to_letter_term, combine_terms, match, build_prime_implicant_chart, calc_skleivanie
 
 class TestLogicFunctions(unittest.TestCase):
@@ -27,10 +31,11 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(get_variables(""), [])
         self.assertEqual(get_variables("1 & 2"), [])  # No valid variables
         self.assertEqual(get_variables("a & b & c & d"), ['a', 'b', 'c', 'd'])  # 4 variables
-        self.assertEqual(get_variables("a & A"), ['a'])  # Ignore uppercase variables
+        self.assertEqual(get_variables("a & A"), ['A', 'a'])  # Case-sensitive identifiers
         # Additional tests
         self.assertEqual(get_variables("a & b & c & d & e"), ['a', 'b', 'c', 'd', 'e'])  # 5 variables
-        self.assertEqual(get_variables("f & g"), [])  # Variables outside a-e
+        self.assertEqual(get_variables("f & g"), ['f', 'g'])  # Variables outside a-e
+        self.assertEqual(get_variables("req0 & !grant_n | req10"), ['grant_n', 'req0', 'req10'])  # Identifiers
 
     def test_evaluate_expression(self):
         expr = parse_expression("a & b")
@@ -68,9 +73,8 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(table, expected_table)
 
         # Test invalid expression
-        variables, table = generate_truth_table("a &")
-        self.assertEqual(variables, ['a'])
-        self.assertEqual(table, [])  # No valid evaluations
+        with self.assertRaises(ExpressionError):
+            generate_truth_table("a &")
 
         # Test 3 variables
         variables, table = generate_truth_table("a & b & c")
@@ -93,10 +97,19 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(table[31]['result'], 1)  # a=1, b=1, c=1, d=1, e=1
         self.assertEqual(table[0]['result'], 0)  # a=0, b=0, c=0, d=0, e=0
 
-        # Additional test: Expression with invalid variable
+        # Additional test: Variable outside a-e
         variables, table = generate_truth_table("a & f")
-        self.assertEqual(variables, ['a'])
-        self.assertEqual(table, [])  # No valid evaluations
+        self.assertEqual(variables, ['a', 'f'])
+        self.assertEqual([row['result'] for row in table], [0, 0, 0, 1])
+
+        # Explicit variable order
+        variables, table = generate_truth_table("a & !f", ['f', 'a'])
+        self.assertEqual(variables, ['f', 'a'])
+        self.assertEqual(table[1], {'f': 0, 'a': 1, 'result': 1})
+
+        # Variable missing from the explicit order
+        with self.assertRaises(ExpressionError):
+            generate_truth_table("a & f", ['a'])
 
     def test_build_sdnf(self):
         variables, table = generate_truth_table("a & b")
@@ -385,9 +398,8 @@ class TestLogicFunctions(unittest.TestCase):
 
     def test_edge_cases(self):
         # Test empty expression
-        variables, table = generate_truth_table("")
-        self.assertEqual(variables, [])
-        self.assertEqual(table, [])
+        with self.assertRaises(ExpressionError):
+            generate_truth_table("")
 
         # Test constant expression
         variables, table = generate_truth_table("a & !a")
@@ -406,9 +418,8 @@ class TestLogicFunctions(unittest.TestCase):
         self.assertEqual(min_sdnf, ["a"])
 
         # Test invalid expression with only operators
-        variables, table = generate_truth_table("& |")
-        self.assertEqual(variables, [])
-        self.assertEqual(table, [])
+        with self.assertRaises(ExpressionError):
+            generate_truth_table("& |")
 
         # Test expression with no valid output
         variables, table = generate_truth_table("a & b & !a & !b")
@@ -425,10 +436,52 @@ class TestLogicFunctions(unittest.TestCase):
         min_sdnf = minimize_sdnf_calc(variables, table)[0]
         self.assertEqual(min_sdnf, ["a"])
 
-        # Additional test: Invalid variable range
+        # Additional test: Variables outside a-e
         variables, table = generate_truth_table("f & g")
-        self.assertEqual(variables, [])
-        self.assertEqual(table, [])
+        self.assertEqual(variables, ['f', 'g'])
+        self.assertEqual(len(table), 4)
+
+    def test_truth_table_and_row_list_agree(self):
+        # Без кэша результаты по списку строк вычисляются заново, а не берутся копией первого
+        configure_cache(maxbytes=0)
+        self.addCleanup(configure_cache)
+        variables, table = generate_truth_table("(a -> b) & !(c ~ a) | d")
+        rows = list(table)
+        self.assertEqual(build_sdnf(variables, table), build_sdnf(variables, rows))
+        self.assertEqual(numeric_forms(variables, table), numeric_forms(variables, rows))
+        self.assertEqual(index_form(table), index_form(rows))
+        self.assertEqual(minimize_sdnf_calc(variables, table), minimize_sdnf_calc(variables, rows))
+        self.assertEqual(minimize_table_method(variables, table), minimize_table_method(variables, rows))
+        self.assertEqual(minimize_karnaugh_map(variables, table, for_sdnf=False),
+                         minimize_karnaugh_map(variables, rows, for_sdnf=False))
+
+    def test_reordered_and_partial_rows(self):
+        configure_cache(maxbytes=0)
+        self.addCleanup(configure_cache)
+        variables = ['a', 'b']
+        rows = [{'a': 0, 'b': 0, 'result': 0}, {'a': 1, 'b': 1, 'result': 1}, {'a': 0, 'b': 1, 'result': 0}]
+        with contextlib.redirect_stdout(io.StringIO()):
+            for table in (rows, rows[::-1], [{'a': 1, 'b': 1, 'result': 1}]):
+                self.assertEqual(build_sdnf(variables, table), "(a ∧ b)")
+                self.assertEqual(minimize_sdnf_calc(variables, table), (["a ∧ b"], ["11"]))
+                self.assertEqual(minimize_table_method(variables, table), ["a ∧ b"])
+                self.assertEqual(minimize_karnaugh_map(variables, table), ["a ∧ b"])
+
+    def test_output_repeats_on_cache_hit(self):
+        cache = configure_cache()
+        self.addCleanup(configure_cache)
+        variables, table = generate_truth_table("(a -> b) & !(c ~ a) | d")
+        for minimize in (minimize_sdnf_calc, minimize_sknf_calc, minimize_table_method, minimize_karnaugh_map):
+            runs = []
+            for _ in range(2):
+                with contextlib.redirect_stdout(io.StringIO()) as output:
+                    result = minimize(variables, table)
+                runs.append((output.getvalue(), result))
+            # Из кэша берётся только расчёт, стадии и таблицы печатаются снова
+            self.assertTrue(runs[0][0], msg=minimize.__name__)
+            self.assertEqual(runs[0], runs[1], msg=minimize.__name__)
+        # Карта Карно к тому же берёт покрытие, рассчитанное методом таблиц
+        self.assertEqual(cache.hits, 5)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import random
+import unittest
+from itertools import product
+
+from cover import minimum_cover
+from pla import DONT_CARE, format_pla, minimize_outputs, multi_output_primes, output_products
+from quine_mccluskey import covers, prime_implicants, to_binary
+
+
+def subtractor_columns():
+    d, bout = [], []
+    for a, b, bin_in in product([0, 1], repeat=3):
+        d.append(a ^ b ^ bin_in)
+        bout.append(int((not a and b) or (not a and bin_in) or (b and bin_in)))
+    return [d, bout]
+
+
+def check_outputs(test, pla, columns):
+    for j, column in enumerate(columns):
+        products = output_products(pla, j)
+        for i, value in enumerate(column):
+            if value != DONT_CARE:
+                test.assertEqual(int(any(covers(p, i) for p in products)), value, msg=(j, i))
+
+
+class TestPla(unittest.TestCase):
+    def test_subtractor_shares_products(self):
+        columns = subtractor_columns()
+        pla = minimize_outputs(columns, ['A', 'B', 'Bin'], ['D', 'Bout'])
+        check_outputs(self, pla, columns)
+        # Отдельно D и Bout требуют 4 + 3 конъюнкции, совместно - 5
+        self.assertEqual((len(pla.products), pla.exact), (5, True))
+        self.assertEqual(len(output_products(pla, 0)), 4)
+        self.assertEqual(sum(mask.bit_count() > 1 for mask in pla.connections), 2)
+
+    def test_primes_carry_output_masks(self):
+        primes = multi_output_primes([[0, 1, 1, 1], [0, 0, 1, 1]])
+        primes = {(to_binary(implicant, 2), tag) for implicant, tag in primes}
+        # '1-' прост для обоих выходов, '-1' - только для первого
+        self.assertEqual(primes, {('1-', 0b11), ('-1', 0b01)})
+
+    def test_random_systems(self):
+        rng = random.Random(25)
+        for _ in range(60):
+            n = rng.randint(1, 5)
+            columns = [[rng.choice([0, 1, 1, DONT_CARE]) for _ in range(2 ** n)] for _ in range(rng.randint(1, 4))]
+            pla = minimize_outputs(columns)
+            check_outputs(self, pla, columns)
+            separate = 0
+            for column in columns:
+                ones = [i for i, value in enumerate(column) if value == 1]
+                dont_cares = [i for i, value in enumerate(column) if value == DONT_CARE]
+                separate += len(minimum_cover(prime_implicants(ones, n, dont_cares), ones, n).rows)
+            self.assertLessEqual(len(pla.products), separate)
+
+    def test_format_pla(self):
+        pla = minimize_outputs([[0, 1, 1, 1], [0, 0, 1, 1]], ['a', 'b'], ['f', 'g'])
+        self.assertEqual(format_pla(pla), "\n".join([
+            ".i 2", ".o 2", ".ilb a b", ".ob f g", ".p 2", "-1 10", "1- 11", ".e"]))
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            minimize_outputs([[0, 1, 1]])
+        with self.assertRaises(ValueError):
+            minimize_outputs([[0, 1], [0, 1, 1, 0]])
+        with self.assertRaises(ValueError):
+            minimize_outputs([[0, 1]], inputs=['a', 'b'])
+
+    def test_eight_outputs_twelve_inputs(self):
+        rng = random.Random(12)
+        columns = [[int(rng.random() < 0.1) for _ in range(2 ** 12)] for _ in range(8)]
+        pla = minimize_outputs(columns, time_budget=0.5)
+        check_outputs(self, pla, columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
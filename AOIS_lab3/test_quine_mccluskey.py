@@ -0,0 +1,81 @@
+import contextlib
+import io
+import random
+import unittest
+
+from minimizator import calc_skleivanie, minimize_calc, term_to_bin
+from quine_mccluskey import covers, expand, from_binary, merge_stage, prime_implicants, to_binary
+
+
+def legacy_primes(indices, n):
+    current = {term_to_bin(i, n) for i in indices}
+    primes = set()
+    while True:
+        merged, remaining = calc_skleivanie(list(current))
+        primes |= remaining
+        if not merged:
+            return sorted(primes)
+        current = merged | remaining
+
+
+class TestQuineMcCluskey(unittest.TestCase):
+    def test_binary_conversion(self):
+        self.assertEqual(from_binary('1-0'), (0b100, 0b101))
+        self.assertEqual(to_binary((0b100, 0b101), 3), '1-0')
+        self.assertEqual(to_binary(from_binary('-01-'), 4), '-01-')
+        self.assertEqual(to_binary((0, 0), 0), '')
+
+    def test_covers(self):
+        implicant = from_binary('1-0')
+        self.assertEqual([i for i in range(8) if covers(implicant, i)], [0b100, 0b110])
+
+    def test_expand(self):
+        self.assertEqual(sorted(expand(from_binary('1-0-'), 4)), [0b1000, 0b1001, 0b1100, 0b1101])
+        self.assertEqual(list(expand((0, 0), 0)), [0])
+
+    def test_merge_stage(self):
+        merged, remaining = merge_stage({(0b00, 0b11), (0b01, 0b11), (0b11, 0b11), (0b10, 0b01)})
+        self.assertEqual({to_binary(term, 2) for term in merged}, {'0-', '-1'})
+        # Разная care не склеивается, даже если значения отличаются одним разрядом
+        self.assertEqual(remaining, {(0b10, 0b01)})
+
+    def test_matches_pairwise_merging(self):
+        rng = random.Random(3)
+        for n in range(1, 7):
+            for _ in range(20):
+                indices = [i for i in range(2 ** n) if rng.random() < 0.5]
+                primes = [to_binary(term, n) for term in prime_implicants(indices, n)]
+                self.assertEqual(primes, legacy_primes(indices, n), msg=indices)
+
+    def test_minimize_calc(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            letters, binary = minimize_calc(['000', '001', '011', '111'], ['a', 'b', 'c'])
+        self.assertEqual(binary, ['-11', '0-1', '00-'])
+        self.assertEqual(letters, ['b ∧ c', '¬a ∧ c', '¬a ∧ ¬b'])
+        self.assertIn("Стадия 2:", out.getvalue())
+
+    def test_minimize_calc_dont_cares(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            letters, binary = minimize_calc(['001', '011'], ['a', 'b', 'c'], dont_cares=['111', '100'])
+        # '100' покрывает только безразличный набор и отбрасывается
+        self.assertEqual(binary, ['-11', '0-1'])
+        self.assertEqual(letters, ['b ∧ c', '¬a ∧ c'])
+        self.assertEqual([to_binary(term, 3) for term in prime_implicants([1, 3], 3, dont_cares=[7, 4])],
+                         ['-11', '0-1'])
+        self.assertEqual([to_binary(term, 3) for term in prime_implicants([1, 3], 3, dont_cares=[5, 7])], ['--1'])
+
+    def test_sixteen_variables(self):
+        rng = random.Random(16)
+        indices = [i for i in range(2 ** 16) if rng.random() < 0.5]
+        primes = prime_implicants(indices, 16)
+        ones = set(indices)
+        for implicant in primes[::4999]:
+            value, care = implicant
+            # Все строки импликанты истинны, а расширение по любому разряду - нет
+            self.assertTrue(ones.issuperset(expand(implicant, 16)))
+            for bit in (1 << bit for bit in range(16) if care >> bit & 1):
+                self.assertFalse(ones.issuperset(expand((value & ~bit, care & ~bit), 16)))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
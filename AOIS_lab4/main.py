@@ -1,6 +1,9 @@
 import itertools
 from typing import List, Tuple, Dict
 
+from pla import Pla, format_pla, minimize_outputs, output_products
+from quine_mccluskey import to_binary
+
 
 class BinarySubtractor:
     """
@@ -157,6 +160,17 @@ class BinarySubtractor:
 
         return ' | '.join(minimized_terms) if minimized_terms else "0"
 
+    def minimize_shared(self) -> Pla:
+        """Совместная минимизация D и Bout: общие конъюнкции плоскости И"""
+        columns = [[row[3] for row in self.truth_table], [row[4] for row in self.truth_table]]
+        return minimize_outputs(columns, self.variables, ['D', 'Bout'])
+
+    def shared_function(self, pla: Pla, output: int) -> str:
+        """Выход ПЛМ как дизъюнкция подключённых к нему конъюнкций"""
+        products = output_products(pla, output)
+        terms = [f"({self.implicant_to_expression(to_binary(p, len(self.variables)))})" for p in products]
+        return ' | '.join(terms) if terms else "0"
+
     def synthesize_and_minimize(self):
         """Основная функция синтеза и минимизации"""
         print("=" * 60)
@@ -198,6 +212,16 @@ class BinarySubtractor:
         print(f"\nМинимизированная функция заема:")
         print(f"Bout = {bout_minimized}")
 
+        print(f"\n{'=' * 40}")
+        print("СОВМЕСТНАЯ МИНИМИЗАЦИЯ (ПЛМ)")
+        print("=" * 40)
+
+        pla = self.minimize_shared()
+        print(f"\nОбщих конъюнкций: {len(pla.products)}")
+        print(format_pla(pla))
+        for output, name in enumerate(pla.outputs):
+            print(f"{name} = {self.shared_function(pla, output)}")
+
         print(f"\n{'=' * 40}")
         print("АНАЛИЗ РЕЗУЛЬТАТОВ")
         print("=" * 40)
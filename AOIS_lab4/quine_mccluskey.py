@@ -0,0 +1,112 @@
+"""Склеивание импликант методом Квайна - Мак-Класки над битовыми масками.
+
+Импликанта - пара целых (value, care): разряд care равен 1, если переменная
+входит в терм, и тогда соответствующий разряд value - её значение;
+исключённые склеиванием разряды value нулевые. Первая переменная - старший
+разряд, как в номерах строк таблицы истинности, поэтому терм '1-0'
+записывается как (0b100, 0b101).
+
+Склеиваются только импликанты с одинаковой care, у которых значения
+отличаются ровно одним разрядом (x ^ y - степень двойки). Импликанты
+раскладываются по группам (care, число единиц), и пара для value ищется
+только в соседней группе с единицами на одну больше: для каждого нулевого
+разряда bit проверяется value | bit, поиск в множестве - хэш. Стадия
+стоит O(k * n) вместо O(k ** 2) попарных сравнений строк.
+
+Безразличные строки склеиваются наравне с истинными, но импликанта,
+покрывающая только безразличные строки, для покрытия не нужна.
+"""
+
+
+def from_binary(term):
+    """Импликанта из строки вида '1-0'"""
+    value = care = 0
+    for char in term:
+        value <<= 1
+        care <<= 1
+        if char != '-':
+            care |= 1
+            value |= char == '1'
+    return value, care
+
+
+def to_binary(implicant, n):
+    """Строка вида '1-0' из импликанты от n переменных"""
+    value, care = implicant
+    return ''.join('-' if not care >> shift & 1 else '01'[value >> shift & 1]
+                   for shift in range(n - 1, -1, -1))
+
+
+def covers(implicant, index):
+    """Покрывает ли импликанта строку с номером index"""
+    value, care = implicant
+    return index & care == value
+
+
+def expand(implicant, n):
+    """Номера всех строк, покрытых импликантой от n переменных"""
+    value, care = implicant
+    free = ~care & ((1 << n) - 1)
+    # Перебор подмножеств свободных разрядов
+    subset = free
+    while True:
+        yield value | subset
+        if not subset:
+            return
+        subset = (subset - 1) & free
+
+
+def merge_stage(implicants):
+    """Одна стадия склеивания: (новые импликанты, не склеившиеся импликанты)"""
+    groups = {}
+    for value, care in implicants:
+        groups.setdefault((care, value.bit_count()), set()).add(value)
+    merged = set()
+    used = set()
+    for (care, ones), values in groups.items():
+        upper = groups.get((care, ones + 1))
+        if not upper:
+            continue
+        for value in values:
+            zeros = care & ~value
+            while zeros:
+                bit = zeros & -zeros
+                zeros ^= bit
+                if value | bit in upper:
+                    merged.add((value, care & ~bit))
+                    used.add((value, care))
+                    used.add((value | bit, care))
+    return merged, set(implicants) - used
+
+
+def merge_stages(implicants):
+    """Стадии склеивания до конца: список пар (группа, не склеившиеся)"""
+    stages = []
+    current = set(implicants)
+    while True:
+        merged, remaining = merge_stage(current)
+        stages.append((current, remaining))
+        if not merged:
+            return stages
+        current = merged
+
+
+def touching(implicants, indices, n):
+    """Импликанты, покрывающие хотя бы одну из строк indices"""
+    indices = set(indices)
+    return [implicant for implicant in implicants if any(index in indices for index in expand(implicant, n))]
+
+
+def prime_implicants(indices, n, dont_cares=()):
+    """Простые импликанты функции n переменных, истинной в строках indices
+
+    Строки dont_cares безразличны: они расширяют импликанты, но сами
+    покрываться не обязаны.
+    """
+    full = (1 << n) - 1
+    primes = set()
+    for _, remaining in merge_stages((index, full) for index in [*indices, *dont_cares]):
+        primes |= remaining
+    if dont_cares:
+        primes = touching(primes, indices, n)
+    return sorted(primes, key=lambda implicant: to_binary(implicant, n))
\ No newline at end of file
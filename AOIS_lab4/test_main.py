@@ -0,0 +1,29 @@
+import contextlib
+import io
+import unittest
+
+from main import BinarySubtractor
+from pla import output_products
+from quine_mccluskey import covers
+
+
+class TestBinarySubtractor(unittest.TestCase):
+    def test_shared_minimization(self):
+        subtractor = BinarySubtractor()
+        pla = subtractor.minimize_shared()
+        # D и Bout по отдельности требуют 4 + 3 конъюнкции, совместно - 5
+        self.assertEqual((len(pla.products), pla.exact), (5, True))
+        for i, row in enumerate(subtractor.truth_table):
+            for output, value in enumerate(row[3:]):
+                self.assertEqual(int(any(covers(p, i) for p in output_products(pla, output))), value)
+        self.assertEqual(subtractor.shared_function(pla, 1), "(!A & !B & Bin) | (!A & B) | (A & B & Bin)")
+
+    def test_report(self):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            BinarySubtractor().synthesize_and_minimize()
+        self.assertIn("Общих конъюнкций: 5", output.getvalue())
+        self.assertIn(".p 5", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""Минимальное покрытие импликантной таблицы.
+
+Строка таблицы - простая импликанта, столбец - номер строки таблицы
+истинности, которую нужно покрыть. Строка хранится битовым множеством
+своих столбцов, поэтому пересечение и проверка вложения - одна операция
+над целыми. Покрытия сравниваются сначала по числу импликант, затем по
+числу литер.
+
+Перед перебором таблица сокращается до неподвижной точки:
+- столбец, покрытый единственной строкой, делает её обязательной;
+- строка, все столбцы которой есть у не более дорогой строки, удаляется;
+- столбец, строки которого включают все строки другого столбца, будет
+  покрыт вместе с ним и удаляется.
+Остаток решается методом ветвей и границ: ветвление по столбцу с
+наименьшим числом строк, нижняя граница - сумма наименьших стоимостей
+по столбцам, не имеющим общих строк. Жадное покрытие служит начальным
+решением и ответом, если бюджет времени исчерпан.
+"""
+import heapq
+import time
+from typing import NamedTuple
+
+from quine_mccluskey import expand
+
+DEFAULT_TIME_BUDGET = 2.0
+# Точный перебор не запускается, если жадное покрытие остатка длиннее
+SEARCH_LIMIT = 200
+
+
+class Chart(NamedTuple):
+    rows: list     # столбцы каждой импликанты битовым множеством
+    columns: list  # номера импликант, покрывающих каждый столбец
+
+
+class Cover(NamedTuple):
+    rows: list     # номера выбранных импликант по возрастанию
+    literals: int  # число литер в покрытии
+    exact: bool    # минимальность доказана до исчерпания бюджета времени
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def build_chart(implicants, indices, n):
+    """Импликантная таблица: столбец i - строка indices[i] таблицы истинности"""
+    position = {index: column for column, index in enumerate(indices)}
+    rows = []
+    columns = [[] for _ in position]
+    for row, implicant in enumerate(implicants):
+        mask = 0
+        for index in expand(implicant, n):
+            column = position.get(index)
+            if column is not None:
+                mask |= 1 << column
+                columns[column].append(row)
+        rows.append(mask)
+    return Chart(rows, columns)
+
+
+class _Timeout(Exception):
+    pass
+
+
+class _Solver:
+    def __init__(self, chart, weights, deadline):
+        self.rows = chart.rows
+        self.columns = chart.columns
+        self.weights = weights
+        self.deadline = deadline
+        self.best = None
+        self.best_cost = None
+
+    def expired(self):
+        return time.perf_counter() > self.deadline
+
+    def alive_rows(self, column, alive):
+        return [row for row in self.columns[column] if row in alive]
+
+    def reduce(self, alive, uncovered, chosen):
+        """Обязательные строки и доминирование; None, если столбец нечем покрыть"""
+        while uncovered and not self.expired():
+            essential = set()
+            for column in _bits(uncovered):
+                rows = self.alive_rows(column, alive)
+                if not rows:
+                    return None
+                if len(rows) == 1:
+                    essential.add(rows[0])
+            if essential:
+                for row in sorted(essential):
+                    chosen.append(row)
+                    alive.discard(row)
+                    uncovered &= ~self.rows[row]
+                continue
+            changed = False
+            for row in sorted(alive, key=self.weights.__getitem__, reverse=True):
+                mask = self.rows[row] & uncovered
+                first = (mask & -mask).bit_length() - 1
+                if not mask or any(other != row and other in alive
+                                   and self.weights[other] <= self.weights[row]
+                                   and not mask & ~self.rows[other]
+                                   for other in self.columns[first]):
+                    alive.discard(row)
+                    changed = True
+            removed = 0
+            for column in _bits(uncovered):
+                if removed >> column & 1:
+                    continue
+                common = uncovered & ~removed & ~(1 << column)
+                for row in self.alive_rows(column, alive):
+                    common &= self.rows[row]
+                removed |= common
+            if removed:
+                uncovered &= ~removed
+                changed = True
+            if not changed:
+                break
+        return uncovered
+
+    def greedy(self, alive, uncovered):
+        """Жадно: строка с наибольшим числом непокрытых столбцов, при равенстве - дешевле"""
+        heap = [(-(self.rows[row] & uncovered).bit_count(), self.weights[row], row) for row in alive]
+        heapq.heapify(heap)
+        chosen = []
+        while uncovered:
+            entry = heapq.heappop(heap)
+            row = entry[2]
+            # Выигрыш строки только уменьшается, поэтому устаревшая оценка пересчитывается при извлечении
+            current = (-(self.rows[row] & uncovered).bit_count(), self.weights[row], row)
+            if current != entry:
+                heapq.heappush(heap, current)
+                continue
+            chosen.append(row)
+            uncovered &= ~self.rows[row]
+        return chosen
+
+    def lower_bound(self, alive, uncovered):
+        bound = 0
+        blocked = 0
+        for column in _bits(uncovered):
+            if blocked >> column & 1:
+                continue
+            rows = self.alive_rows(column, alive)
+            bound += min(self.weights[row] for row in rows)
+            for row in rows:
+                blocked |= self.rows[row]
+        return bound
+
+    def search(self, alive, uncovered, chosen):
+        if self.expired():
+            raise _Timeout
+        alive = set(alive)
+        chosen = list(chosen)
+        uncovered = self.reduce(alive, uncovered, chosen)
+        if uncovered is None:
+            return
+        cost = sum(self.weights[row] for row in chosen)
+        if not uncovered:
+            if cost < self.best_cost:
+                self.best, self.best_cost = chosen, cost
+            return
+        if cost + self.lower_bound(alive, uncovered) >= self.best_cost:
+            return
+        column = min(_bits(uncovered), key=lambda column: len(self.alive_rows(column, alive)))
+        branches = sorted(self.alive_rows(column, alive),
+                          key=lambda row: (-(self.rows[row] & uncovered).bit_count(), self.weights[row]))
+        for row in branches:
+            self.search(alive - {row}, uncovered & ~self.rows[row], chosen + [row])
+            # В следующих ветвях строка уже не выбирается
+            alive.discard(row)
+
+    def without_redundant(self, chosen):
+        # Строка лишняя, если каждый её столбец покрыт ещё какой-то выбранной строкой
+        counts = {}
+        for row in chosen:
+            for column in _bits(self.rows[row]):
+                counts[column] = counts.get(column, 0) + 1
+        kept = []
+        for row in sorted(chosen, key=self.weights.__getitem__, reverse=True):
+            columns = list(_bits(self.rows[row]))
+            if all(counts[column] > 1 for column in columns):
+                for column in columns:
+                    counts[column] -= 1
+            else:
+                kept.append(row)
+        return kept
+
+    def solve(self, alive, uncovered):
+        chosen = []
+        uncovered = self.reduce(alive, uncovered, chosen)
+        if uncovered is None:
+            raise ValueError("Implicants do not cover all rows")
+        rest = self.greedy(alive, uncovered)
+        self.best = self.without_redundant(chosen + rest)
+        self.best_cost = sum(self.weights[row] for row in self.best)
+        if self.expired():
+            return False
+        if not uncovered:
+            return True
+        if len(rest) > SEARCH_LIMIT:
+            return False
+        try:
+            self.search(alive, uncovered, chosen)
+        except _Timeout:
+            return False
+        return True
+
+
+def solve_chart(chart, weights, time_budget=DEFAULT_TIME_BUDGET):
+    """Строки таблицы chart наименьшего суммарного веса, покрывающие все столбцы
+
+    Возвращает номера строк по возрастанию и признак доказанной минимальности.
+    """
+    solver = _Solver(chart, weights, time.perf_counter() + time_budget)
+    exact = solver.solve(set(range(len(chart.rows))), (1 << len(chart.columns)) - 1)
+    return sorted(solver.best), exact
+
+
+def minimum_cover(implicants, indices, n, time_budget=DEFAULT_TIME_BUDGET):
+    """Наименьший набор импликант (value, care), покрывающий строки indices
+
+    Покрытие минимально, если exact; иначе это лучшее найденное за
+    time_budget секунд (не хуже жадного).
+    """
+    indices = list(indices)
+    chart = build_chart(implicants, indices, n)
+    literals = [care.bit_count() for _, care in implicants]
+    # Импликанта дороже любого числа литер, поэтому сначала сравнивается число импликант
+    step = n * len(implicants) + 1
+    rows, exact = solve_chart(chart, [step + count for count in literals], time_budget)
+    return Cover(rows, sum(literals[row] for row in rows), exact)
\ No newline at end of file
@@ -1,6 +1,9 @@
 from typing import List, Tuple, Dict, Set
 import itertools
 
+from pla import Pla, format_pla, minimize_outputs, output_products
+from quine_mccluskey import to_binary
+
 
 class BinaryCounterAutomaton:
     """
@@ -206,6 +209,27 @@ class BinaryCounterAutomaton:
 
         return " | ".join(minimized_terms) if minimized_terms else "0"
 
+    def minimize_shared(self, t_table: List[Tuple[int, int, int, int, int, int]]) -> Pla:
+        """Совместная минимизация T2, T1, T0: общие конъюнкции плоскости И"""
+        columns: List[List[int]] = [[row[output_index + 3] for row in t_table] for output_index in range(3)]
+        return minimize_outputs(columns, self.state_variables, self.trigger_inputs)
+
+    def product_to_expression(self, binary: str) -> str:
+        """Преобразование конъюнкции вида '1-0' в выражение"""
+        literals: List[str] = []
+        for variable_name, bit in zip(self.state_variables, binary):
+            if bit == '1':
+                literals.append(variable_name)
+            elif bit == '0':
+                literals.append(f"!{variable_name}")
+        return f"({' & '.join(literals)})" if literals else "1"
+
+    def shared_function(self, pla: Pla, output: int) -> str:
+        """Выход ПЛМ как дизъюнкция подключённых к нему конъюнкций"""
+        terms: List[str] = [self.product_to_expression(to_binary(product, self.num_bits))
+                            for product in output_products(pla, output)]
+        return " | ".join(terms) if terms else "0"
+
     def convert_to_nand_nor_basis(self, expression: str) -> str:
         """
         Преобразование выражения в базис НЕ И-ИЛИ (NAND-NOR)
@@ -272,6 +296,16 @@ class BinaryCounterAutomaton:
             nand_nor_expr = self.convert_to_nand_nor_basis(minimized_expr)
             print(f"В базисе НЕ И-ИЛИ: {trigger_name} = {nand_nor_expr}")
 
+        print("\n" + "=" * 60)
+        print("СОВМЕСТНАЯ МИНИМИЗАЦИЯ (ПЛМ)")
+        print("=" * 60)
+
+        pla = self.minimize_shared(t_inputs_table)
+        print(f"\nОбщих конъюнкций: {len(pla.products)}")
+        print(format_pla(pla))
+        for output, trigger_name in enumerate(pla.outputs):
+            print(f"{trigger_name} = {self.shared_function(pla, output)}")
+
         print("\n" + "=" * 60)
         print("АНАЛИЗ РЕЗУЛЬТАТОВ")
         print("=" * 60)
@@ -0,0 +1,168 @@
+"""Совместная минимизация системы функций для ПЛМ.
+
+Система из m функций n переменных задаётся столбцами выходов: столбец j -
+значения j-й функции во всех 2 ** n строках (0, 1 или '-' для безразличной
+строки). Каждая импликанта (value, care) несёт маску выходов tag - функции,
+у которых все её строки истинны или безразличны. Склеиваются импликанты с
+пересекающимися масками, маска результата - пересечение; импликанта
+отмечается склеенной, только если результат сохранил всю её маску.
+Оставшиеся импликанты - простые импликанты системы: среди них есть и общие
+для нескольких выходов, и простые импликанты каждой функции отдельно.
+
+Покрытие ищется одной таблицей: столбец - пара (выход, истинная строка),
+строка - импликанта, покрывающая свои строки на всех выходах маски. Вес
+импликанты - одна конъюнкция плоскости И и её литеры, поэтому общая
+конъюнкция дешевле нескольких своих копий. После выбора из плоскости ИЛИ
+убираются соединения, без которых выход всё равно покрыт.
+"""
+from typing import NamedTuple
+
+from cover import Chart, DEFAULT_TIME_BUDGET, solve_chart
+from quine_mccluskey import expand, to_binary
+
+# Безразличное значение выхода, как в таблице истинности и формате PLA
+DONT_CARE = '-'
+
+
+class Pla(NamedTuple):
+    inputs: list       # имена входов, первый - старший разряд номера строки
+    outputs: list      # имена выходов
+    products: list     # конъюнкции плоскости И в виде (value, care)
+    connections: list  # выходы каждой конъюнкции битовой маской - плоскость ИЛИ
+    exact: bool        # число конъюнкций минимально
+
+
+def _variables(columns):
+    size = len(columns[0]) if columns else 1
+    n = size.bit_length() - 1
+    if size != 1 << n or any(len(column) != size for column in columns):
+        raise ValueError("Output columns must have the same length, a power of two")
+    return n
+
+
+def _row_tags(columns, size):
+    # Маски выходов по строкам: истинных и допустимых (истинных или безразличных)
+    on = [0] * size
+    allowed = [0] * size
+    for j, column in enumerate(columns):
+        for i, value in enumerate(column):
+            if value == DONT_CARE:
+                allowed[i] |= 1 << j
+            elif value:
+                on[i] |= 1 << j
+                allowed[i] |= 1 << j
+    return on, allowed
+
+
+def merge_tagged(implicants):
+    """Стадия склеивания {(value, care): tag}; возвращает склеенные и оставшиеся"""
+    merged = {}
+    used = set()
+    for (value, care), tag in implicants.items():
+        free = ~value & care
+        while free:
+            bit = free & -free
+            free ^= bit
+            other = implicants.get((value | bit, care))
+            if other is None or not tag & other:
+                continue
+            common = tag & other
+            merged[(value, care & ~bit)] = common
+            if common == tag:
+                used.add((value, care))
+            if common == other:
+                used.add((value | bit, care))
+    remaining = {key: tag for key, tag in implicants.items() if key not in used}
+    return merged, remaining
+
+
+def multi_output_primes(columns):
+    """Простые импликанты системы: пары ((value, care), tag), покрывающие хотя бы одну истинную строку"""
+    n = _variables(columns)
+    full = (1 << n) - 1
+    on, allowed = _row_tags(columns, 1 << n)
+    current = {(i, full): tag for i, tag in enumerate(allowed) if tag}
+    primes = []
+    while current:
+        current, remaining = merge_tagged(current)
+        for implicant, tag in remaining.items():
+            if any(on[i] & tag for i in expand(implicant, n)):
+                primes.append((implicant, tag))
+    return sorted(primes, key=lambda prime: (to_binary(prime[0], n), prime[1]))
+
+
+def _drop_connections(products, connections, on, n):
+    # Соединение лишнее, если каждую строку выхода покрывает ещё одна выбранная конъюнкция
+    counts = {}
+    rows = [list(expand(product, n)) for product in products]
+    for k, mask in enumerate(connections):
+        for i in rows[k]:
+            for j in _outputs(mask & on[i]):
+                counts[j, i] = counts.get((j, i), 0) + 1
+    connections = list(connections)
+    for k in sorted(range(len(products)), key=lambda k: -products[k][1].bit_count()):
+        for j in _outputs(connections[k]):
+            cells = [(j, i) for i in rows[k] if on[i] >> j & 1]
+            if all(counts[cell] > 1 for cell in cells):
+                for cell in cells:
+                    counts[cell] -= 1
+                connections[k] &= ~(1 << j)
+    return connections
+
+
+def _outputs(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def minimize_outputs(columns, inputs=None, outputs=None, time_budget=DEFAULT_TIME_BUDGET):
+    """Плоскости И и ИЛИ с наименьшим числом конъюнкций для столбцов выходов columns"""
+    columns = [list(column) for column in columns]
+    n = _variables(columns)
+    inputs = list(inputs) if inputs is not None else [f'x{i}' for i in range(n)]
+    outputs = list(outputs) if outputs is not None else [f'y{j}' for j in range(len(columns))]
+    if len(inputs) != n or len(outputs) != len(columns):
+        raise ValueError("Names must match the number of inputs and outputs")
+    on, _ = _row_tags(columns, 1 << n)
+    primes = multi_output_primes(columns)
+    position = {}
+    for i, tag in enumerate(on):
+        for j in _outputs(tag):
+            position[j, i] = len(position)
+    rows = []
+    chart_columns = [[] for _ in position]
+    for row, (implicant, tag) in enumerate(primes):
+        mask = 0
+        for i in expand(implicant, n):
+            for j in _outputs(tag & on[i]):
+                column = position[j, i]
+                mask |= 1 << column
+                chart_columns[column].append(row)
+        rows.append(mask)
+    # Конъюнкция дороже любого числа литер, поэтому сначала сравнивается их число
+    step = n * len(primes) + 1
+    weights = [step + implicant[1].bit_count() for implicant, _ in primes]
+    chosen, exact = solve_chart(Chart(rows, chart_columns), weights, time_budget)
+    products = [primes[row][0] for row in chosen]
+    connections = [primes[row][1] for row in chosen]
+    connections = _drop_connections(products, connections, on, n)
+    return Pla(inputs, outputs, products, connections, exact)
+
+
+def output_products(pla, output):
+    """Конъюнкции, подключённые к выходу с номером output"""
+    return [product for product, mask in zip(pla.products, pla.connections) if mask >> output & 1]
+
+
+def format_pla(pla):
+    """Текст в формате PLA (Berkeley): строка - конъюнкция и её выходы"""
+    n = len(pla.inputs)
+    lines = [f".i {n}", f".o {len(pla.outputs)}",
+             ".ilb " + " ".join(pla.inputs), ".ob " + " ".join(pla.outputs), f".p {len(pla.products)}"]
+    for product, mask in zip(pla.products, pla.connections):
+        plane = "".join('1' if mask >> j & 1 else '0' for j in range(len(pla.outputs)))
+        lines.append(f"{to_binary(product, n)} {plane}")
+    lines.append(".e")
+    return "\n".join(lines)
\ No newline at end of file
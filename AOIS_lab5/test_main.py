@@ -0,0 +1,37 @@
+import contextlib
+import io
+import unittest
+
+from main import BinaryCounterAutomaton
+from pla import output_products
+from quine_mccluskey import covers
+
+
+def counter():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BinaryCounterAutomaton()
+
+
+class TestBinaryCounter(unittest.TestCase):
+    def test_shared_minimization(self):
+        automaton = counter()
+        t_table = automaton.calculate_t_inputs()
+        pla = automaton.minimize_shared(t_table)
+        self.assertEqual((len(pla.products), pla.exact), (3, True))
+        for i, row in enumerate(t_table):
+            for output, value in enumerate(row[3:]):
+                self.assertEqual(int(any(covers(p, i) for p in output_products(pla, output))), value)
+        # T0 переключается каждый такт, T1 - при Q0, T2 - при Q1 и Q0
+        self.assertEqual([automaton.shared_function(pla, output) for output in range(3)],
+                         ["(Q1 & Q0)", "(Q0)", "1"])
+
+    def test_report(self):
+        automaton = counter()
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            automaton.synthesize_and_minimize()
+        self.assertIn("Общих конъюнкций: 3", output.getvalue())
+        self.assertIn(".p 3", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file